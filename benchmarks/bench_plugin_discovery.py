@@ -0,0 +1,74 @@
+"""
+Module benchmarks/bench_plugin_discovery.py
+
+Compares cold plugin discovery (every manifest parsed with PyYAML) with warm
+discovery served from the persistent PluginIndex, on a synthetic plugins
+directory.
+
+Run from the project root:
+    python -m benchmarks.bench_plugin_discovery [plugin_count]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from core.plugin_index import PluginIndex
+
+MANIFEST = """name: Plugin-{i}
+module: plugins.plugin_{i}.plugin
+enabled: true
+depends:
+- Plugin-{dep}
+provides: []
+description: >
+  Synthetic plugin used to measure discovery cost. The text is long enough
+  to resemble a documented manifest with a few nested settings.
+settings:
+  speed: 1.5
+  colors: [red, green, blue]
+"""
+
+
+def _make_plugins(base: Path, count: int) -> None:
+    """Write `count` plugin subdirectories with manifests."""
+    for i in range(count):
+        sub = base / f"plugin_{i}"
+        sub.mkdir()
+        (sub / "plugin.yaml").write_text(
+            MANIFEST.format(i=i, dep=max(i - 1, 0)), encoding="utf-8"
+        )
+
+
+def _time_scan(base: Path, index_path: Path) -> float:
+    """Return seconds for one full discovery with a fresh PluginIndex."""
+    start = time.perf_counter()
+    PluginIndex(base, index_path).scan()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / "plugins"
+        base.mkdir()
+        _make_plugins(base, count)
+        index_path = Path(tmp) / ".plugin_index.json"
+
+        cold = _time_scan(base, index_path)
+        warm = min(_time_scan(base, index_path) for _ in range(5))
+        # Touch one manifest to measure an incremental rebuild
+        edited = base / "plugin_0" / "plugin.yaml"
+        edited.write_text(edited.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        one_changed = _time_scan(base, index_path)
+
+        print(f"{count} plugins")
+        print(f"{'case':<22}{'ms':>10}")
+        print(f"{'cold (no index)':<22}{cold * 1e3:>10.2f}")
+        print(f"{'warm (index hit)':<22}{warm * 1e3:>10.2f}")
+        print(f"{'one manifest edited':<22}{one_changed * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
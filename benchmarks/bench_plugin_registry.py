@@ -0,0 +1,87 @@
+"""
+Module benchmarks/bench_plugin_registry.py
+
+Measures dependency resolution on synthetic plugin metadata: the previous
+approach (list queue with pop(0) plus a linear scan of the available list per
+loaded plugin) against PluginRegistry (dict indexes and Kahn's algorithm on a
+deque). The registry should scale near-linearly with the plugin count.
+
+Run from the project root:
+    python -m benchmarks.bench_plugin_registry
+"""
+
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from core.plugin_registry import PluginRegistry
+
+COUNTS = (10, 100, 1000, 5000)
+
+
+def _make_metas(count: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """Return metadata for an acyclic graph with up to three deps per plugin."""
+    rng = random.Random(seed)
+    metas = []
+    for i in range(count):
+        deps = {f"Plugin-{rng.randrange(i)}" for _ in range(min(i, 3))}
+        metas.append({
+            "name": f"Plugin-{i}", "module": f"plugins.plugin_{i}.plugin",
+            "enabled": True, "depends": sorted(deps),
+        })
+    # Discovery order is by directory name, not dependency order
+    rng.shuffle(metas)
+    return metas
+
+
+def _legacy(metas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Resolve and look up plugins the way PluginManager used to."""
+    deps = {m["name"]: set(m["depends"]) for m in metas}
+    dependents: Dict[str, set] = {name: set() for name in deps}
+    for name, reqs in deps.items():
+        for dep in reqs:
+            dependents[dep].add(name)
+    order = []
+    queue = [name for name, reqs in deps.items() if not reqs]
+    while queue:
+        name = queue.pop(0)
+        order.append(name)
+        for child in list(dependents[name]):
+            deps[child].discard(name)
+            if not deps[child]:
+                queue.append(child)
+    return [next(m for m in metas if m["name"] == name) for name in order]
+
+
+def _registry(metas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Resolve and look up plugins through a PluginRegistry."""
+    registry = PluginRegistry(metas)
+    order, _ = registry.resolve_order()
+    return [registry.get(name) for name in order]
+
+
+def _best(fn: Callable, metas: List[Dict[str, Any]], repeat: int) -> float:
+    """Return the best of `repeat` runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(metas)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"{'plugins':>8}{'legacy ms':>12}{'registry ms':>14}{'us/plugin':>12}")
+    for count in COUNTS:
+        metas = _make_metas(count)
+        repeat = 3 if count >= 1000 else 20
+        legacy = _best(_legacy, metas, repeat)
+        registry = _best(_registry, metas, repeat)
+        print(
+            f"{count:>8}{legacy * 1e3:>12.2f}{registry * 1e3:>14.2f}"
+            f"{registry * 1e6 / count:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
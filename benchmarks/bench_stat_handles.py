@@ -0,0 +1,53 @@
+"""
+Module benchmarks/bench_stat_handles.py
+
+Compares the validated StatManager API (get/set/modify through ensure_key)
+with pre-resolved StatHandle access for hot loops such as per-tick decay.
+
+Run from the project root:
+    python -m benchmarks.bench_stat_handles
+"""
+
+import json
+import tempfile
+import timeit
+from pathlib import Path
+
+from core.events.event_manager import EventManager
+from core.stat_manager import StatManager
+
+ITERATIONS = 200_000
+
+
+def _make_manager(tmp_dir: Path) -> StatManager:
+    """Create a StatManager with a wide range so modify() always changes the value."""
+    config = {
+        "energy": {"initial": 0, "min": -1e12, "max": 1e12, "event_type": "ENERGY_CHANGED"}
+    }
+    path = tmp_dir / "stats_config.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+    return StatManager(EventManager(), config_path=str(path))
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        sm = _make_manager(Path(tmp))
+        handle = sm.handle("energy")
+
+        cases = {
+            "StatManager.get": lambda: sm.get("energy"),
+            "StatHandle.value": lambda: handle.value,
+            "StatManager.modify": lambda: sm.modify("energy", 1),
+            "StatHandle.add": lambda: handle.add(1),
+            "StatManager.set": lambda: sm.set("energy", 5),
+            "StatHandle.set": lambda: handle.set(5),
+        }
+
+        print(f"{'case':<22}{'ns/call':>10}")
+        for name, fn in cases.items():
+            seconds = min(timeit.repeat(fn, number=ITERATIONS, repeat=3))
+            print(f"{name:<22}{seconds / ITERATIONS * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,11 +14,11 @@ import os
 
 from core.debug_console import DebugConsole
 from core.debug_console_handler import DebugConsoleHandler
-from core.events.event_types import EventType
 import setup.config as Config
 from core.plugin_manager import PluginManager
 from core.scene_manager import SceneManager
 from core.context import GameContext
+from ui.font_cache import get_font
 
 logger = logging.getLogger(__name__)
 
@@ -68,18 +68,10 @@ class GameApp:
         self.plugin_manager.load_plugins()
         #self.plugin_manager.on_init()
 
-        # Register UI button click events to plugin handler
-        self.context.event_manager.register(
-            EventType.UI_BUTTON_CLICKED,
-            self.plugin_manager.on_event
-        )
-
         # If no debug console provided, create one with configured font
         if debug_console is None:
             font_cfg = Config.fonts["debug"]
-            font = pygame.font.SysFont(
-                font_cfg["name"], font_cfg["size"]
-            )
+            font = get_font(font_cfg["name"], font_cfg["size"])
             self.debug_console = DebugConsole(
                 font,
                 max_lines=Config.ui["debug_console"]["max_lines"]
@@ -121,17 +113,30 @@ class GameApp:
                         "on" if self.debug else "off"
                     )
 
-                # Forward event to current scene and plugins
+                # Print plugin timings to the debug console on 'F3'
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.debug = True
+                    self.plugin_manager.log_profile()
+
+                # Toggle the pause overlay on 'ESC' (which first clears UI focus)
+                if (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
+                        and getattr(self.context.ui_manager, "focused_element", None) is None):
+                    self.scene_manager.toggle_overlay(Config.scenes.get("pause", "pause"))
+                    continue
+
+                # Forward event to current scene and subscribed plugins
                 self.scene_manager.handle_event(event)
                 self.plugin_manager.on_event(event)
 
-            # Update logic for current scene and plugins
-            self.scene_manager.update()
+            # Update logic for current scene, plugins and simulation stats
+            self.scene_manager.update(dt)
             self.plugin_manager.on_update(dt)
+            self.context.stat_manager.update(dt)
 
             # Render current scene and plugin overlays
             self.scene_manager.draw(self.screen)
             self.plugin_manager.on_render(self.screen)
+            self.plugin_manager.end_frame()
 
             # Draw debug console overlay if enabled
             if self.debug:
@@ -149,6 +154,7 @@ class GameApp:
 
         # Notify plugins to perform shutdown operations
         self.plugin_manager.on_shutdown()
+        self.scene_manager.shutdown()
         logger.debug("...Exiting game...")
         logger.debug("------------------------------------------------------------------------------")
 
@@ -6,13 +6,17 @@ Defines the GameContext class, which centralizes game-wide services and state:
 - StatManager for tracking and updating game statistics
 - SoundManager for loading and playing audio
 - Reference to PluginManager for plugin-driven extensions
+- ServiceRegistry for services provided by plugins
 """
 
 import logging
+from typing import Any
 
+import setup.config as Config
 from core.stat_manager import StatManager
 from core.events.event_manager import EventManager
 from core.plugin_manager import PluginManager
+from core.services import ServiceRegistry
 from core.sound_manager import SoundManager
 from ui.ui_manager import UIManager
 
@@ -40,6 +44,20 @@ class GameContext:
 
         # Statistic manager: loads stat config and dispatches change events
         self.stat_manager = StatManager(event_manager=self.event_manager)
+        history_cfg = Config.stats.get("history", {})
+        if history_cfg.get("enabled", False):
+            self.stat_manager.enable_history(
+                tick_capacity=history_cfg.get("tick_capacity", 3600),
+                phase_capacity=history_cfg.get("phase_capacity", 512),
+                day_capacity=history_cfg.get("day_capacity", 365),
+                tick_interval=history_cfg.get("tick_interval", 0.0)
+            )
+        reload_cfg = Config.stats.get("live_reload", {})
+        if reload_cfg.get("enabled", False):
+            self.stat_manager.enable_live_reload(
+                interval=reload_cfg.get("interval", 1.0),
+                debounce=reload_cfg.get("debounce", 0.25)
+            )
 
         # Sound system: handles loading and playing sound effects/music
         self.sound_manager = SoundManager()
@@ -49,4 +67,23 @@ class GameContext:
         # Keep a reference to the plugin manager for extension hooks
         self.plugin_manager = plugin_manager
 
+        # Services provided by plugins, looked up by name or type
+        self.services = ServiceRegistry()
+        self.services.register(EventManager, self.event_manager)
+        self.services.register(StatManager, self.stat_manager)
+        self.services.register(SoundManager, self.sound_manager)
+        self.services.register(UIManager, self.ui_manager)
+
         logger.debug("GameContext initialized.")
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Resolve unknown attributes as named services.
+
+        Kept for code that still reads plugin functions as context attributes
+        (e.g. `context.create_tilemap`); new code should use `services.get()`.
+        """
+        services = self.__dict__.get("services")
+        if services is not None and name in services:
+            return services.get(name)
+        raise AttributeError(f"'GameContext' has no attribute or service '{name}'")
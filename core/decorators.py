@@ -28,7 +28,7 @@ def ensure_key(func):
         # Verify the statistic key is registered
         if key not in self._stat_configs:
             logger.warning(
-                f"Stat '{key}' not found. Cannot {func.__name__}."
+                "Stat '%s' not found. Cannot %s.", key, func.__name__
             )
             # Return default based on method intent: getters return 0, others False
             return 0 if func.__name__ == "get" else False
@@ -3,10 +3,15 @@ Module core/events/event_manager.py
 
 Implements EventManager: a simple publish-subscribe system for game events.
 Allows components to register callbacks to event types, unregister them,
-and dispatch events (with or without collecting responses).
+and dispatch events (with or without collecting responses). Registrations
+can be attributed to an owner so they can be removed together, e.g. when a
+plugin is unloaded.
 """
 
 import logging
+from contextlib import contextmanager
+from typing import Any, Iterator
+
 from core.events.event_types import EventType
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,9 @@ class EventManager:
         Initialize the EventManager with no listeners.
         """
         self.listeners: dict[EventType, list] = {}
+        # Registrations per owner, and the stack of owners currently in scope
+        self._owned: dict[Any, list] = {}
+        self._owner_stack: list = []
         logger.debug("EventManager initialized with empty listeners.")
 
     def register(self, event_type: EventType, callback: callable) -> None:
@@ -39,6 +47,37 @@ class EventManager:
         """
         logger.debug("Registering callback %s for event: %s", callback, event_type)
         self.listeners.setdefault(event_type, []).append(callback)
+        if self._owner_stack:
+            self._owned.setdefault(self._owner_stack[-1], []).append((event_type, callback))
+
+    @contextmanager
+    def owned_by(self, owner: Any) -> Iterator[None]:
+        """
+        Attribute all registrations made inside the block to an owner.
+
+        Args:
+            owner (Any): Hashable owner key, e.g. a plugin name.
+        """
+        self._owner_stack.append(owner)
+        try:
+            yield
+        finally:
+            self._owner_stack.pop()
+
+    def unregister_owner(self, owner: Any) -> int:
+        """
+        Unregister every callback registered under an owner.
+
+        Args:
+            owner (Any): Owner key passed to owned_by().
+
+        Returns:
+            int: Number of callbacks removed.
+        """
+        entries = self._owned.pop(owner, [])
+        for event_type, callback in entries:
+            self.unregister(event_type, callback)
+        return len(entries)
 
     def unregister(self, event_type: EventType, callback: callable) -> None:
         """
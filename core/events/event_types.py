@@ -16,8 +16,14 @@ class EventType(Enum):
         UI_BUTTON_CLICKED: Triggered when any UI button is clicked.
         ENERGY_CHANGED: Dispatched when the ENERGY stat value is modified.
         HEALTH_CHANGED: Dispatched when the HEALTH stat value is modified.
+        DAYTIME_CHANGED: Dispatched when the day phase advances.
+        DAY_CHANGED: Dispatched when a new calendar day begins.
+        PLUGIN_STATE_CHANGED: Dispatched when an out-of-process plugin
+            reports a state diff.
     """
     UI_BUTTON_CLICKED = auto()
     ENERGY_CHANGED = auto()
     HEALTH_CHANGED = auto()
     DAYTIME_CHANGED = auto()
+    DAY_CHANGED = auto()
+    PLUGIN_STATE_CHANGED = auto()
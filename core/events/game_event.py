@@ -0,0 +1,36 @@
+"""
+Module core/events/game_event.py
+
+Defines GameEvent, the object plugins receive in on_event() for EventType
+events they subscribed to. It mirrors pygame events in that it has a `type`
+attribute, so one on_event() can handle both kinds.
+"""
+
+from typing import Any, Dict, Tuple
+
+from core.events.event_types import EventType
+
+
+class GameEvent:
+    """
+    An EventManager dispatch delivered to a plugin.
+
+    Attributes:
+        type (EventType): The dispatched event type.
+        args (Tuple[Any, ...]): Positional arguments of the dispatch.
+        data (Dict[str, Any]): Keyword arguments of the dispatch.
+    """
+    __slots__ = ("type", "args", "data")
+
+    def __init__(self, event_type: EventType, args: Tuple[Any, ...], data: Dict[str, Any]) -> None:
+        self.type = event_type
+        self.args = args
+        self.data = data
+
+    @property
+    def source(self) -> Any:
+        """The first positional argument, e.g. the clicked UIButton."""
+        return self.args[0] if self.args else None
+
+    def __repr__(self) -> str:
+        return f"<GameEvent {self.type.name} args={self.args!r} data={self.data!r}>"
@@ -0,0 +1,92 @@
+"""
+Module core/file_watcher.py
+
+Provides FileWatcher, a lightweight polling watcher that detects changes to a
+single file via its modification time and size. It is driven from the main
+loop (no background thread) and debounces bursts of writes, so editors that
+save in several steps trigger only one callback.
+"""
+
+import logging
+import os
+import time
+from typing import Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FileWatcher:
+    """
+    Polls a file's stat signature and invokes a callback once it settles.
+
+    Attributes:
+        path (str): Watched file path.
+        interval (float): Minimum seconds between stat() calls.
+        debounce (float): Seconds the file must stay unchanged after a
+            detected change before the callback fires.
+    """
+    def __init__(
+        self,
+        path: str,
+        callback: Callable[[str], None],
+        interval: float = 1.0,
+        debounce: float = 0.25,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Start watching a file; its current state is taken as the baseline.
+
+        Args:
+            path (str): File to watch.
+            callback (Callable[[str], None]): Called with the path after a change.
+            interval (float, optional): Seconds between polls. Defaults to 1.0.
+            debounce (float, optional): Settle time after a change. Defaults to 0.25.
+            clock (Callable[[], float], optional): Time source in seconds.
+        """
+        self.path = path
+        self.interval = interval
+        self.debounce = debounce
+        self._callback = callback
+        self._clock = clock
+        self._signature = self._stat()
+        self._next_poll = clock() + interval
+        # Time at which the latest unreported change was seen
+        self._pending_since: Optional[float] = None
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the file, or None if it is missing."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def poll(self) -> bool:
+        """
+        Check the file if the poll interval has elapsed; call once per frame.
+
+        Returns:
+            bool: True if the callback was invoked.
+        """
+        now = self._clock()
+        if now < self._next_poll:
+            return False
+        self._next_poll = now + self.interval
+
+        signature = self._stat()
+        if signature != self._signature:
+            # Still being written: restart the settle timer
+            self._signature = signature
+            self._pending_since = now
+            logger.debug("Change detected on %s", self.path)
+        if self._pending_since is None or now - self._pending_since < self.debounce:
+            return False
+        self._pending_since = None
+        if signature is None:
+            logger.warning("Watched file %s is missing.", self.path)
+            return False
+        try:
+            self._callback(self.path)
+        except Exception:
+            logger.exception("File watcher callback failed for %s", self.path)
+        return True
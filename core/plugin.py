@@ -1,22 +1,39 @@
 """
 Module core/plugin.py
 
-Defines the base Plugin abstract class for game extensions. Plugins can
+Defines the base Plugin class for game extensions. Plugins can
 hook into lifecycle events: initialization, start, per-frame updates,
 and shutdown, as well as react to game events and rendering.
 """
 
-from abc import ABC, abstractmethod
+from typing import Any, Tuple
 
 
-class Plugin(ABC):
+class Plugin:
     """
-    Abstract base class for all game plugins.
+    Base class for all game plugins.
 
     Provides empty hook methods for plugin lifecycle and event handling. Each
-    plugin can override these methods to inject custom behavior at specific
-    points in the game loop.
+    plugin overrides only the hooks it needs; the PluginManager dispatches a
+    hook only to plugins that override it, so inherited no-op hooks cost
+    nothing per frame.
+
+    Attributes:
+        events (Tuple): Event types on_event() subscribes to: pygame event
+            types, EventType members, or their names (e.g. "KEYDOWN",
+            "UI_BUTTON_CLICKED"). Combined with the manifest `events` list.
+            A plugin that declares none receives every pygame event.
+        retained (bool): Draw on_render into a cached layer that is redrawn
+            only after mark_dirty(), instead of onto the screen every frame.
+        render_z (int): Compositing order of on_render output; higher is
+            drawn later. The manifest `render_z` overrides it.
+        dirty (bool): Set by mark_dirty(); cleared once the layer is redrawn.
     """
+    events: Tuple[Any, ...] = ()
+    retained: bool = False
+    render_z: int = 0
+    dirty: bool = True
+
     def __init__(self, app: object):
         """
         Initialize the plugin with a reference to the main application.
@@ -27,14 +44,12 @@ class Plugin(ABC):
         """
         self.app = app
 
-    @abstractmethod
     def on_init(self) -> None:
         """
         Called once after the plugin is loaded to perform any setup logic.
         """
         pass
 
-    @abstractmethod
     def on_start(self) -> None:
         """
         Called when the game loop is about to start; use for initializing
@@ -42,18 +57,17 @@ class Plugin(ABC):
         """
         pass
 
-    @abstractmethod
     def on_event(self, event: object) -> None:
         """
-        Called for each Pygame event; allows plugins to respond to user input
-        or game events.
+        Called for each subscribed event (see `events`); allows plugins to
+        respond to user input or game events.
 
         Args:
-            event (pygame.event.Event): The event object to handle.
+            event (pygame.event.Event | GameEvent): A pygame event, or a
+                GameEvent for subscribed EventType dispatches.
         """
         pass
 
-    @abstractmethod
     def on_update(self, dt: float) -> None:
         """
         Called each frame before rendering; use to update plugin state.
@@ -63,7 +77,6 @@ class Plugin(ABC):
         """
         pass
 
-    @abstractmethod
     def on_render(self, surface: object) -> None:
         """
         Called each frame after scene rendering; use to draw plugin-specific
@@ -74,10 +87,35 @@ class Plugin(ABC):
         """
         pass
 
-    @abstractmethod
+    def mark_dirty(self) -> None:
+        """
+        Request a redraw of a retained plugin's layer on the next frame.
+        """
+        self.dirty = True
+
     def on_shutdown(self) -> None:
         """
         Called when the game is exiting; use to clean up resources and save
         state if necessary.
         """
         pass
+
+    def on_before_reload(self) -> object:
+        """
+        Called on the old instance before a hot reload, ahead of on_shutdown.
+
+        Returns:
+            object: Any state to hand over to the reloaded instance.
+        """
+        return None
+
+    def on_after_reload(self, state: object) -> None:
+        """
+        Called on the new instance after a hot reload, once on_init (and
+        on_start, if the game is running) have run.
+
+        Args:
+            state (object): Value returned by the old instance's
+                            on_before_reload().
+        """
+        pass
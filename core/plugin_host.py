@@ -0,0 +1,267 @@
+"""
+Module core/plugin_host.py
+
+Out-of-process plugin hosting. A plugin whose manifest sets
+`hosting: process` runs its simulation in a separate worker process, so it
+can use another CPU core and cannot crash the game. In the main process a
+ProcessPluginHost stands in for it: it forwards on_update(dt) and selected
+game events over a pipe and applies the state diffs the worker sends back.
+
+The plugin module must define `WorkerImpl`, a subclass of WorkerPlugin. It
+runs without access to the game context, pygame or the main-process
+managers; all communication goes through `self.state`.
+"""
+
+import copy
+import importlib
+import logging
+import multiprocessing
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.events.event_types import EventType
+from core.plugin import Plugin
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a worker to exit on shutdown before terminating it
+SHUTDOWN_TIMEOUT = 1.0
+
+
+class WorkerPlugin:
+    """
+    Base class for plugin logic that runs inside a worker process.
+
+    Subclasses keep their observable results in `state`, a dict of picklable
+    values. After every update or event, top-level keys that changed are sent
+    to the main process.
+
+    Attributes:
+        state (Dict[str, Any]): State mirrored into the main process.
+    """
+    def __init__(self) -> None:
+        """Create the worker with empty state."""
+        self.state: Dict[str, Any] = {}
+
+    def on_start(self) -> None:
+        """Called once in the worker process before the first update."""
+        pass
+
+    def on_update(self, dt: float) -> None:
+        """
+        Advance the simulation.
+
+        Args:
+            dt (float): Time accumulated since the previous update, in seconds.
+        """
+        pass
+
+    def on_event(self, event_name: str, data: Dict[str, Any]) -> None:
+        """
+        Handle a forwarded game event.
+
+        Args:
+            event_name (str): EventType name, e.g. "DAYTIME_CHANGED".
+            data (Dict[str, Any]): Keyword arguments of the dispatch.
+        """
+        pass
+
+
+def _diff(
+    state: Dict[str, Any], last: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Return (changed or new keys with values, removed keys) between snapshots."""
+    changes = {k: v for k, v in state.items() if k not in last or last[k] != v}
+    removed = [k for k in last if k not in state]
+    return changes, removed
+
+
+def _worker_main(conn: Any, module_path: str) -> None:
+    """
+    Entry point of the worker process.
+
+    Messages from the host: ("update", dt), ("event", name, data), ("stop",).
+    Replies: ("updated", changes, removed) after each update,
+    ("changed", changes, removed) after events that changed state,
+    ("error", traceback) before exiting on an unhandled exception.
+    """
+    try:
+        worker = importlib.import_module(module_path).WorkerImpl()
+        worker.on_start()
+        last: Dict[str, Any] = {}
+        changes, removed = _diff(worker.state, last)
+        last = copy.deepcopy(worker.state)
+        conn.send(("changed", changes, removed))
+
+        while True:
+            msg = conn.recv()
+            kind = msg[0]
+            if kind == "stop":
+                break
+            if kind == "update":
+                worker.on_update(msg[1])
+            elif kind == "event":
+                worker.on_event(msg[1], msg[2])
+            changes, removed = _diff(worker.state, last)
+            if changes or removed:
+                last = copy.deepcopy(worker.state)
+            if kind == "update":
+                conn.send(("updated", changes, removed))
+            elif changes or removed:
+                conn.send(("changed", changes, removed))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    except Exception:
+        try:
+            conn.send(("error", traceback.format_exc()))
+        except (OSError, EOFError):
+            pass
+    finally:
+        conn.close()
+
+
+class ProcessPluginHost(Plugin):
+    """
+    Main-process proxy for a plugin running in a worker process.
+
+    Updates are never blocking: while the worker is still busy with the
+    previous update, frame time accumulates and is sent as one larger step.
+    Diffs are merged into `state` and announced via PLUGIN_STATE_CHANGED.
+
+    Attributes:
+        name (str): Plugin name from the manifest.
+        state (Dict[str, Any]): Latest state received from the worker.
+        crashed (bool): True once the worker died; the host then stays inert.
+    """
+    def __init__(self, app: Any, meta: Dict[str, Any]) -> None:
+        """
+        Args:
+            app (Any): The GameApp instance.
+            meta (Dict[str, Any]): Plugin metadata (name, module, forward_events).
+        """
+        super().__init__(app)
+        self.name = meta["name"]
+        self.module_path = meta["module"]
+        self.forward_events: List[str] = list(meta.get("forward_events", []))
+        self.state: Dict[str, Any] = {}
+        self.crashed = False
+        self._stopped = False
+        self._conn: Any = None
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._busy = False
+        self._pending_dt = 0.0
+        self._forwarders: Dict[EventType, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"<ProcessPluginHost {self.name}>"
+
+    def on_init(self) -> None:
+        """Start the worker process and subscribe forwarded events."""
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_worker_main, args=(child_conn, self.module_path),
+            name=f"plugin-{self.name}", daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+
+        event_manager = self.app.context.event_manager
+        for event_name in self.forward_events:
+            try:
+                event_type = EventType[event_name]
+            except KeyError:
+                logger.error(
+                    "Unknown event '%s' in forward_events of plugin '%s'.",
+                    event_name, self.name
+                )
+                continue
+            forwarder = self._make_forwarder(event_name)
+            self._forwarders[event_type] = forwarder
+            event_manager.register(event_type, forwarder)
+        logger.info("Started worker process for plugin: %s", self.name)
+
+    def _make_forwarder(self, event_name: str) -> Any:
+        """Return an event callback that sends the event to the worker."""
+        def forward(*args: Any, **kwargs: Any) -> None:
+            self._send(("event", event_name, kwargs))
+        return forward
+
+    def _send(self, msg: Tuple) -> None:
+        """Send a message to the worker; a broken pipe marks it crashed."""
+        if self.crashed or self._stopped:
+            return
+        try:
+            self._conn.send(msg)
+        except (OSError, ValueError) as e:
+            self._mark_crashed(f"pipe closed ({e})")
+
+    def _mark_crashed(self, reason: str) -> None:
+        """Stop talking to a dead worker; the game keeps running."""
+        if not self.crashed:
+            self.crashed = True
+            logger.error("Worker of plugin '%s' stopped: %s", self.name, reason)
+
+    def _apply(self, changes: Dict[str, Any], removed: List[str]) -> None:
+        """Merge a state diff and announce it."""
+        if not changes and not removed:
+            return
+        self.state.update(changes)
+        for key in removed:
+            self.state.pop(key, None)
+        self.app.context.event_manager.dispatch(
+            EventType.PLUGIN_STATE_CHANGED,
+            plugin=self.name, changes=changes, removed=removed
+        )
+
+    def poll(self) -> None:
+        """Apply all messages the worker has sent so far, without blocking."""
+        if self.crashed or self._stopped:
+            return
+        try:
+            while self._conn.poll():
+                msg = self._conn.recv()
+                kind = msg[0]
+                if kind == "error":
+                    self._mark_crashed(msg[1])
+                    return
+                if kind == "updated":
+                    self._busy = False
+                self._apply(msg[1], msg[2])
+        except (EOFError, OSError):
+            self._mark_crashed(f"exit code {self._process.exitcode}")
+
+    def on_update(self, dt: float) -> None:
+        """
+        Collect worker results and hand it the next step if it is idle.
+
+        Args:
+            dt (float): Frame delta time in seconds.
+        """
+        self.poll()
+        if self.crashed or self._stopped:
+            return
+        self._pending_dt += dt
+        if not self._busy:
+            self._busy = True
+            step, self._pending_dt = self._pending_dt, 0.0
+            self._send(("update", step))
+
+    def on_shutdown(self) -> None:
+        """Unsubscribe events and stop the worker process."""
+        event_manager = self.app.context.event_manager
+        for event_type, forwarder in self._forwarders.items():
+            event_manager.unregister(event_type, forwarder)
+        self._forwarders.clear()
+        if self._process is None:
+            return
+        self._send(("stop",))
+        self._stopped = True
+        self._process.join(SHUTDOWN_TIMEOUT)
+        if self._process.is_alive():
+            logger.warning("Terminating unresponsive worker of plugin '%s'.", self.name)
+            self._process.terminate()
+            self._process.join(SHUTDOWN_TIMEOUT)
+        self._conn.close()
+        self._process = None
+        logger.info("Stopped worker process for plugin: %s", self.name)
@@ -0,0 +1,129 @@
+"""
+Module core/plugin_index.py
+
+Provides PluginIndex, a persistent cache of parsed plugin manifests. Parsing
+YAML is slow, so the raw manifest data is stored in a JSON index next to the
+plugins directory and reused as long as each manifest's modification time
+and size are unchanged. Only new or edited manifests are parsed again.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from yaml import safe_load
+
+logger = logging.getLogger(__name__)
+
+# Bump when the index layout changes to invalidate old files
+INDEX_VERSION = 1
+MANIFEST_NAME = "plugin.yaml"
+
+
+class PluginIndex:
+    """
+    Manifest cache for one plugins directory.
+
+    Attributes:
+        base_dir (Path): Directory containing plugin subdirectories.
+        index_path (Path | None): JSON index file; None disables persistence.
+        parsed (int): Number of manifests parsed during the last scan.
+    """
+    def __init__(self, base_dir: Path, index_path: Optional[Path] = None) -> None:
+        """
+        Create the index and load the persisted entries, if any.
+
+        Args:
+            base_dir (Path): Directory containing plugin subdirectories.
+            index_path (Path, optional): Location of the JSON index file.
+        """
+        self.base_dir = Path(base_dir)
+        self.index_path = Path(index_path) if index_path else None
+        self.parsed = 0
+        # Subdirectory name -> {"mtime_ns", "size", "data"}
+        self._entries: Dict[str, Dict[str, Any]] = self._read_index()
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load entries from the index file; a missing or stale file yields none."""
+        if self.index_path is None or not self.index_path.exists():
+            return {}
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable plugin index '%s': %s", self.index_path, e)
+            return {}
+        if raw.get("version") != INDEX_VERSION:
+            return {}
+        return raw.get("entries", {})
+
+    def _write_index(self) -> None:
+        """Persist entries atomically (write to a temp file, then replace)."""
+        if self.index_path is None:
+            return
+        tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            tmp.write_text(
+                json.dumps({"version": INDEX_VERSION, "entries": self._entries}),
+                encoding="utf-8"
+            )
+            os.replace(tmp, self.index_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not write plugin index '%s': %s", self.index_path, e)
+
+    def scan(self) -> List[Tuple[Path, Dict[str, Any]]]:
+        """
+        Return the manifest data of every plugin subdirectory.
+
+        Cached data is used for manifests whose mtime and size match the index;
+        all others are parsed and the index is rewritten if anything changed.
+
+        Returns:
+            List[Tuple[Path, Dict[str, Any]]]: Manifest path and raw manifest
+            data, in directory order. Manifests that fail to parse are skipped.
+        """
+        self.parsed = 0
+        results: List[Tuple[Path, Dict[str, Any]]] = []
+        if not self.base_dir.exists():
+            logger.warning("Plugins directory '%s' not found.", self.base_dir)
+            return results
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        dirty = False
+        for sub in sorted(self.base_dir.iterdir()):
+            manifest = sub / MANIFEST_NAME
+            try:
+                st = manifest.stat()
+            except OSError:
+                if sub.is_dir():
+                    logger.debug("Skipping '%s': no manifest found.", sub)
+                continue
+
+            entry = self._entries.get(sub.name)
+            if (
+                entry is None
+                or entry["mtime_ns"] != st.st_mtime_ns
+                or entry["size"] != st.st_size
+            ):
+                try:
+                    data = safe_load(manifest.read_text(encoding="utf-8")) or {}
+                except Exception as e:
+                    logger.error(
+                        "Error reading manifest '%s': %s", manifest, e, exc_info=True
+                    )
+                    continue
+                self.parsed += 1
+                entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}
+                dirty = True
+            entries[sub.name] = entry
+            results.append((manifest, entry["data"]))
+
+        # Entries for removed plugin directories also require a rewrite
+        if dirty or entries.keys() != self._entries.keys():
+            self._entries = entries
+            self._write_index()
+        logger.debug(
+            "Plugin index scan: %d manifests, %d parsed.", len(results), self.parsed
+        )
+        return results
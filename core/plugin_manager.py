@@ -2,22 +2,50 @@
 Module core/plugin_manager.py
 
 Implements PluginManager, responsible for discovering, loading, enabling,
-and disabling game plugins. Reads plugin manifests, resolves dependencies,
-and dispatches lifecycle hooks (on_init, on_start, on_event, etc.) to
-active plugins.
+and disabling game plugins. Reads plugin manifests, indexes them in a
+PluginRegistry to resolve dependencies, and dispatches lifecycle hooks
+(on_init, on_start, on_event, etc.) to active plugins. Plugins that declare
+`provides` in their manifest are activated lazily: their services are
+registered as lazy providers and the plugin is loaded on first lookup of one
+of them. Hook calls are optionally timed per plugin and checked against
+manifest frame budgets, and can run at declared frequencies (`update_hz`,
+`render_hz`). Overlays of retained or rate-limited plugins are cached in
+render layers and composited in z-order. Events are routed through a
+per-type table to the plugins that subscribe to them. Plugins can be
+hot-reloaded from source without restarting the game. Enabled state is
+persisted in a separate state file; manifests are never written.
 """
 
 import importlib
 import logging
+import sys
+import time
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Any, Dict, List, Set
-
-from yaml import safe_load, safe_dump
-
-from setup.config import paths
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import pygame
+
+from core.events.event_types import EventType
+from core.events.game_event import GameEvent
+from core.plugin import Plugin
+from core.plugin_host import ProcessPluginHost
+from core.plugin_index import PluginIndex
+from core.render_layer import RenderLayer
+from core.plugin_profiler import PluginProfiler
+from core.plugin_registry import PluginRegistry
+from core.plugin_state import PluginStateStore
+from core.services import ServiceRegistry
+from core.plugin_scheduler import TickScheduler
+from setup.config import paths, plugin_profiling
 
 logger = logging.getLogger(__name__)
 
+# Lifecycle hooks dispatched by the manager
+HOOKS = ("on_init", "on_start", "on_event", "on_update", "on_render", "on_shutdown")
+# Marker for context attributes that did not exist before a plugin set them
+_MISSING = object()
+
 
 class PluginManager:
     """
@@ -26,9 +54,18 @@ class PluginManager:
     Responsibilities:
     - Discover plugin manifests under configured plugins_path
     - Resolve dependency graph and load enabled plugins in correct order
-    - Enable or disable plugins at runtime, updating manifests
+    - Enable or disable plugins at runtime, persisting the choice in the
+      plugin state file
     - Dispatch plugin hooks: on_init, on_start, on_event, on_update,
       on_render, on_shutdown
+    - Defer loading of plugins that only provide services until one of
+      them is first looked up
+    - Profile hook calls per plugin and enforce manifest frame budgets
+    - Run on_update/on_render at manifest-declared frequencies
+    - Cache plugin overlays in render layers redrawn only when dirty or due
+    - Route pygame and EventType events only to subscribed plugins
+    - Hot-reload plugin code, undoing its event, service and context
+      registrations
     """
 
     def __init__(self, app: Any):
@@ -42,44 +79,87 @@ class PluginManager:
         self.app = app
         # Base directory where plugins are stored
         self.plugin_base = Path(paths["plugins_path"])
+        # Persisted enabled flags, overriding the manifest defaults
+        state_file = paths.get("plugin_state")
+        self.state_store = PluginStateStore(Path(state_file) if state_file else None)
         # List of available plugin metadata dictionaries
         self.available: List[Dict[str, Any]] = self._discover_plugins(self.plugin_base)
+        # Lookup by name/module and dependency graph of available plugins
+        self.registry = PluginRegistry(self.available)
         # Map of plugin name to set of dependents
-        self.dependents: Dict[str, Set[str]] = self._build_dependents_map()
+        self.dependents: Dict[str, Set[str]] = self.registry.dependents
         # Loaded plugin instances by module path
         self.loaded: Dict[str, Any] = {}
         # Ordered list of active plugin instances
         self.plugins: List[Any] = []
+        # Per-hook (plugin, bound method) tuples of plugins overriding the hook;
+        # for on_event only plugins without subscriptions (they get all
+        # pygame events)
+        self._hooks: Dict[str, Tuple[Tuple[Any, Callable], ...]] = {h: () for h in HOOKS}
+        # Resolved event subscriptions per plugin instance id
+        self._subscriptions: Dict[int, Tuple[Any, ...]] = {}
+        # Event type (pygame int or EventType) -> subscribed on_event hooks
+        self._event_routes: Dict[Any, Tuple[Tuple[Any, Callable], ...]] = {}
+        # EventManager callbacks feeding subscribed EventTypes into the routes
+        self._event_forwarders: Dict[EventType, Callable] = {}
+        # Context attributes set by each plugin during on_init, with the
+        # values they replaced, so unloading can restore them
+        self._context_attrs: Dict[str, List[Tuple[str, Any]]] = {}
+        # Lazy service factories of plugins that are not yet active
+        self.lazy_providers: Dict[str, Callable[[], Any]] = {}
+        # Set once on_start has been dispatched; late activations start at once
+        self.started = False
+        # Reduced-frequency schedules for on_update/on_render
+        self.scheduler = TickScheduler()
+        # Cached render layers of retained or rate-limited overlay plugins
+        self._layers: Dict[int, RenderLayer] = {}
+        # Compositing order per plugin instance id, from the manifest
+        self._render_z: Dict[int, int] = {}
+        # Delta time of the latest frame, used to schedule on_render
+        self._frame_dt = 0.0
+        # Per-plugin hook timing and budgets (None when profiling is disabled)
+        self.profiler: Optional[PluginProfiler] = None
+        if plugin_profiling.get("enabled", False):
+            self.profiler = PluginProfiler(
+                window=plugin_profiling.get("window", 120),
+                over_budget_frames=plugin_profiling.get("over_budget_frames", 5),
+                recover_frames=plugin_profiling.get("recover_frames", 60),
+                throttle_factor=plugin_profiling.get("throttle_factor", 0)
+            )
 
     def _discover_plugins(self, base_dir: Path) -> List[Dict[str, Any]]:
         """
         Scan subdirectories for plugin.yaml manifests and collect metadata.
 
+        Parsed manifests are cached in the plugin index (paths.plugin_index),
+        so only new or modified manifests are read with the YAML loader. The
+        manifest `enabled` flag is a default; the plugin state file wins.
+
         Args:
             base_dir (Path): Directory to search for plugin subdirectories.
 
         Returns:
             List[Dict[str, Any]]: Metadata for each discovered plugin.
         """
+        index_file = paths.get("plugin_index")
+        index = PluginIndex(base_dir, Path(index_file) if index_file else None)
         plugins: List[Dict[str, Any]] = []
-        if not base_dir.exists():
-            logger.warning("Plugins directory '%s' not found.", base_dir)
-            return plugins
-
-        for sub in base_dir.iterdir():
-            if not sub.is_dir():
-                continue
-            manifest = sub / "plugin.yaml"
-            if not manifest.exists():
-                logger.debug("Skipping '%s': no manifest found.", sub)
-                continue
+        for manifest, data in index.scan():
             try:
-                data = safe_load(manifest.read_text(encoding="utf-8")) or {}
+                stored = self.state_store.get(data["name"])
                 plugins.append({
                     "name": data["name"],
                     "module": data["module"],
-                    "enabled": data.get("enabled", False),
+                    "enabled": data.get("enabled", False) if stored is None else stored,
                     "depends": data.get("depends", []),
+                    "provides": data.get("provides", []),
+                    "budget_ms": data.get("budget_ms"),
+                    "update_hz": data.get("update_hz"),
+                    "render_hz": data.get("render_hz"),
+                    "render_z": data.get("render_z"),
+                    "hosting": data.get("hosting", "inline"),
+                    "forward_events": data.get("forward_events", []),
+                    "events": data.get("events", []),
                     "manifest": manifest,
                 })
                 logger.info("Discovered plugin: %s", data["name"])
@@ -89,103 +169,366 @@ class PluginManager:
                 )
         return plugins
 
-    def _build_dependents_map(self) -> Dict[str, Set[str]]:
-        """
-        Construct reverse dependency map: plugin -> set of plugins depending on it.
-
-        Returns:
-            Dict[str, Set[str]]: Mapping of plugin names to their dependents.
-        """
-        # Map each plugin to its declared dependencies
-        deps = {m["name"]: set(m.get("depends", [])) for m in self.available}
-        # Initialize empty set of dependents for each plugin
-        dependents: Dict[str, Set[str]] = {name: set() for name in deps}
-        # Fill in dependents from dependencies
-        for name, reqs in deps.items():
-            for dep in reqs:
-                if dep in dependents:
-                    dependents[dep].add(name)
-                else:
-                    logger.warning(
-                        "Unknown dependency '%s' for plugin '%s'.", dep, name
-                    )
-        return dependents
-
     def _resolve_load_order(self) -> List[str]:
         """
         Compute load order for enabled plugins via topological sort.
 
+        Plugins in a dependency cycle, or depending on a disabled or unknown
+        plugin, are reported and left out.
+
         Returns:
             List[str]: Names of enabled plugins in correct load order.
         """
-        # Filter only enabled plugins and copy their dependency sets
-        deps = {
-            m["name"]: set(m.get("depends", []))
-            for m in self.available if m["enabled"]
-        }
-        order: List[str] = []
-        # Start with plugins without dependencies
-        queue = [name for name, reqs in deps.items() if not reqs]
-
-        while queue:
-            name = queue.pop(0)
-            order.append(name)
-            # Remove this plugin from its dependents' dependency sets
-            for child in list(self.dependents.get(name, [])):
-                if child in deps:
-                    deps[child].discard(name)
-                    if not deps[child]:
-                        queue.append(child)
-            deps.pop(name, None)
-
-        if deps:
-            logger.error(
-                "Circular or missing dependencies detected: %s", deps
-            )
-            # Fallback: load in discovery order
-            return [m["name"] for m in self.available if m["enabled"]]
+        order, excluded = self.registry.resolve_order(
+            m["name"] for m in self.available if m["enabled"]
+        )
+        for name, reason in excluded.items():
+            logger.error("Not loading plugin '%s': %s", name, reason)
         return order
 
+    def _eager_names(self) -> Set[str]:
+        """
+        Determine which enabled plugins must be loaded at startup.
+
+        Plugins without `provides` are eager, and so is every dependency of an
+        eager plugin; the remaining enabled plugins are activated lazily.
+
+        Returns:
+            Set[str]: Names of plugins to load eagerly.
+        """
+        stack = [
+            m["name"] for m in self.available
+            if m["enabled"] and not m.get("provides")
+        ]
+        eager: Set[str] = set()
+        while stack:
+            name = stack.pop()
+            meta = self.registry.get(name)
+            if name in eager or meta is None or not meta["enabled"]:
+                continue
+            eager.add(name)
+            stack.extend(meta.get("depends", []))
+        return eager
+
     def load_plugins(self) -> None:
         """
         Load and initialize all enabled plugins in resolved order.
+
+        Plugins that are only needed for the services they provide get lazy
+        providers in the context's service registry instead and are loaded
+        on first lookup.
         """
+        eager = self._eager_names()
+        services = self._services()
         for name in self._resolve_load_order():
-            meta = next((m for m in self.available if m["name"] == name), None)
-            if meta:
+            meta = self.registry.get(name)
+            if name in eager or services is None:
                 self._load(meta)
+            else:
+                self._register_lazy_services(meta)
+
+    def _services(self) -> Optional[ServiceRegistry]:
+        """Return the context's service registry, if there is one."""
+        return getattr(getattr(self.app, "context", None), "services", None)
+
+    def _register_lazy_services(self, meta: Dict[str, Any]) -> None:
+        """
+        Register a lazy provider for each service a deferred plugin provides.
+
+        Args:
+            meta (Dict[str, Any]): Metadata for a lazy plugin.
+        """
+        services = self._services()
+        name = meta["name"]
+        for capability in meta.get("provides", []):
+            factory = self._lazy_factory(name, capability)
+            self.lazy_providers[capability] = factory
+            services.register(capability, factory, lazy=True, owner=name)
+        logger.info("Deferred plugin: %s (provides %s)", name, meta["provides"])
+
+    def _lazy_factory(self, name: str, capability: str) -> Callable[[], Any]:
+        """
+        Build the lazy provider that activates a plugin on first lookup.
+
+        Args:
+            name (str): Name of the providing plugin.
+            capability (str): Service key.
+
+        Returns:
+            Callable[[], Any]: Factory returning the real service.
+        """
+        def build() -> Any:
+            if self.activate(name) is None:
+                raise LookupError(
+                    f"Plugin '{name}' providing '{capability}' could not be activated"
+                )
+            # Activation replaced this lazy provider with the real one
+            return self._services().get(capability)
+        return build
+
+    def _bind_provided(self, meta: Dict[str, Any], instance: Any) -> None:
+        """
+        Publish provided services the plugin did not register in on_init.
+
+        Such services are bound to the instance attribute of the same name.
+        Lazy providers of the plugin are replaced either way.
+
+        Args:
+            meta (Dict[str, Any]): Metadata for the plugin.
+            instance (Any): The loaded plugin instance.
+        """
+        services = self._services()
+        if services is None:
+            return
+        for capability in meta.get("provides", []):
+            placeholder = self.lazy_providers.pop(capability, None)
+            if capability in services and services.get_provider(capability) is not placeholder:
+                continue
+            target = getattr(instance, capability, None)
+            if target is not None:
+                services.register(capability, target, owner=meta["name"])
+            else:
+                services.unregister(capability)
+                logger.warning(
+                    "Plugin '%s' does not provide '%s'.", meta["name"], capability
+                )
+
+    def activate(self, name: str) -> Optional[Any]:
+        """
+        Load a deferred plugin (dependencies first) if it is not active yet.
+
+        If the game has already started, on_start is called right after
+        on_init so the plugin catches up with the lifecycle.
+
+        Args:
+            name (str): Name of the plugin to activate.
+
+        Returns:
+            Any | None: The plugin instance, or None if it is disabled or
+            failed to load.
+        """
+        meta = self.registry.get(name)
+        if not meta or not meta["enabled"]:
+            return None
+        instance = self.loaded.get(meta["module"])
+        if instance is not None:
+            return instance
 
-    def _load(self, meta: Dict[str, Any]) -> None:
+        for dep in meta.get("depends", []):
+            self.activate(dep)
+        instance = self._load(meta)
+        if instance is None:
+            return None
+        if self.started:
+            try:
+                instance.on_start()
+            except Exception:
+                logger.exception("Error in on_start of plugin '%s'.", name)
+        logger.info("Activated plugin on first use: %s", name)
+        return instance
+
+    def _load(self, meta: Dict[str, Any]) -> Optional[Any]:
         """
         Import the plugin module, instantiate PluginImpl, and call on_init.
 
+        Plugins with `hosting: process` are not imported here; a
+        ProcessPluginHost starts their WorkerImpl in a worker process instead.
+
         Args:
             meta (Dict[str, Any]): Metadata for the plugin.
+
+        Returns:
+            Any | None: The plugin instance, or None if loading failed.
         """
         module_path = meta["module"]
         try:
-            module = importlib.import_module(module_path)
-            cls = getattr(module, "PluginImpl")
-            instance = cls(self.app)
+            if meta.get("hosting") == "process":
+                instance = ProcessPluginHost(self.app, meta)
+            else:
+                module = importlib.import_module(module_path)
+                cls = getattr(module, "PluginImpl")
+                instance = cls(self.app)
             self.loaded[module_path] = instance
             self.plugins.append(instance)
+            if self.profiler is not None:
+                self.profiler.register(instance, meta["name"], meta.get("budget_ms"))
+            self.scheduler.register(instance, "on_update", meta.get("update_hz"))
+            self.scheduler.register(instance, "on_render", meta.get("render_hz"))
+            if meta.get("render_z") is not None:
+                self._render_z[id(instance)] = meta["render_z"]
+            self._subscriptions[id(instance)] = self._resolve_events(
+                meta["name"],
+                list(meta.get("events", [])) + list(getattr(instance, "events", ()))
+            )
+            self._rebuild_dispatch()
             # Invoke plugin initialization hook
             if hasattr(instance, "on_init"):
-                instance.on_init()
+                self._tracked_init(meta["name"], instance)
+            self._bind_provided(meta, instance)
             logger.info("Loaded plugin: %s", meta["name"])
+            return instance
         except Exception:
             logger.exception(
                 "Failed to load plugin '%s'.", meta["name"]
             )
+            return None
+
+    def _tracked_init(self, name: str, instance: Any) -> None:
+        """
+        Run on_init while recording what the plugin registers.
+
+        Event listeners and services are attributed to the plugin via the
+        owned_by() scopes of the EventManager and ServiceRegistry, and context
+        attributes it adds or replaces are remembered, so _unload() can undo
+        all of them.
+
+        Args:
+            name (str): Plugin name.
+            instance (Any): Plugin instance.
+        """
+        context = getattr(self.app, "context", None)
+        before = dict(vars(context)) if context is not None else {}
+        try:
+            with ExitStack() as scopes:
+                for registry in (
+                    getattr(context, "event_manager", None), self._services()
+                ):
+                    if registry is not None:
+                        scopes.enter_context(registry.owned_by(name))
+                instance.on_init()
+        finally:
+            if context is not None:
+                changed = self._context_attrs.setdefault(name, [])
+                for attr, value in vars(context).items():
+                    previous = before.get(attr, _MISSING)
+                    if previous is not value:
+                        changed.append((attr, previous))
+
+    def _unload(self, meta: Dict[str, Any], instance: Any) -> None:
+        """
+        Deactivate a plugin instance and undo its registrations.
+
+        Removes it from dispatch, calls on_shutdown, unregisters its event
+        listeners and services (including lazy providers) and restores
+        context attributes it set during on_init.
+
+        Args:
+            meta (Dict[str, Any]): Metadata for the plugin.
+            instance (Any): The active plugin instance (may be None).
+        """
+        name = meta["name"]
+        self.loaded.pop(meta["module"], None)
+        if instance in self.plugins:
+            self.plugins.remove(instance)
+            if self.profiler is not None:
+                self.profiler.unregister(instance)
+            self.scheduler.unregister(instance)
+            self._layers.pop(id(instance), None)
+            self._render_z.pop(id(instance), None)
+            self._subscriptions.pop(id(instance), None)
+            self._rebuild_dispatch()
+        # Invoke shutdown hook if available
+        if instance and hasattr(instance, "on_shutdown"):
+            try:
+                instance.on_shutdown()
+                logger.info("Called on_shutdown for plugin: %s", name)
+            except Exception:
+                logger.exception(
+                    "Error in on_shutdown of plugin '%s'.", name
+                )
+
+        context = getattr(self.app, "context", None)
+        event_manager = getattr(context, "event_manager", None)
+        if event_manager is not None:
+            event_manager.unregister_owner(name)
+        services = self._services()
+        if services is not None:
+            services.unregister_owner(name)
+        for capability in meta.get("provides", []):
+            self.lazy_providers.pop(capability, None)
+        for attr, previous in reversed(self._context_attrs.pop(name, [])):
+            if previous is _MISSING:
+                if attr in vars(context):
+                    delattr(context, attr)
+            else:
+                setattr(context, attr, previous)
+
+    def reload_plugin(self, name: str) -> bool:
+        """
+        Hot-reload an enabled plugin from source.
+
+        The old instance hands over state via on_before_reload(), is shut down
+        and unregistered, the plugin package and all its submodules are purged
+        from sys.modules, and a fresh PluginImpl is loaded and initialized.
+        The new instance receives the state via on_after_reload(). Modules
+        outside the plugin package that imported from it keep their old
+        references until they are reloaded themselves.
+
+        Args:
+            name (str): Name of the plugin to reload.
+
+        Returns:
+            bool: True if the plugin was reloaded.
+        """
+        meta = self.registry.get(name)
+        if not meta or not meta["enabled"]:
+            logger.warning("Cannot reload plugin '%s': not enabled.", name)
+            return False
+
+        old = self.loaded.get(meta["module"])
+        state = None
+        if old is not None:
+            try:
+                state = old.on_before_reload()
+            except Exception:
+                logger.exception("Error in on_before_reload of plugin '%s'.", name)
+            self._unload(meta, old)
+        self._purge_modules(meta["module"])
+        if old is None:
+            # Deferred plugin: fresh code is picked up on first use
+            logger.info("Purged modules of inactive plugin: %s", name)
+            return True
+
+        instance = self._load(meta)
+        if instance is None:
+            return False
+        if self.started:
+            try:
+                instance.on_start()
+            except Exception:
+                logger.exception("Error in on_start of plugin '%s'.", name)
+        try:
+            instance.on_after_reload(state)
+        except Exception:
+            logger.exception("Error in on_after_reload of plugin '%s'.", name)
+        logger.info("Reloaded plugin: %s", name)
+        return True
+
+    @staticmethod
+    def _purge_modules(module_path: str) -> None:
+        """
+        Drop a plugin's package and all its submodules from sys.modules.
+
+        Args:
+            module_path (str): Dotted path of the plugin's entry module.
+        """
+        package = module_path.rpartition(".")[0] or module_path
+        for mod_name in list(sys.modules):
+            if mod_name == package or mod_name.startswith(package + "."):
+                del sys.modules[mod_name]
+        importlib.invalidate_caches()
 
     def enable_plugin(self, name: str) -> None:
         """
-        Enable a plugin and its dependencies, then persist enabled state.
+        Enable a plugin and its dependencies.
+
+        The new state applies immediately; it is written to the plugin state
+        file in the background.
 
         Args:
             name (str): Name of the plugin to enable.
         """
-        meta = next((m for m in self.available if m["name"] == name), None)
+        meta = self.registry.get(name)
         if not meta or meta["enabled"]:
             return
 
@@ -193,51 +536,50 @@ class PluginManager:
         for dep in meta.get("depends", []):
             self.enable_plugin(dep)
 
-        # Mark enabled and update manifest
         meta["enabled"] = True
-        data = safe_load(meta["manifest"].read_text(encoding="utf-8")) or {}
-        data["enabled"] = True
-        meta["manifest"].write_text(safe_dump(data, sort_keys=False))
-
-        # Load the newly enabled plugin
-        self._load(meta)
+        self.state_store.set(name, True)
+
+        # Load the newly enabled plugin, or defer it if it only provides
+        # services
+        if meta.get("provides") and self._services() is not None:
+            self._register_lazy_services(meta)
+        else:
+            self._load(meta)
         logger.info("Enabled plugin: %s", name)
 
     def disable_plugin(self, name: str) -> None:
         """
-        Disable a plugin and all its dependents, call on_shutdown, then persist.
+        Disable a plugin and all its dependents and call their on_shutdown.
+
+        Like enable_plugin(), the state file is written in the background.
 
         Args:
             name (str): Name of the plugin to disable.
         """
-        meta = next((m for m in self.available if m["name"] == name), None)
+        meta = self.registry.get(name)
         if not meta or not meta["enabled"]:
             return
 
-        # Recursively disable dependents first
-        for child in list(self.dependents.get(name, [])):
-            self.disable_plugin(child)
+        # Disable dependents first, deepest first
+        for child in self.registry.transitive_dependents(name):
+            child_meta = self.registry.get(child)
+            if child_meta["enabled"]:
+                self._disable(child_meta)
+        self._disable(meta)
 
-        # Remove from loaded plugins
-        module_path = meta["module"]
-        instance = self.loaded.pop(module_path, None)
-        if instance in self.plugins:
-            self.plugins.remove(instance)
-        # Invoke shutdown hook if available
-        if instance and hasattr(instance, "on_shutdown"):
-            try:
-                instance.on_shutdown()
-                logger.info("Called on_shutdown for plugin: %s", name)
-            except Exception:
-                logger.exception(
-                    "Error in on_shutdown of plugin '%s'.", name
-                )
+    def _disable(self, meta: Dict[str, Any]) -> None:
+        """
+        Unload a single enabled plugin and record its disabled state.
+
+        Args:
+            meta (Dict[str, Any]): Metadata for the plugin.
+        """
+        name = meta["name"]
+        # Unload the instance and withdraw its services
+        self._unload(meta, self.loaded.get(meta["module"]))
 
-        # Persist disabled state to manifest
         meta["enabled"] = False
-        data = safe_load(meta["manifest"].read_text(encoding="utf-8")) or {}
-        data["enabled"] = False
-        meta["manifest"].write_text(safe_dump(data, sort_keys=False))
+        self.state_store.set(name, False)
         logger.info("Disabled plugin: %s", name)
 
     # Plugin lifecycle dispatchers
@@ -247,39 +589,230 @@ class PluginManager:
 
     def on_start(self) -> None:
         """Dispatch on_start to all active plugins."""
+        self.started = True
         self._dispatch("on_start")
 
     def on_event(self, event: Any) -> None:
-        """Dispatch on_event to all active plugins with the event."""
-        self._dispatch("on_event", event)
+        """
+        Dispatch a pygame event to the plugins subscribed to its type, and to
+        plugins without subscriptions.
+        """
+        for plugin, fn in self._event_routes.get(event.type, ()):
+            self._call(plugin, "on_event", fn, event)
+        for plugin, fn in self._hooks["on_event"]:
+            self._call(plugin, "on_event", fn, event)
 
     def on_update(self, dt: float) -> None:
-        """Dispatch on_update to all active plugins with delta time."""
-        self._dispatch("on_update", dt)
+        """
+        Dispatch on_update to all active plugins with delta time.
+
+        Plugins with an update_hz, and throttled plugins, are skipped on some
+        frames and receive the accumulated delta time when they run.
+        """
+        self._frame_dt = dt
+        schedule_step = self.scheduler.step
+        throttle_step = self.profiler.update_step if self.profiler is not None else None
+        for plugin, fn in self._hooks["on_update"]:
+            step = schedule_step(plugin, "on_update", dt)
+            if step is not None and throttle_step is not None:
+                step = throttle_step(plugin, step)
+            if step is not None:
+                self._call(plugin, "on_update", fn, step)
 
     def on_render(self, surface: Any) -> None:
-        """Dispatch on_render to all active plugins with the surface."""
-        self._dispatch("on_render", surface)
+        """
+        Dispatch on_render to all active plugins with the surface, in z-order.
+
+        Retained plugins and plugins with a render_hz draw into a cached
+        RenderLayer: retained ones only after mark_dirty(), rate-limited ones
+        only when due (and, if also retained, dirty). Layers are composited
+        onto the surface every frame.
+        """
+        is_scheduled = self.scheduler.is_scheduled
+        size = surface.get_size()
+        for plugin, fn in self._hooks["on_render"]:
+            scheduled = is_scheduled(plugin, "on_render")
+            retained = getattr(plugin, "retained", False)
+            if not scheduled and not retained:
+                self._call(plugin, "on_render", fn, surface)
+                continue
+            layer = self._layers.get(id(plugin))
+            if layer is None:
+                layer = self._layers[id(plugin)] = RenderLayer(self._z_of(plugin))
+            due = True
+            if scheduled:
+                due = self.scheduler.step(plugin, "on_render", self._frame_dt) is not None
+            if retained:
+                due = due and plugin.dirty
+            if layer.ensure_size(size) or due:
+                if retained:
+                    plugin.dirty = False
+                layer.redraw(lambda target: self._call(plugin, "on_render", fn, target))
+            layer.composite(surface)
 
     def on_shutdown(self) -> None:
-        """Dispatch on_shutdown to all active plugins."""
+        """Dispatch on_shutdown to all active plugins and flush plugin state."""
         self._dispatch("on_shutdown")
+        self.state_store.close()
+
+    def end_frame(self) -> None:
+        """Close the profiling frame; call once per game loop iteration."""
+        if self.profiler is not None:
+            self.profiler.end_frame()
+
+    def log_profile(self) -> None:
+        """Log the per-plugin timing report, e.g. into the debug console."""
+        if self.profiler is None:
+            logger.info("Plugin profiling is disabled (plugin_profiling.enabled).")
+            return
+        self.profiler.log_report()
+
+    def _rebuild_dispatch(self) -> None:
+        """
+        Rebuild the per-hook dispatch tuples from the active plugins.
+
+        A plugin is included for a hook only if it overrides the no-op default
+        from the Plugin base class. on_event hooks of plugins with event
+        subscriptions go into the per-type routing table instead. Called
+        whenever the active plugin set changes, so per-frame dispatch never
+        inspects plugins.
+        """
+        hooks: Dict[str, Tuple[Tuple[Any, Callable], ...]] = {}
+        # Stable sort keeps load order among plugins with the same z
+        plugins = sorted(self.plugins, key=self._z_of)
+        for hook_name in HOOKS:
+            default = getattr(Plugin, hook_name)
+            hooks[hook_name] = tuple(
+                (plugin, getattr(plugin, hook_name))
+                for plugin in (plugins if hook_name == "on_render" else self.plugins)
+                if callable(getattr(type(plugin), hook_name, None))
+                and getattr(type(plugin), hook_name) is not default
+            )
+        routes: Dict[Any, List[Tuple[Any, Callable]]] = {}
+        broadcast: List[Tuple[Any, Callable]] = []
+        for plugin, fn in hooks["on_event"]:
+            keys = self._subscriptions.get(id(plugin))
+            if keys is None:
+                keys = self._resolve_events(plugin, getattr(plugin, "events", ()))
+            if not keys:
+                broadcast.append((plugin, fn))
+            for key in keys:
+                routes.setdefault(key, []).append((plugin, fn))
+        hooks["on_event"] = tuple(broadcast)
+        self._hooks = hooks
+        self._event_routes = {key: tuple(entries) for key, entries in routes.items()}
+        self._sync_event_forwarders()
+        logger.debug(
+            "Plugin dispatch rebuilt: %s, %d routed event types",
+            {h: len(entries) for h, entries in hooks.items()}, len(routes)
+        )
+
+    def _z_of(self, plugin: Any) -> int:
+        """Return a plugin's compositing order (manifest render_z, else class attribute)."""
+        return self._render_z.get(id(plugin), getattr(plugin, "render_z", 0))
+
+    @staticmethod
+    def _resolve_events(owner: Any, names: List[Any]) -> Tuple[Any, ...]:
+        """
+        Resolve declared event subscriptions to routing keys.
+
+        Args:
+            owner (Any): Plugin name or instance, for error messages.
+            names (List[Any]): pygame event type ints, EventType members, or
+                names of either.
+
+        Returns:
+            Tuple[Any, ...]: Unique pygame event type ints and EventTypes.
+        """
+        keys: List[Any] = []
+        for name in names:
+            key = name
+            if isinstance(name, str):
+                if name in EventType.__members__:
+                    key = EventType[name]
+                else:
+                    key = getattr(pygame, name, None)
+                    if not isinstance(key, int):
+                        logger.error("Unknown event '%s' subscribed by plugin '%s'.", name, owner)
+                        continue
+            if key not in keys:
+                keys.append(key)
+        return tuple(keys)
+
+    def _sync_event_forwarders(self) -> None:
+        """Register EventManager forwarders for exactly the subscribed EventTypes."""
+        event_manager = getattr(getattr(self.app, "context", None), "event_manager", None)
+        if event_manager is None:
+            return
+        wanted = {key for key in self._event_routes if isinstance(key, EventType)}
+        for event_type in [t for t in self._event_forwarders if t not in wanted]:
+            event_manager.unregister(event_type, self._event_forwarders.pop(event_type))
+        # Owned by the manager, so unloading the plugin in scope keeps them
+        with event_manager.owned_by(self):
+            for event_type in wanted - set(self._event_forwarders):
+                forwarder = self._make_event_forwarder(event_type)
+                self._event_forwarders[event_type] = forwarder
+                event_manager.register(event_type, forwarder)
+
+    def _make_event_forwarder(self, event_type: EventType) -> Callable:
+        """Return an EventManager callback routing a dispatch to subscribers."""
+        def forward(*args: Any, **kwargs: Any) -> None:
+            event = GameEvent(event_type, args, kwargs)
+            for plugin, fn in self._event_routes.get(event_type, ()):
+                self._call(plugin, "on_event", fn, event)
+        return forward
 
     def _dispatch(self, hook_name: str, *args: Any, **kwargs: Any) -> None:
         """
-        Internal helper to call a given hook on every plugin.
+        Internal helper to call a given hook on every plugin overriding it.
 
         Args:
             hook_name (str): Name of the hook to invoke on each plugin.
             *args: Positional arguments to forward to the plugin hook.
             **kwargs: Keyword arguments to forward to the plugin hook.
         """
-        for plugin in list(self.plugins):
-            fn = getattr(plugin, hook_name, None)
-            if callable(fn):
-                try:
-                    fn(*args, **kwargs)
-                except Exception:
-                    logger.exception(
-                        "Error in plugin '%s'.%s", plugin, hook_name
-                    )
+        # The tuple is replaced, never mutated, so hooks that enable or
+        # disable plugins cannot disturb this loop
+        if self.profiler is not None:
+            for plugin, fn in self._hooks[hook_name]:
+                self._call(plugin, hook_name, fn, *args, **kwargs)
+            return
+        for plugin, fn in self._hooks[hook_name]:
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                logger.exception(
+                    "Error in plugin '%s'.%s", plugin, hook_name
+                )
+
+    def _call(
+        self, plugin: Any, hook_name: str, fn: Callable, *args: Any, **kwargs: Any
+    ) -> None:
+        """
+        Call one plugin hook, timing it only if the profiler is enabled.
+
+        Args:
+            plugin (Any): Plugin instance owning the hook.
+            hook_name (str): Name of the hook.
+            fn (Callable): Bound hook method.
+            *args: Positional arguments to forward to the hook.
+            **kwargs: Keyword arguments to forward to the hook.
+        """
+        profiler = self.profiler
+        if profiler is None:
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                logger.exception(
+                    "Error in plugin '%s'.%s", plugin, hook_name
+                )
+            return
+        start = time.perf_counter()
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            logger.exception(
+                "Error in plugin '%s'.%s", plugin, hook_name
+            )
+        profiler.record(plugin, hook_name, time.perf_counter() - start)
+
@@ -0,0 +1,270 @@
+"""
+Module core/plugin_profiler.py
+
+Provides PluginProfiler, which collects per-plugin, per-hook wall time
+measured by the PluginManager, keeps rolling statistics, and enforces
+optional per-plugin frame budgets declared in plugin.yaml (`budget_ms`).
+Plugins that stay over budget for several consecutive frames are reported
+through logging (and therefore the in-game debug console) and can have
+their on_update rate reduced until they recover. The full report can be
+printed to the debug console with F3.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HookStats:
+    """
+    Rolling timing statistics for one hook of one plugin.
+
+    Attributes:
+        calls (int): Total number of calls.
+        total (float): Total time spent in seconds.
+        samples (Deque[float]): Durations of the most recent calls.
+    """
+    __slots__ = ("calls", "total", "samples")
+
+    def __init__(self, window: int) -> None:
+        """
+        Args:
+            window (int): Number of recent calls kept for mean/peak.
+        """
+        self.calls = 0
+        self.total = 0.0
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, elapsed: float) -> None:
+        """Add one call duration in seconds."""
+        self.calls += 1
+        self.total += elapsed
+        self.samples.append(elapsed)
+
+    @property
+    def mean(self) -> float:
+        """Mean duration over the rolling window, in seconds."""
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    @property
+    def peak(self) -> float:
+        """Longest duration in the rolling window, in seconds."""
+        return max(self.samples, default=0.0)
+
+
+class PluginProfile:
+    """
+    Timing and budget state of a single plugin.
+
+    Attributes:
+        name (str): Plugin name from the manifest.
+        budget (float | None): Frame budget in seconds, if declared.
+        hooks (Dict[str, HookStats]): Statistics per hook name.
+        frame_time (float): Time spent in the current frame so far.
+        frames (Deque[float]): Per-frame totals of the most recent frames.
+        over_frames (int): Consecutive frames over budget.
+        under_frames (int): Consecutive frames within budget while throttled.
+        throttle (int): on_update runs every `throttle`-th frame (1 = full rate).
+    """
+    __slots__ = (
+        "name", "budget", "hooks", "frame_time", "frames", "over_frames",
+        "under_frames", "throttle", "_skipped", "_pending_dt"
+    )
+
+    def __init__(self, name: str, budget_ms: Optional[float], window: int) -> None:
+        """
+        Args:
+            name (str): Plugin name.
+            budget_ms (float, optional): Frame budget in milliseconds.
+            window (int): Rolling window size in frames/calls.
+        """
+        self.name = name
+        self.budget = budget_ms / 1000.0 if budget_ms else None
+        self.hooks: Dict[str, HookStats] = {}
+        self.frame_time = 0.0
+        self.frames: Deque[float] = deque(maxlen=window)
+        self.over_frames = 0
+        self.under_frames = 0
+        self.throttle = 1
+        self._skipped = 0
+        self._pending_dt = 0.0
+
+
+class PluginProfiler:
+    """
+    Per-plugin hook timing with frame budgets and optional throttling.
+
+    The PluginManager calls `record()` after every hook call and
+    `end_frame()` once per frame.
+    """
+    def __init__(
+        self,
+        window: int = 120,
+        over_budget_frames: int = 5,
+        recover_frames: int = 60,
+        throttle_factor: int = 0
+    ) -> None:
+        """
+        Args:
+            window (int, optional): Rolling window for statistics.
+            over_budget_frames (int, optional): Consecutive frames over budget
+                before a plugin is reported (and throttled).
+            recover_frames (int, optional): Consecutive frames within budget
+                before a throttled plugin returns to full rate.
+            throttle_factor (int, optional): Run on_update of an over-budget
+                plugin only every n-th frame; 0 or 1 disables throttling.
+        """
+        self.window = window
+        self.over_budget_frames = over_budget_frames
+        self.recover_frames = recover_frames
+        self.throttle_factor = throttle_factor
+        # Profiles keyed by plugin identity
+        self._profiles: Dict[int, PluginProfile] = {}
+
+    def register(self, plugin: Any, name: str, budget_ms: Optional[float] = None) -> None:
+        """
+        Start profiling a plugin instance.
+
+        Args:
+            plugin (Any): Plugin instance.
+            name (str): Plugin name for reports.
+            budget_ms (float, optional): Frame budget in milliseconds.
+        """
+        self._profiles[id(plugin)] = PluginProfile(name, budget_ms, self.window)
+
+    def unregister(self, plugin: Any) -> None:
+        """Stop profiling a plugin instance."""
+        self._profiles.pop(id(plugin), None)
+
+    def get(self, plugin: Any) -> Optional[PluginProfile]:
+        """Return the profile of a plugin instance, if registered."""
+        return self._profiles.get(id(plugin))
+
+    def record(self, plugin: Any, hook_name: str, elapsed: float) -> None:
+        """
+        Add the duration of one hook call.
+
+        Args:
+            plugin (Any): Plugin instance that ran the hook.
+            hook_name (str): Name of the hook.
+            elapsed (float): Wall time in seconds.
+        """
+        profile = self._profiles.get(id(plugin))
+        if profile is None:
+            return
+        stats = profile.hooks.get(hook_name)
+        if stats is None:
+            stats = profile.hooks[hook_name] = HookStats(self.window)
+        stats.record(elapsed)
+        profile.frame_time += elapsed
+
+    def update_step(self, plugin: Any, dt: float) -> Optional[float]:
+        """
+        Decide whether a plugin's on_update runs this frame.
+
+        Skipped frames accumulate their dt, which is handed over on the next
+        frame the plugin runs.
+
+        Args:
+            plugin (Any): Plugin instance.
+            dt (float): Delta time of the current frame.
+
+        Returns:
+            float | None: Delta time to pass to on_update, or None to skip.
+        """
+        profile = self._profiles.get(id(plugin))
+        if profile is None or profile.throttle <= 1:
+            return dt
+        profile._pending_dt += dt
+        profile._skipped += 1
+        if profile._skipped < profile.throttle:
+            return None
+        step, profile._pending_dt, profile._skipped = profile._pending_dt, 0.0, 0
+        return step
+
+    def end_frame(self) -> None:
+        """Close the current frame: check budgets and reset frame totals."""
+        for profile in self._profiles.values():
+            frame_time = profile.frame_time
+            profile.frame_time = 0.0
+            profile.frames.append(frame_time)
+            if profile.budget is None:
+                continue
+            if frame_time > profile.budget:
+                profile.over_frames += 1
+                profile.under_frames = 0
+                if profile.over_frames == self.over_budget_frames:
+                    self._on_over_budget(profile, frame_time)
+            else:
+                profile.over_frames = 0
+                if profile.throttle > 1:
+                    profile.under_frames += 1
+                    if profile.under_frames >= self.recover_frames:
+                        profile.throttle = 1
+                        profile.under_frames = 0
+                        logger.info(
+                            "Plugin '%s' is back within budget; full update rate restored.",
+                            profile.name
+                        )
+
+    def _on_over_budget(self, profile: PluginProfile, frame_time: float) -> None:
+        """Report a plugin that exceeded its budget and throttle it if enabled."""
+        logger.warning(
+            "Plugin '%s' over budget for %d frames: %.2f ms (budget %.2f ms).",
+            profile.name, self.over_budget_frames,
+            frame_time * 1000.0, profile.budget * 1000.0
+        )
+        if self.throttle_factor > 1 and profile.throttle == 1:
+            profile.throttle = self.throttle_factor
+            logger.warning(
+                "Plugin '%s' on_update throttled to every %d frames.",
+                profile.name, self.throttle_factor
+            )
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Summarize all profiles, most expensive plugin first.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per plugin with name, budget_ms,
+            mean_ms/peak_ms per frame, throttle and per-hook mean_ms/calls.
+        """
+        rows = []
+        for profile in self._profiles.values():
+            frames = profile.frames
+            rows.append({
+                "name": profile.name,
+                "budget_ms": profile.budget * 1000.0 if profile.budget else None,
+                "mean_ms": (sum(frames) / len(frames) * 1000.0) if frames else 0.0,
+                "peak_ms": max(frames, default=0.0) * 1000.0,
+                "throttle": profile.throttle,
+                "hooks": {
+                    hook: {"mean_ms": stats.mean * 1000.0, "calls": stats.calls}
+                    for hook, stats in profile.hooks.items()
+                },
+            })
+        rows.sort(key=lambda row: row["mean_ms"], reverse=True)
+        return rows
+
+    def log_report(self) -> None:
+        """
+        Log the report one line per plugin at INFO level, so it shows up in
+        the in-game debug console.
+        """
+        rows = self.report()
+        if not rows:
+            logger.info("Plugin profile: no plugins profiled.")
+            return
+        logger.info("Plugin profile (ms per frame, mean/peak):")
+        for row in rows:
+            budget = f", budget {row['budget_ms']:.2f}" if row["budget_ms"] else ""
+            throttle = f", every {row['throttle']}. frame" if row["throttle"] > 1 else ""
+            hooks = " ".join(
+                f"{hook}={stats['mean_ms']:.2f}" for hook, stats in row["hooks"].items()
+            )
+            logger.info(
+                "%s: %.2f/%.2f%s%s [%s]",
+                row["name"], row["mean_ms"], row["peak_ms"], budget, throttle, hooks
+            )
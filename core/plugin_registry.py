@@ -0,0 +1,199 @@
+"""
+Module core/plugin_registry.py
+
+Provides PluginRegistry, an indexed view of discovered plugin metadata.
+Plugins are looked up by name or module in O(1), dependents are kept as a
+reverse adjacency map, and load order is resolved with Kahn's algorithm on
+a deque. Dependency cycles are reported by naming the plugins in the cycle.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PluginRegistry:
+    """
+    Index of plugin metadata dictionaries.
+
+    Attributes:
+        dependents (Dict[str, Set[str]]): Plugin name -> names of plugins that
+            directly depend on it.
+    """
+    def __init__(self, metas: Iterable[Dict[str, Any]]) -> None:
+        """
+        Build the indexes.
+
+        Args:
+            metas (Iterable[Dict[str, Any]]): Plugin metadata with at least
+                "name", "module" and "depends"; later duplicates of a name are
+                ignored.
+        """
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._by_module: Dict[str, Dict[str, Any]] = {}
+        for meta in metas:
+            name = meta["name"]
+            if name in self._by_name:
+                logger.error("Duplicate plugin name '%s'; ignoring %s.", name, meta["module"])
+                continue
+            self._by_name[name] = meta
+            self._by_module[meta["module"]] = meta
+
+        self.dependents: Dict[str, Set[str]] = {name: set() for name in self._by_name}
+        for name, meta in self._by_name.items():
+            for dep in meta.get("depends", []):
+                if dep in self.dependents:
+                    self.dependents[dep].add(name)
+                else:
+                    logger.warning(
+                        "Unknown dependency '%s' for plugin '%s'.", dep, name
+                    )
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate metadata in discovery order."""
+        return iter(self._by_name.values())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return metadata for a plugin name, or None."""
+        return self._by_name.get(name)
+
+    def by_module(self, module_path: str) -> Optional[Dict[str, Any]]:
+        """Return metadata for a plugin entry module, or None."""
+        return self._by_module.get(module_path)
+
+    def transitive_dependents(self, name: str) -> List[str]:
+        """
+        Return every plugin that depends on `name`, directly or indirectly.
+
+        The result is in unload order: each plugin comes before the plugins
+        it depends on, so it can be shut down front to back.
+
+        Args:
+            name (str): Plugin name.
+
+        Returns:
+            List[str]: Names of all dependents (excluding `name`).
+        """
+        order: List[str] = []
+        seen: Set[str] = {name}
+        stack: List[Tuple[str, Iterator[str]]] = [
+            (name, iter(self.dependents.get(name, ())))
+        ]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append((child, iter(self.dependents.get(child, ()))))
+                    break
+            else:
+                stack.pop()
+                if node != name:
+                    order.append(node)
+        return order
+
+    def resolve_order(
+        self, names: Optional[Iterable[str]] = None
+    ) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Topologically sort plugins so dependencies come first.
+
+        Plugins whose dependencies are unknown or outside `names`, or that are
+        part of (or depend on) a cycle, are left out and reported.
+
+        Args:
+            names (Iterable[str], optional): Plugins to order; defaults to all.
+
+        Returns:
+            Tuple[List[str], Dict[str, str]]: Load order, and the excluded
+            plugins mapped to the reason they were excluded.
+        """
+        selected = set(self._by_name) if names is None else set(names) & set(self._by_name)
+        # Remaining unsatisfied dependency count per plugin (Kahn's algorithm)
+        pending: Dict[str, int] = {}
+        excluded: Dict[str, str] = {}
+        for name in selected:
+            deps = self._by_name[name].get("depends", [])
+            missing = [d for d in deps if d not in selected]
+            if missing:
+                excluded[name] = f"missing or disabled dependencies: {', '.join(missing)}"
+            pending[name] = len(set(deps))
+
+        # Seed in discovery order for a stable result
+        queue: Deque[str] = deque(
+            m["name"] for m in self._by_name.values()
+            if m["name"] in selected and pending[m["name"]] == 0
+        )
+        order: List[str] = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for child in self.dependents[name]:
+                if child in pending:
+                    pending[child] -= 1
+                    if pending[child] == 0:
+                        queue.append(child)
+
+        if len(order) < len(selected):
+            resolved = set(order)
+            blocked = [
+                n for n in self._by_name if n in selected and n not in resolved
+            ]
+            for cycle in self._find_cycles(blocked):
+                label = " -> ".join(cycle + [cycle[0]])
+                for name in cycle:
+                    excluded.setdefault(name, f"dependency cycle: {label}")
+            for name in blocked:
+                excluded.setdefault(
+                    name, "depends on a plugin that cannot be loaded"
+                )
+        return order, excluded
+
+    def _find_cycles(self, nodes: List[str]) -> List[List[str]]:
+        """
+        Find dependency cycles among the given plugins (iterative DFS).
+
+        Args:
+            nodes (List[str]): Plugins left unresolved by the topological sort.
+
+        Returns:
+            List[List[str]]: Each cycle as a list of plugin names.
+        """
+        node_set = set(nodes)
+        state: Dict[str, int] = {}  # 1 = on stack, 2 = done
+        cycles: List[List[str]] = []
+        for root in nodes:
+            if root in state:
+                continue
+            path: List[str] = []
+            stack: List[Tuple[str, Iterator[str]]] = []
+            state[root] = 1
+            path.append(root)
+            stack.append((root, iter(self._by_name[root].get("depends", []))))
+            while stack:
+                node, deps = stack[-1]
+                advanced = False
+                for dep in deps:
+                    if dep not in node_set:
+                        continue
+                    if state.get(dep) == 1:
+                        cycles.append(path[path.index(dep):])
+                    elif dep not in state:
+                        state[dep] = 1
+                        path.append(dep)
+                        stack.append((dep, iter(self._by_name[dep].get("depends", []))))
+                        advanced = True
+                        break
+                if not advanced:
+                    state[node] = 2
+                    path.pop()
+                    stack.pop()
+        return cycles
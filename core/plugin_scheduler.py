@@ -0,0 +1,105 @@
+"""
+Module core/plugin_scheduler.py
+
+Provides TickScheduler, which runs plugin hooks at a declared frequency
+(`update_hz` / `render_hz` in plugin.yaml) instead of every frame. Skipped
+frames accumulate their delta time, and plugins sharing a rate get
+staggered phase offsets so they do not all fire on the same frame.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _stagger(index: int) -> float:
+    """
+    Return the phase offset in [0, 1) for the index-th plugin of a rate group.
+
+    Uses the base-2 van der Corput sequence (0, 1/2, 1/4, 3/4, ...), which
+    keeps offsets evenly spread however many plugins join the group.
+    """
+    offset, denom = 0.0, 1.0
+    while index:
+        denom *= 2.0
+        index, bit = divmod(index, 2)
+        offset += bit / denom
+    return offset
+
+
+class _Slot:
+    """Schedule state of one hook of one plugin."""
+    __slots__ = ("interval", "phase", "pending")
+
+    def __init__(self, interval: float, offset: float) -> None:
+        self.interval = interval
+        # Time since the last due point, pre-advanced by the stagger offset
+        self.phase = offset * interval
+        # Real time accumulated since the hook last ran
+        self.pending = 0.0
+
+
+class TickScheduler:
+    """
+    Frequency scheduler for plugin hooks.
+
+    Hooks without a registered frequency are not tracked and run every frame.
+    """
+    def __init__(self) -> None:
+        """Create an empty schedule."""
+        self._slots: Dict[Tuple[int, str], _Slot] = {}
+        # Number of plugins registered per (hook, interval), for staggering
+        self._groups: Dict[Tuple[str, float], int] = {}
+
+    def register(self, plugin: Any, hook_name: str, hz: Optional[float]) -> None:
+        """
+        Run a plugin hook at the given frequency.
+
+        Args:
+            plugin (Any): Plugin instance.
+            hook_name (str): Hook to schedule, e.g. "on_update".
+            hz (float, optional): Calls per second; None or <= 0 means every frame.
+        """
+        if not hz or hz <= 0:
+            return
+        interval = 1.0 / hz
+        group = (hook_name, interval)
+        index = self._groups.get(group, 0)
+        self._groups[group] = index + 1
+        self._slots[(id(plugin), hook_name)] = _Slot(interval, _stagger(index))
+        logger.debug("Scheduled %s.%s at %.2f Hz", plugin, hook_name, hz)
+
+    def unregister(self, plugin: Any) -> None:
+        """Remove all schedules of a plugin instance."""
+        for key in [k for k in self._slots if k[0] == id(plugin)]:
+            del self._slots[key]
+
+    def is_scheduled(self, plugin: Any, hook_name: str) -> bool:
+        """Return True if the hook runs at a reduced frequency."""
+        return (id(plugin), hook_name) in self._slots
+
+    def step(self, plugin: Any, hook_name: str, dt: float) -> Optional[float]:
+        """
+        Advance a hook's schedule by one frame.
+
+        Args:
+            plugin (Any): Plugin instance.
+            hook_name (str): Hook name.
+            dt (float): Delta time of the current frame.
+
+        Returns:
+            float | None: Accumulated delta time if the hook is due this frame
+            (dt itself for unscheduled hooks), otherwise None.
+        """
+        slot = self._slots.get((id(plugin), hook_name))
+        if slot is None:
+            return dt
+        slot.pending += dt
+        slot.phase += dt
+        if slot.phase < slot.interval:
+            return None
+        # Keep the phase offset; after a long hitch fire once, not repeatedly
+        slot.phase %= slot.interval
+        step, slot.pending = slot.pending, 0.0
+        return step
@@ -0,0 +1,176 @@
+"""
+Module core/plugin_state.py
+
+Provides PluginStateStore, the persisted enabled/disabled state of plugins.
+Plugin manifests are treated as read-only; user choices are kept in one JSON
+state file that overrides the manifests' `enabled` defaults. Changes take
+effect in memory at once and are written by a background thread, debounced
+and atomically, so toggling plugins never blocks a frame on disk I/O.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the state file layout changes to ignore old files
+STATE_VERSION = 1
+# Seconds without further changes before the state file is written
+DEFAULT_DEBOUNCE = 0.5
+
+
+class PluginStateStore:
+    """
+    Debounced, asynchronous store of plugin enabled flags.
+
+    Attributes:
+        path (Path | None): JSON state file; None keeps state in memory only.
+        debounce (float): Quiet period before a pending change is written.
+        writes (int): Number of times the state file has been written.
+    """
+    def __init__(
+        self,
+        path: Optional[Path],
+        debounce: float = DEFAULT_DEBOUNCE,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Create the store and load the persisted state, if any.
+
+        Args:
+            path (Path, optional): Location of the JSON state file.
+            debounce (float): Seconds to wait for further changes before writing.
+            clock (Callable[[], float]): Monotonic time source.
+        """
+        self.path = path
+        self.debounce = debounce
+        self.writes = 0
+        self._clock = clock
+        self._enabled: Dict[str, bool] = {}
+        self._dirty_since: Optional[float] = None
+        # Change counter, so an older snapshot never overwrites a newer one
+        self._version = 0
+        self._written_version = 0
+        self._cond = threading.Condition()
+        # Serializes file writes between the writer thread and flush()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._load()
+
+    def _load(self) -> None:
+        """Read the state file; a missing or unreadable file means no overrides."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable plugin state '%s': %s", self.path, e)
+            return
+        if data.get("version") != STATE_VERSION:
+            logger.info("Plugin state version changed; ignoring '%s'.", self.path)
+            return
+        self._enabled = {
+            name: bool(flag) for name, flag in data.get("enabled", {}).items()
+        }
+
+    def get(self, name: str) -> Optional[bool]:
+        """
+        Return the persisted enabled flag of a plugin.
+
+        Args:
+            name (str): Plugin name.
+
+        Returns:
+            bool | None: The stored flag, or None if the manifest default applies.
+        """
+        with self._cond:
+            return self._enabled.get(name)
+
+    def set(self, name: str, enabled: bool) -> None:
+        """
+        Record a plugin's enabled flag and schedule a background write.
+
+        Args:
+            name (str): Plugin name.
+            enabled (bool): New enabled state.
+        """
+        if self.path is None:
+            self._enabled[name] = enabled
+            return
+        with self._cond:
+            if self._enabled.get(name) == enabled:
+                return
+            self._enabled[name] = enabled
+            self._version += 1
+            self._dirty_since = self._clock()
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._writer, name="plugin-state-writer", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _writer(self) -> None:
+        """Background loop: write once changes have been quiet for `debounce`."""
+        with self._cond:
+            while not self._closed:
+                if self._dirty_since is None:
+                    self._cond.wait()
+                    continue
+                remaining = self._dirty_since + self.debounce - self._clock()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                snapshot, version = dict(self._enabled), self._version
+                self._dirty_since = None
+                # Write without holding the lock so set() never waits on disk
+                self._cond.release()
+                try:
+                    self._write(snapshot, version)
+                finally:
+                    self._cond.acquire()
+
+    def _write(self, snapshot: Dict[str, bool], version: int) -> None:
+        """Persist a snapshot atomically (write to a temp file, then replace)."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with self._write_lock:
+            if version <= self._written_version:
+                return
+            try:
+                tmp.write_text(
+                    json.dumps(
+                        {"version": STATE_VERSION, "enabled": snapshot},
+                        indent=2, sort_keys=True
+                    ),
+                    encoding="utf-8"
+                )
+                os.replace(tmp, self.path)
+                self._written_version = version
+                self.writes += 1
+            except OSError as e:
+                logger.warning("Could not write plugin state '%s': %s", self.path, e)
+
+    def flush(self) -> None:
+        """Write pending changes now, on the calling thread."""
+        with self._cond:
+            if self._dirty_since is None or self.path is None:
+                return
+            snapshot, version = dict(self._enabled), self._version
+            self._dirty_since = None
+        self._write(snapshot, version)
+
+    def close(self) -> None:
+        """Stop the writer thread and write any pending changes."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
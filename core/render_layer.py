@@ -0,0 +1,73 @@
+"""
+Module core/render_layer.py
+
+Provides RenderLayer, a retained transparent surface for a plugin overlay.
+The plugin draws into the layer only when its content changes; every frame
+the layer is composited onto the screen, blitting just the bounding box of
+what was drawn.
+"""
+
+from typing import Any, Callable, Tuple
+
+import pygame
+
+
+class RenderLayer:
+    """
+    Cached overlay surface of one plugin.
+
+    Attributes:
+        z (int): Compositing order; higher layers are drawn on top.
+        surface (pygame.Surface | None): The retained SRCALPHA surface.
+        bounds (pygame.Rect): Area of the surface that has visible content.
+        redraws (int): Number of times the layer has been redrawn.
+    """
+    __slots__ = ("z", "surface", "bounds", "redraws")
+
+    def __init__(self, z: int = 0) -> None:
+        """
+        Args:
+            z (int): Compositing order of the layer.
+        """
+        self.z = z
+        self.surface: Any = None
+        self.bounds = pygame.Rect(0, 0, 0, 0)
+        self.redraws = 0
+
+    def ensure_size(self, size: Tuple[int, int]) -> bool:
+        """
+        Make sure the surface matches the target size.
+
+        Args:
+            size (Tuple[int, int]): Size of the surface composited onto.
+
+        Returns:
+            bool: True if the surface was (re)created and must be redrawn.
+        """
+        if self.surface is not None and self.surface.get_size() == size:
+            return False
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.bounds = pygame.Rect(0, 0, 0, 0)
+        return True
+
+    def redraw(self, draw: Callable[[Any], None]) -> None:
+        """
+        Clear the layer and let `draw` paint it again.
+
+        Args:
+            draw (Callable[[pygame.Surface], None]): Paints onto the layer.
+        """
+        self.surface.fill((0, 0, 0, 0))
+        draw(self.surface)
+        self.bounds = self.surface.get_bounding_rect()
+        self.redraws += 1
+
+    def composite(self, target: Any) -> None:
+        """
+        Blit the visible part of the layer onto a surface.
+
+        Args:
+            target (pygame.Surface): Surface to draw onto, e.g. the screen.
+        """
+        if self.bounds.width and self.bounds.height:
+            target.blit(self.surface, self.bounds.topleft, self.bounds)
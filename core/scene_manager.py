@@ -3,23 +3,63 @@ Module core/scene_manager.py
 
 Defines SceneManager, responsible for handling scene lifecycle: discovery,
 instantiation, caching, and transitions between game scenes.
+
+Scenes are built in two phases. Preparation (fonts, and the scene's own
+optional `prepare(context)` classmethod for data loading or layout work)
+runs on a worker thread while a loading overlay is shown; construction of
+the scene object then happens on the main thread. The game and plugin
+manager scenes render their UI text in prepare(), so building their labels
+only looks it up in the font cache. Scenes listed in the
+config `scenes.prewarm` are prepared and built during idle frames.
+
+Scenes form a stack: push_scene() opens an overlay (e.g. the pause menu)
+over the current scene and pop_scene() returns to it. Only the top scene
+receives input and draws live; scenes below are drawn from cached snapshot
+surfaces. A scene's `background_update` attribute decides whether it keeps
+updating while covered: "full" (every frame), "reduced" (at
+`background_hz`), or "none" (the default). Its snapshot is refreshed
+whenever it updates.
+
+Switching scenes can be animated (config `scenes.transition`). The outgoing
+and incoming scenes are each rendered once into off-screen surfaces and the
+transition only blends those, so no scene draws twice per frame meanwhile.
 """
 
 import logging
 import inspect
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+import pygame
 import scenes
 import pkgutil, importlib
 for _, modname, _ in pkgutil.iter_modules(scenes.__path__): importlib.import_module(f"scenes.{modname}") 
 
+import setup.config as Config
 from core.scene_registry import scene_registry
+from core.scene_transitions import SceneTransition, create_transition
+from ui import font_cache
+from ui.loading_overlay import LoadingOverlay
 
 logger = logging.getLogger(__name__)
 
+# Background update policies for covered scenes
+BACKGROUND_FULL = "full"
+BACKGROUND_REDUCED = "reduced"
+BACKGROUND_NONE = "none"
+# Update rate of "reduced" scenes that do not set background_hz
+DEFAULT_BACKGROUND_HZ = 5.0
+
 
 class SceneManager:
     """
     Manages game scenes by loading scene classes from the registry,
     caching instances, and facilitating scene transitions.
+
+    Attributes:
+        stack (List[object]): Active scenes, bottom to top.
+        loading (str | None): Key of the scene being prepared, if any.
     """
 
     def __init__(self, context: object, app: object) -> None:
@@ -32,59 +72,332 @@ class SceneManager:
         """
         self.context = context
         self.app = app
-        # Currently active scene instance
-        self.current_scene = None
+        # Active scenes; the last one is current
+        self.stack: List[object] = []
         # Cached scenes by registry key to avoid re-instantiation
         self.scene_cache: dict[str, object] = {}
+        # Registry key per cached scene instance id
+        self._keys: Dict[int, str] = {}
+        # Scene waiting for its background preparation to finish, and
+        # whether it will be pushed rather than switched to
+        self.loading: Optional[str] = None
+        self._loading_push = False
+        # Snapshots of covered scenes, and those that need redrawing
+        self._snapshots: Dict[int, pygame.Surface] = {}
+        self._stale: Set[int] = set()
+        # Time accumulated towards the next reduced-rate background update
+        self._background_elapsed: Dict[int, float] = {}
+        # Running scene transition and the stack it transitions from
+        self.transition: Optional[SceneTransition] = None
+        self._outgoing: List[object] = []
+        # Running or finished preparations by scene key
+        self._pending: Dict[str, Future] = {}
+        # Scenes to prepare and build during idle frames
+        self._prewarm: Deque[str] = deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.loading_overlay = LoadingOverlay()
+        self.prewarm(Config.scenes.get("prewarm", []))
         logger.debug("SceneManager initialized.")
 
+    @property
+    def current_scene(self) -> Optional[object]:
+        """The top scene of the stack, or None."""
+        return self.stack[-1] if self.stack else None
+
+    @property
+    def current_key(self) -> Optional[str]:
+        """Registry key of the top scene, or None."""
+        scene = self.current_scene
+        return self._keys.get(id(scene)) if scene is not None else None
+
     def switch_scene(self, key: str) -> None:
         """
         Switch to the scene identified by the given key, instantiating and caching it on first use.
 
-        Uses the scene_registry to find a scene factory, inspects its constructor
-        signature to determine required parameters (context, switch_scene_callback,
-        optional exit_callback), then activates the new scene.
+        The scene replaces the whole stack, closing any overlays. A cached
+        scene is activated at once. Otherwise the scene is prepared in the
+        background and the current scene stays visible under a loading
+        overlay until update() finalizes the switch. If nothing needs
+        preparing, the scene is built and activated right away.
 
         Args:
             key (str): Registry key for the desired scene.
         """
-        # Retrieve from cache if already created
+        self._open(key, push=False)
+
+    def push_scene(self, key: str) -> None:
+        """
+        Open a scene on top of the current one, e.g. a pause menu or dialog.
+
+        Args:
+            key (str): Registry key of the overlay scene.
+        """
+        if self.scene_cache.get(key) in self.stack:
+            logger.warning("Scene '%s' is already on the stack.", key)
+            return
+        self._open(key, push=True)
+
+    def pop_scene(self) -> None:
+        """Close the top scene and return to the one below it."""
+        if len(self.stack) < 2:
+            logger.warning("Cannot pop the last scene.")
+            return
+        self._end_transition()
+        scene = self.stack.pop()
+        self._forget_snapshot(scene)
+        # The revealed scene draws live again
+        self._forget_snapshot(self.stack[-1])
+        self.context.ui_manager = self.stack[-1].ui
+        self._refresh_pointer(self.stack[-1].ui)
+        logger.debug(f"Popped scene: {scene}")
+
+    def toggle_overlay(self, key: str) -> None:
+        """
+        Push the overlay scene, or pop it if it is on top already.
+
+        Args:
+            key (str): Registry key of the overlay scene.
+        """
+        if self.current_key == key:
+            self.pop_scene()
+        elif self.loading is None and self.stack:
+            self.push_scene(key)
+
+    def _open(self, key: str, push: bool) -> None:
+        """Switch to or push a scene, preparing it first if needed."""
         scene = self.scene_cache.get(key)
-        if scene is None:
-            # Lookup factory class for this scene key
-            SceneFactory = scene_registry.get(key)
-            if not SceneFactory:
-                logger.warning(f"Scene '{key}' not found in registry.")
-                return
+        if scene is not None:
+            self.loading = None
+            self._show(scene, push)
+            return
+        if key not in scene_registry:
+            logger.warning(f"Scene '{key}' not found in registry.")
+            return
+
+        self.loading = key
+        self._loading_push = push
+        if self._start_prepare(key).done():
+            self._finish_loading()
+        else:
+            logger.debug("Preparing scene '%s' in the background", key)
+
+    def prewarm(self, keys: Iterable[str]) -> None:
+        """
+        Queue scenes to be prepared and built during idle frames.
+
+        Args:
+            keys (Iterable[str]): Registry keys of likely next scenes.
+        """
+        for key in keys:
+            if key in scene_registry and key not in self.scene_cache and key not in self._prewarm:
+                self._prewarm.append(key)
+
+    def _start_prepare(self, key: str) -> Future:
+        """
+        Start (or reuse) the background preparation of a scene.
+
+        Args:
+            key (str): Registry key of the scene.
+
+        Returns:
+            Future: Resolves to the scene's prepared data (or None).
+        """
+        future = self._pending.get(key)
+        if future is not None:
+            return future
+        factory = scene_registry[key]
+        fonts = [spec for spec in font_cache.configured_fonts() if not font_cache.is_cached(*spec)]
+        if not fonts and getattr(factory, "prepare", None) is None:
+            # Nothing to do off the main thread
+            future = Future()
+            future.set_result(None)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="scene-prepare"
+                )
+            future = self._executor.submit(self._prepare, factory, fonts)
+        self._pending[key] = future
+        return future
+
+    def _prepare(self, factory: type, fonts: list) -> Any:
+        """
+        Worker-thread part of building a scene.
+
+        Args:
+            factory (type): Scene class.
+            fonts (list): (name, size) of fonts to create.
+
+        Returns:
+            Any: Result of the scene's prepare(context), if it defines one.
+        """
+        font_cache.warm(fonts)
+        prepare = getattr(factory, "prepare", None)
+        return prepare(self.context) if prepare is not None else None
+
+    def _build(self, key: str) -> Optional[object]:
+        """
+        Main-thread part of building a scene: construct and cache it.
+
+        Args:
+            key (str): Registry key whose preparation has finished.
+
+        Returns:
+            object | None: The scene, or None if preparation or construction failed.
+        """
+        future = self._pending.pop(key)
+        SceneFactory = scene_registry[key]
+        try:
+            prepared = future.result()
 
             # Prepare constructor arguments
             kwargs = {
                 'context': self.context,
                 'switch_scene_callback': self.switch_scene,
             }
-            # Inspect constructor to inject exit callback if required
+            # Inspect constructor to inject optional arguments it accepts
             sig = inspect.signature(SceneFactory.__init__)
             if 'exit_callback' in sig.parameters:
                 kwargs['exit_callback'] = self.app.exit_game
+            if 'pop_scene_callback' in sig.parameters:
+                kwargs['pop_scene_callback'] = self.pop_scene
+            if 'prepared' in sig.parameters:
+                kwargs['prepared'] = prepared
 
-            # Instantiate the scene and cache it
-            scene = SceneFactory(**kwargs)            
-            self.scene_cache[key] = scene
-            
-        self.context.ui_manager = scene.ui
-        # Activate the scene
-        self._activate(scene)
+            scene = SceneFactory(**kwargs)
+        except Exception:
+            logger.exception("Failed to build scene '%s'.", key)
+            return None
+        self.scene_cache[key] = scene
+        self._keys[id(scene)] = key
+        return scene
+
+    def _finish_loading(self) -> None:
+        """Build the scene being loaded and activate it."""
+        key, self.loading = self.loading, None
+        scene = self._build(key)
+        if scene is not None:
+            self._show(scene, self._loading_push)
 
-    def _activate(self, scene: object) -> None:
+    def _show(self, scene: object, push: bool = False) -> None:
         """
-        Set the provided scene as the current active scene.
+        Make the scene current, on top of the stack or replacing it.
 
         Args:
             scene: The scene instance to activate.
+            push (bool): Keep the scenes below as background.
         """
-        self.current_scene = scene
-        logger.debug(f"Switched to scene: {scene}")
+        if push:
+            # The cached incoming frame would hide the overlay
+            self._end_transition()
+            if self.stack:
+                # The covered scene is drawn from a snapshot from now on
+                self._stale.add(id(self.stack[-1]))
+        else:
+            if self.stack and self.stack[-1] is not scene:
+                self._begin_transition(list(self.stack))
+            for old in self.stack:
+                self._forget_snapshot(old)
+            self.stack.clear()
+        self.stack.append(scene)
+        self.context.ui_manager = scene.ui
+        self._refresh_pointer(scene.ui)
+        logger.debug(f"{'Pushed' if push else 'Switched to'} scene: {scene}")
+
+    @staticmethod
+    def _refresh_pointer(ui: object) -> None:
+        """Let a newly shown UI resolve hover for the current pointer position."""
+        pointer_moved = getattr(ui, "pointer_moved", None)
+        if pointer_moved is not None and pygame.display.get_init():
+            pointer_moved(pygame.mouse.get_pos() if pygame.mouse.get_focused() else None)
+
+    def _forget_snapshot(self, scene: object) -> None:
+        """Drop a scene's snapshot and background timing."""
+        self._snapshots.pop(id(scene), None)
+        self._stale.discard(id(scene))
+        self._background_elapsed.pop(id(scene), None)
+
+    def _begin_transition(self, outgoing: List[object]) -> None:
+        """
+        Start the configured transition away from the given stack.
+
+        Args:
+            outgoing (List[object]): The stack being replaced.
+        """
+        self.transition = create_transition(Config.scenes.get("transition"))
+        self._outgoing = outgoing if self.transition is not None else []
+
+    def _end_transition(self) -> None:
+        """Finish the running transition, releasing its surfaces."""
+        self.transition = None
+        self._outgoing = []
+
+    def _idle_step(self) -> None:
+        """Advance prewarming by one step: start or finish one preparation."""
+        while self._prewarm and self._prewarm[0] in self.scene_cache:
+            self._prewarm.popleft()
+        if not self._prewarm:
+            return
+        key = self._prewarm[0]
+        if self._start_prepare(key).done():
+            self._prewarm.popleft()
+            if self._build(key) is not None:
+                logger.debug("Prewarmed scene '%s'", key)
+
+    @staticmethod
+    def _opaque_start(stack: List[object]) -> int:
+        """Index of the topmost opaque scene; nothing below it is visible."""
+        start = len(stack) - 1
+        while start > 0 and not getattr(stack[start], "opaque", True):
+            start -= 1
+        return start
+
+    def _render_once(self, stack: List[object], size: tuple) -> pygame.Surface:
+        """
+        Draw a scene stack into a new off-screen surface.
+
+        Args:
+            stack (List[object]): Scenes, bottom to top.
+            size (tuple): Size of the target surface.
+
+        Returns:
+            pygame.Surface: The rendered frame.
+        """
+        frame = pygame.Surface(size)
+        if stack:
+            for scene in stack[self._opaque_start(stack):]:
+                scene.draw(frame)
+        return frame
+
+    def _snapshot(self, scene: object, size: tuple) -> pygame.Surface:
+        """
+        Return a covered scene's snapshot, redrawing it if stale.
+
+        Args:
+            scene: A scene below the top of the stack.
+            size (tuple): Size of the target surface.
+
+        Returns:
+            pygame.Surface: The scene as last drawn.
+        """
+        snapshot = self._snapshots.get(id(scene))
+        if snapshot is None or snapshot.get_size() != size:
+            flags = 0 if getattr(scene, "opaque", True) else pygame.SRCALPHA
+            snapshot = pygame.Surface(size, flags)
+            self._snapshots[id(scene)] = snapshot
+            self._stale.add(id(scene))
+        if id(scene) in self._stale:
+            if not getattr(scene, "opaque", True):
+                snapshot.fill((0, 0, 0, 0))
+            scene.draw(snapshot)
+            self._stale.discard(id(scene))
+        return snapshot
+
+    def shutdown(self) -> None:
+        """Stop the preparation worker, discarding queued work."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     def handle_event(self, event: object) -> None:
         """
@@ -93,22 +406,85 @@ class SceneManager:
         Args:
             event: A pygame.event.Event instance representing user input or system events.
         """
-        if self.current_scene:
+        # Input is held back while the next scene is loading
+        if self.current_scene and self.loading is None:
             self.current_scene.handle_event(event)
 
-    def update(self) -> None:
+    def update(self, dt: float = 0.0) -> None:
         """
         Update the logic of the current scene (called once per frame).
+
+        Covered scenes are updated according to their background_update
+        policy. Also finalizes a pending scene switch once its preparation
+        is done, and otherwise uses the frame to prewarm scenes.
+
+        Args:
+            dt (float): Frame delta time in seconds, for reduced-rate updates.
         """
+        if self.loading is not None:
+            if self._pending[self.loading].done():
+                self._finish_loading()
+        elif self._prewarm:
+            self._idle_step()
+        for scene in self.stack[:-1]:
+            if self._update_background(scene, dt):
+                self._stale.add(id(scene))
         if self.current_scene:
             self.current_scene.update()
+        if self.transition is not None and self.transition.captured:
+            self.transition.advance(dt)
+            if self.transition.done:
+                self._end_transition()
+
+    def _update_background(self, scene: object, dt: float) -> bool:
+        """
+        Update a covered scene if its policy says so.
+
+        Args:
+            scene: A scene below the top of the stack.
+            dt (float): Frame delta time in seconds.
+
+        Returns:
+            bool: True if the scene was updated (its snapshot is then stale).
+        """
+        policy = getattr(scene, "background_update", BACKGROUND_NONE)
+        if policy == BACKGROUND_FULL:
+            scene.update()
+            return True
+        if policy != BACKGROUND_REDUCED:
+            return False
+        interval = 1.0 / getattr(scene, "background_hz", DEFAULT_BACKGROUND_HZ)
+        elapsed = self._background_elapsed.get(id(scene), 0.0) + dt
+        # Small tolerance so summed frame times hit the interval exactly
+        if elapsed < interval - 1e-9:
+            self._background_elapsed[id(scene)] = elapsed
+            return False
+        # Keep the remainder, but never catch up more than one step
+        self._background_elapsed[id(scene)] = min(max(elapsed - interval, 0.0), interval)
+        scene.update()
+        return True
 
     def draw(self, surface: object) -> None:
         """
-        Render the current scene onto the provided Pygame surface.
+        Render the scene stack onto the provided Pygame surface.
+
+        The top scene draws live. Covered scenes down to the topmost opaque
+        one are blitted from snapshots, which are redrawn only when stale.
 
         Args:
             surface: pygame.Surface where the scene should draw its contents.
         """
-        if self.current_scene:
-            self.current_scene.draw(surface)
+        if self.transition is not None:
+            if not self.transition.captured:
+                size = surface.get_size()
+                self.transition.outgoing = self._render_once(self._outgoing, size)
+                self.transition.incoming = self._render_once(self.stack, size)
+                self._outgoing = []
+            self.transition.draw(surface)
+        elif self.stack:
+            start = self._opaque_start(self.stack)
+            for scene in self.stack[start:-1]:
+                surface.blit(self._snapshot(scene, surface.get_size()), (0, 0))
+            self.stack[-1].draw(surface)
+        if self.loading is not None:
+            self.loading_overlay.draw(surface)
@@ -0,0 +1,145 @@
+"""
+Module core/scene_transitions.py
+
+Animated transitions between scenes. A transition never draws the scenes
+itself: SceneManager renders the outgoing and the incoming scene once each
+into off-screen surfaces, and the transition only blends those two cached
+surfaces until it has run for its duration.
+
+Transitions are registered by name in TRANSITIONS so the config can select
+them (`scenes.transition.type`).
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+def ease_in_out(t: float) -> float:
+    """Smoothstep easing of a progress value in [0, 1]."""
+    return t * t * (3.0 - 2.0 * t)
+
+
+class SceneTransition(ABC):
+    """
+    Base class for transitions between two cached scene surfaces.
+
+    Attributes:
+        duration (float): Length of the transition in seconds.
+        elapsed (float): Time the transition has run so far.
+        outgoing (pygame.Surface | None): Snapshot of the previous scene.
+        incoming (pygame.Surface | None): Snapshot of the next scene.
+    """
+    def __init__(self, duration: float = 0.3) -> None:
+        """
+        Args:
+            duration (float): Length of the transition in seconds.
+        """
+        self.duration = max(duration, 0.0)
+        self.elapsed = 0.0
+        self.outgoing: Optional[pygame.Surface] = None
+        self.incoming: Optional[pygame.Surface] = None
+
+    @property
+    def progress(self) -> float:
+        """Eased progress from 0 (outgoing only) to 1 (incoming only)."""
+        if self.duration <= 0:
+            return 1.0
+        return ease_in_out(min(self.elapsed / self.duration, 1.0))
+
+    @property
+    def done(self) -> bool:
+        """True once the transition has run for its duration."""
+        return self.elapsed >= self.duration
+
+    @property
+    def captured(self) -> bool:
+        """True once both scene surfaces have been rendered."""
+        return self.outgoing is not None and self.incoming is not None
+
+    def advance(self, dt: float) -> None:
+        """
+        Move the transition forward in time.
+
+        Args:
+            dt (float): Frame delta time in seconds.
+        """
+        self.elapsed += dt
+
+    @abstractmethod
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Blend the cached surfaces onto the target at the current progress.
+
+        Args:
+            surface (pygame.Surface): Target surface, e.g. the screen.
+        """
+
+
+class CrossfadeTransition(SceneTransition):
+    """Fades the incoming scene in over the outgoing one."""
+
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.blit(self.outgoing, (0, 0))
+        self.incoming.set_alpha(int(255 * self.progress))
+        surface.blit(self.incoming, (0, 0))
+
+
+class SlideTransition(SceneTransition):
+    """
+    Slides the incoming scene in, pushing the outgoing one out.
+
+    Attributes:
+        direction (str): "left" or "right", the direction the scenes move.
+    """
+    def __init__(self, duration: float = 0.3, direction: str = "left") -> None:
+        """
+        Args:
+            duration (float): Length of the transition in seconds.
+            direction (str): "left" or "right".
+        """
+        super().__init__(duration)
+        self.direction = direction
+
+    def draw(self, surface: pygame.Surface) -> None:
+        width = surface.get_width()
+        offset = int(width * self.progress)
+        sign = -1 if self.direction == "left" else 1
+        surface.blit(self.outgoing, (sign * offset, 0))
+        surface.blit(self.incoming, (sign * (offset - width), 0))
+
+
+# Transition classes by config name
+TRANSITIONS: Dict[str, type] = {
+    "crossfade": CrossfadeTransition,
+    "slide": SlideTransition,
+}
+
+
+def create_transition(settings: Optional[dict]) -> Optional[SceneTransition]:
+    """
+    Build a transition from config settings.
+
+    Args:
+        settings (dict, optional): Mapping with `type`, `duration` and any
+            extra arguments of the transition class (e.g. `direction`).
+
+    Returns:
+        SceneTransition | None: The transition, or None for "none" or an
+        unknown type.
+    """
+    if not settings:
+        return None
+    options = dict(settings)
+    name = options.pop("type", "none")
+    if name == "none":
+        return None
+    cls = TRANSITIONS.get(name)
+    if cls is None:
+        logger.warning("Unknown scene transition '%s'; switching instantly.", name)
+        return None
+    return cls(**options)
@@ -0,0 +1,211 @@
+"""
+Module core/services.py
+
+Implements ServiceRegistry: a lookup table of shared services on the game
+context. Providers are registered under a name or an interface type, either
+as ready objects or as lazy factories that are built on first lookup and
+cached. Registrations can be attributed to an owner (e.g. a plugin name) so
+they are dropped together when that plugin is unloaded.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+# Marker for "no default given" in ServiceRegistry.get()
+_REQUIRED = object()
+
+
+class _Service:
+    """A registered provider and, once built, its cached value."""
+    __slots__ = ("provider", "lazy", "built", "building", "value", "owner")
+
+    def __init__(self, provider: Any, lazy: bool, owner: Any) -> None:
+        self.provider = provider
+        self.lazy = lazy
+        self.built = not lazy
+        self.building = False
+        self.value = None if lazy else provider
+        self.owner = owner
+
+
+def _describe(key: Hashable) -> str:
+    """Readable name of a service key for log and error messages."""
+    return key.__name__ if isinstance(key, type) else str(key)
+
+
+class ServiceRegistry:
+    """
+    Registry of named or typed services with lazy providers.
+
+    Keys are strings or types. A service registered under a type must be an
+    instance of it; this is checked on registration, or when a lazy provider
+    is built.
+    """
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._services: Dict[Hashable, _Service] = {}
+        # Keys per owner, and the stack of owners currently in scope
+        self._owned: Dict[Any, List[Hashable]] = {}
+        self._owner_stack: List[Any] = []
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._services
+
+    def keys(self) -> List[Hashable]:
+        """Return all registered service keys."""
+        return list(self._services)
+
+    def register(
+        self,
+        key: Hashable,
+        provider: Any,
+        lazy: bool = False,
+        owner: Any = None
+    ) -> None:
+        """
+        Register (or replace) the provider of a service.
+
+        Args:
+            key (Hashable): Service name or interface type.
+            provider (Any): The service object, or with `lazy` a zero-argument
+                factory that builds it on first lookup.
+            lazy (bool): Treat `provider` as a factory.
+            owner (Any, optional): Owner key; defaults to the innermost
+                owned_by() scope, if any.
+        """
+        if not lazy:
+            self._check_type(key, provider)
+        if owner is None and self._owner_stack:
+            owner = self._owner_stack[-1]
+        previous = self._services.get(key)
+        if previous is not None:
+            self._forget_owner(key, previous.owner)
+            logger.debug("Replacing service %s", _describe(key))
+        self._services[key] = _Service(provider, lazy, owner)
+        if owner is not None:
+            self._owned.setdefault(owner, []).append(key)
+        logger.debug("Registered %sservice %s", "lazy " if lazy else "", _describe(key))
+
+    def get(self, key: Hashable, default: Any = _REQUIRED) -> Any:
+        """
+        Look up a service, building and caching it if it is lazy.
+
+        Args:
+            key (Hashable): Service name or interface type.
+            default (Any, optional): Returned if the service is not registered.
+
+        Returns:
+            Any: The service.
+
+        Raises:
+            KeyError: If the service is not registered and no default is given.
+            LookupError: If a lazy provider requests its own service.
+        """
+        service = self._services.get(key)
+        if service is None:
+            if default is _REQUIRED:
+                raise KeyError(f"No service registered for '{_describe(key)}'")
+            return default
+        if service.built:
+            return service.value
+        if service.building:
+            raise LookupError(
+                f"Service '{_describe(key)}' was requested while it is being built"
+            )
+
+        service.building = True
+        try:
+            value = service.provider()
+        finally:
+            service.building = False
+        if self._services.get(key) is not service:
+            # The factory registered a replacement, e.g. by loading a plugin
+            return self.get(key, default)
+        if value is None:
+            raise LookupError(f"Lazy provider of '{_describe(key)}' returned None")
+        self._check_type(key, value)
+        service.value = value
+        service.built = True
+        logger.debug("Built lazy service %s", _describe(key))
+        return value
+
+    def get_provider(self, key: Hashable) -> Any:
+        """
+        Return the registered provider of a service without building it.
+
+        Args:
+            key (Hashable): Service name or interface type.
+
+        Returns:
+            Any: The object or factory passed to register(), or None.
+        """
+        service = self._services.get(key)
+        return service.provider if service is not None else None
+
+    def is_built(self, key: Hashable) -> bool:
+        """Return True if the service is registered and not a pending lazy provider."""
+        service = self._services.get(key)
+        return service is not None and service.built
+
+    def unregister(self, key: Hashable) -> None:
+        """
+        Remove a service.
+
+        Args:
+            key (Hashable): Service name or interface type.
+        """
+        service = self._services.pop(key, None)
+        if service is not None:
+            self._forget_owner(key, service.owner)
+            logger.debug("Unregistered service %s", _describe(key))
+
+    @contextmanager
+    def owned_by(self, owner: Any) -> Iterator[None]:
+        """
+        Attribute all registrations made inside the block to an owner.
+
+        Args:
+            owner (Any): Hashable owner key, e.g. a plugin name.
+        """
+        self._owner_stack.append(owner)
+        try:
+            yield
+        finally:
+            self._owner_stack.pop()
+
+    def unregister_owner(self, owner: Any) -> int:
+        """
+        Remove every service registered under an owner.
+
+        Args:
+            owner (Any): Owner key passed to register() or owned_by().
+
+        Returns:
+            int: Number of services removed.
+        """
+        keys = self._owned.pop(owner, [])
+        for key in keys:
+            self._services.pop(key, None)
+        if keys:
+            logger.debug(
+                "Unregistered services of %s: %s", owner, [_describe(k) for k in keys]
+            )
+        return len(keys)
+
+    def _forget_owner(self, key: Hashable, owner: Any) -> None:
+        """Drop `key` from its owner's registrations."""
+        keys = self._owned.get(owner)
+        if keys and key in keys:
+            keys.remove(key)
+
+    @staticmethod
+    def _check_type(key: Hashable, value: Any) -> None:
+        """Ensure services registered under a type are instances of it."""
+        if isinstance(key, type) and not isinstance(value, key):
+            raise TypeError(
+                f"Service '{key.__name__}' must be an instance of it, "
+                f"got {type(value).__name__}"
+            )
@@ -0,0 +1,390 @@
+"""
+Module core/stat_history.py
+
+Provides StatHistory for recording stat values over simulation time.
+Samples are kept in fixed-size, array-backed ring buffers at several
+resolutions (per tick, per day phase, per day) so long sessions use bounded
+memory, and can be streamed to CSV or JSONL files for trend charts and
+balance analysis.
+"""
+
+import csv
+import json
+import logging
+import math
+from array import array
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Resolution names in increasing bucket size; "tick" holds raw samples
+RESOLUTIONS = ("tick", "phase", "day")
+# Aggregates stored per stat for every rollup bucket
+ROLLUP_FIELDS = ("mean", "min", "max")
+
+
+class RingSeries:
+    """
+    Fixed-capacity time series backed by typed float arrays.
+
+    All columns share one timestamp column. Once the buffer is full, new rows
+    overwrite the oldest ones, so memory use never grows past `capacity` rows.
+
+    Attributes:
+        capacity (int): Maximum number of rows kept.
+        times (array): Timestamps (simulation seconds) per slot.
+        columns (Dict[str, array]): Value arrays keyed by column name.
+    """
+    def __init__(self, capacity: int, columns: Iterable[str] = ()) -> None:
+        """
+        Allocate the ring buffer.
+
+        Args:
+            capacity (int): Number of rows to keep; must be positive.
+            columns (Iterable[str], optional): Initial column names.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("RingSeries capacity must be positive")
+        self.capacity = capacity
+        self.times = array("d", [0.0]) * capacity
+        self.columns: Dict[str, array] = {}
+        # Next slot to write and number of valid rows
+        self._head = 0
+        self._count = 0
+        for name in columns:
+            self.add_column(name)
+
+    def __len__(self) -> int:
+        """Return the number of valid rows currently stored."""
+        return self._count
+
+    def add_column(self, name: str) -> None:
+        """
+        Add a column; rows recorded before it existed read as NaN.
+
+        Args:
+            name (str): Column name.
+        """
+        if name not in self.columns:
+            self.columns[name] = array("d", [math.nan]) * self.capacity
+
+    def remove_column(self, name: str) -> None:
+        """
+        Drop a column and its stored values, if present.
+
+        Args:
+            name (str): Column name.
+        """
+        self.columns.pop(name, None)
+
+    def append(self, t: float, values: Dict[str, float]) -> None:
+        """
+        Write one row, overwriting the oldest row when full.
+
+        Args:
+            t (float): Timestamp of the row.
+            values (Dict[str, float]): Column values; missing columns store NaN.
+        """
+        i = self._head
+        self.times[i] = t
+        for name, col in self.columns.items():
+            col[i] = values.get(name, math.nan)
+        self._head = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self) -> None:
+        """Forget all stored rows without reallocating the arrays."""
+        self._head = 0
+        self._count = 0
+
+    def _indices(self) -> Iterator[int]:
+        """Yield slot indices from oldest to newest row."""
+        start = (self._head - self._count) % self.capacity
+        for n in range(self._count):
+            yield (start + n) % self.capacity
+
+    def rows(self, columns: Optional[List[str]] = None) -> Iterator[Tuple[float, List[float]]]:
+        """
+        Iterate stored rows in chronological order.
+
+        Args:
+            columns (List[str], optional): Columns to include; defaults to all.
+
+        Yields:
+            Tuple[float, List[float]]: Timestamp and the selected column values.
+        """
+        names = list(self.columns) if columns is None else columns
+        cols = [self.columns[name] for name in names]
+        for i in self._indices():
+            yield self.times[i], [col[i] for col in cols]
+
+    def column(self, name: str) -> Tuple[List[float], List[float]]:
+        """
+        Copy one column out in chronological order, e.g. for drawing a chart.
+
+        Args:
+            name (str): Column name.
+
+        Returns:
+            Tuple[List[float], List[float]]: Timestamps and values.
+        """
+        col = self.columns[name]
+        indices = list(self._indices())
+        return [self.times[i] for i in indices], [col[i] for i in indices]
+
+
+class StatHistory:
+    """
+    Multi-resolution history of stat values.
+
+    Every recorded tick sample is written to the tick ring and folded into
+    running accumulators for the coarser resolutions. Calling `rollup()` for
+    "phase" or "day" closes the current bucket and stores its mean, min and
+    max per stat.
+
+    Attributes:
+        tick_interval (float): Minimum simulation time between tick samples.
+        series (Dict[str, RingSeries]): Ring buffers keyed by resolution name.
+    """
+    def __init__(
+        self,
+        stat_keys: Iterable[str],
+        tick_capacity: int = 3600,
+        phase_capacity: int = 512,
+        day_capacity: int = 365,
+        tick_interval: float = 0.0
+    ) -> None:
+        """
+        Create ring buffers for the given stats.
+
+        Args:
+            stat_keys (Iterable[str]): Stats to record.
+            tick_capacity (int, optional): Raw samples kept per stat.
+            phase_capacity (int, optional): Day-phase rollups kept per stat.
+            day_capacity (int, optional): Daily rollups kept per stat.
+            tick_interval (float, optional): Seconds of simulation time between
+                tick samples; 0 samples on every call to `record()`.
+        """
+        self.tick_interval = tick_interval
+        self._keys: List[str] = list(stat_keys)
+        self.series: Dict[str, RingSeries] = {
+            "tick": RingSeries(tick_capacity, self._keys),
+            "phase": RingSeries(phase_capacity, self._rollup_columns(self._keys)),
+            "day": RingSeries(day_capacity, self._rollup_columns(self._keys)),
+        }
+        # Running [sum, count, min, max] per stat for each open rollup bucket
+        self._acc: Dict[str, Dict[str, List[float]]] = {
+            res: {key: self._empty_acc() for key in self._keys}
+            for res in RESOLUTIONS[1:]
+        }
+        self._last_sample: Optional[float] = None
+        logger.debug("StatHistory initialized for stats: %s", self._keys)
+
+    @staticmethod
+    def _rollup_columns(keys: Iterable[str]) -> List[str]:
+        """Return rollup column names ("<stat>.<field>") for the given stats."""
+        return [f"{key}.{field}" for key in keys for field in ROLLUP_FIELDS]
+
+    @staticmethod
+    def _empty_acc() -> List[float]:
+        """Return a fresh [sum, count, min, max] accumulator."""
+        return [0.0, 0, math.inf, -math.inf]
+
+    def add_stat(self, key: str) -> None:
+        """
+        Start recording a stat that did not exist when the history was created.
+
+        Args:
+            key (str): Stat identifier.
+        """
+        if key in self._keys:
+            return
+        self._keys.append(key)
+        self.series["tick"].add_column(key)
+        for res in RESOLUTIONS[1:]:
+            for name in self._rollup_columns([key]):
+                self.series[res].add_column(name)
+            self._acc[res][key] = self._empty_acc()
+
+    def remove_stat(self, key: str) -> None:
+        """
+        Stop recording a stat and drop its stored samples.
+
+        Args:
+            key (str): Stat identifier.
+        """
+        if key not in self._keys:
+            return
+        self._keys.remove(key)
+        self.series["tick"].remove_column(key)
+        for res in RESOLUTIONS[1:]:
+            for name in self._rollup_columns([key]):
+                self.series[res].remove_column(name)
+            self._acc[res].pop(key, None)
+
+    def record(self, sim_time: float, values: Dict[str, float]) -> bool:
+        """
+        Record a tick sample if the tick interval has elapsed.
+
+        Args:
+            sim_time (float): Current simulation time in seconds.
+            values (Dict[str, float]): Current stat values keyed by stat name.
+
+        Returns:
+            bool: True if a sample was stored.
+        """
+        last = self._last_sample
+        if last is not None and sim_time - last < self.tick_interval:
+            return False
+        self._last_sample = sim_time
+        self.series["tick"].append(sim_time, values)
+
+        # Fold the sample into every open rollup bucket
+        for acc in self._acc.values():
+            for key, bucket in acc.items():
+                value = values.get(key)
+                if value is None:
+                    continue
+                bucket[0] += value
+                bucket[1] += 1
+                if value < bucket[2]:
+                    bucket[2] = value
+                if value > bucket[3]:
+                    bucket[3] = value
+        return True
+
+    def rollup(self, resolution: str, sim_time: float) -> None:
+        """
+        Close the current bucket of a rollup resolution and store its aggregates.
+
+        Empty buckets (no samples since the last rollup) are skipped.
+
+        Args:
+            resolution (str): "phase" or "day".
+            sim_time (float): Simulation time stamped on the bucket.
+
+        Raises:
+            ValueError: If resolution is not a rollup resolution.
+        """
+        if resolution not in self._acc:
+            raise ValueError(f"Unknown rollup resolution '{resolution}'")
+        acc = self._acc[resolution]
+        row: Dict[str, float] = {}
+        for key, (total, count, low, high) in acc.items():
+            if count:
+                row[f"{key}.mean"] = total / count
+                row[f"{key}.min"] = low
+                row[f"{key}.max"] = high
+            acc[key] = self._empty_acc()
+        if row:
+            self.series[resolution].append(sim_time, row)
+            logger.debug("StatHistory rolled up %s bucket at %.2f", resolution, sim_time)
+
+    def get_series(
+        self,
+        key: str,
+        resolution: str = "tick",
+        field: str = "mean"
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Return timestamps and values for one stat, e.g. to draw a trend chart.
+
+        Args:
+            key (str): Stat identifier.
+            resolution (str, optional): "tick", "phase" or "day".
+            field (str, optional): Rollup aggregate ("mean", "min", "max");
+                ignored for the tick resolution.
+
+        Returns:
+            Tuple[List[float], List[float]]: Timestamps and values, oldest first.
+        """
+        column = key if resolution == "tick" else f"{key}.{field}"
+        return self.series[resolution].column(column)
+
+    def _select_columns(self, resolution: str, stats: Optional[Iterable[str]]) -> List[str]:
+        """Resolve the column names to export for the given stats."""
+        keys = self._keys if stats is None else [k for k in stats if k in self._keys]
+        if resolution == "tick":
+            return list(keys)
+        return self._rollup_columns(keys)
+
+    def export_csv(
+        self,
+        target: Any,
+        resolution: str = "tick",
+        stats: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Stream one resolution to CSV, one row per sample.
+
+        Args:
+            target (str | Path | TextIO): File path or writable text stream.
+            resolution (str, optional): "tick", "phase" or "day".
+            stats (Iterable[str], optional): Stats to include; defaults to all.
+
+        Returns:
+            int: Number of data rows written.
+        """
+        columns = self._select_columns(resolution, stats)
+        with _open_target(target) as fp:
+            writer = csv.writer(fp)
+            writer.writerow(["time", *columns])
+            count = 0
+            for t, values in self.series[resolution].rows(columns):
+                writer.writerow([t, *("" if math.isnan(v) else v for v in values)])
+                count += 1
+        logger.info("Exported %d %s rows to CSV.", count, resolution)
+        return count
+
+    def export_jsonl(
+        self,
+        target: Any,
+        resolution: str = "tick",
+        stats: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Stream one resolution to JSON Lines, one object per sample.
+
+        Args:
+            target (str | Path | TextIO): File path or writable text stream.
+            resolution (str, optional): "tick", "phase" or "day".
+            stats (Iterable[str], optional): Stats to include; defaults to all.
+
+        Returns:
+            int: Number of lines written.
+        """
+        columns = self._select_columns(resolution, stats)
+        with _open_target(target) as fp:
+            count = 0
+            for t, values in self.series[resolution].rows(columns):
+                record: Dict[str, Any] = {"time": t}
+                for name, value in zip(columns, values):
+                    # JSON has no NaN; missing samples become null
+                    record[name] = None if math.isnan(value) else value
+                fp.write(json.dumps(record))
+                fp.write("\n")
+                count += 1
+        logger.info("Exported %d %s rows to JSONL.", count, resolution)
+        return count
+
+
+@contextmanager
+def _open_target(target: Any) -> Iterator[Any]:
+    """
+    Yield a writable text stream for a file path or an already open stream.
+
+    Paths are opened and closed here; streams passed in are left open.
+
+    Args:
+        target (str | Path | TextIO): Destination of the export.
+    """
+    if hasattr(target, "write"):
+        yield target
+        return
+    with open(target, "w", encoding="utf-8", newline="") as fp:
+        yield fp
@@ -3,17 +3,26 @@ Module core/stat_manager.py
 
 Provides StatManager for loading, tracking, and updating game statistics.
 Loads stat configurations from JSON, clamps values within defined ranges,
-and dispatches events via the EventManager on stat changes.
+and dispatches events via the EventManager on stat changes. Supports timed
+additive/multiplicative modifiers on top of base values, indexed threshold
+callbacks on effective values, optional live reload of the config file, and
+optionally records each stat's value over simulation time in a StatHistory.
 """
 
+import heapq
+import itertools
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from collections import namedtuple
 
 from core.events.event_types import EventType
 from core.decorators import ensure_key
+from core.file_watcher import FileWatcher
+from core.stat_history import StatHistory
+from core.stat_modifiers import StatModifier, apply_modifiers
+from core.stat_thresholds import Threshold, ThresholdIndex
 import setup.config as Config
 
 logger = logging.getLogger(__name__)
@@ -28,7 +37,10 @@ class StatManager:
 
     Attributes:
         event_manager (EventManager): Dispatcher for stat change events.
-        stats (Dict[str, float]): Current values of all managed statistics.
+        stats (Dict[str, float]): Current base values of all managed statistics
+            (before modifiers).
+        sim_time (float): Simulation time in seconds, advanced by update().
+        history (StatHistory | None): Value history, if enabled.
     """
     def __init__(
         self,
@@ -47,19 +59,58 @@ class StatManager:
         # Determine config file path, use default if not provided
         self.config_path = config_path or Config.paths["stats_config"]
 
-        # Load and parse stat configuration JSON
+        # Build internal mapping from stat key to StatConfig
+        self._stat_configs: Dict[str, StatConfig] = self._load_configs() or {}
+
+        # Initialize current stat values based on initial config
+        self.stats: Dict[str, float] = {
+            k: sc.initial for k, sc in self._stat_configs.items()
+        }
+        # Map stat keys to event types for dispatching
+        self._event_map: Dict[str, EventType] = {
+            k: sc.event_type for k, sc in self._stat_configs.items()
+        }
+
+        # Effective values (base with modifiers applied), cached until
+        # the base value or the stat's modifier stack changes
+        self._effective: Dict[str, float] = dict(self.stats)
+        # Active modifiers per stat; keys are removed when their stack empties
+        self._modifiers: Dict[str, List[StatModifier]] = {}
+        # Min-heap of (expires_at, seq, modifier) for timed modifiers
+        self._expiry_heap: List[Tuple[float, int, StatModifier]] = []
+        self._expiry_seq = itertools.count()
+        # Sorted threshold rules per stat, checked on effective value changes
+        self._thresholds = ThresholdIndex()
+
+        # Simulation clock and optional value history
+        self.sim_time = 0.0
+        self.history: Optional[StatHistory] = None
+        # Resolved handles, one per stat key
+        self._handles: Dict[str, "StatHandle"] = {}
+        # Config file watcher, if live reload is enabled
+        self._watcher: Optional[FileWatcher] = None
+
+        logger.debug("StatManager initialized with stats: %s", self.stats)
+
+    def _load_configs(self) -> Optional[Dict[str, StatConfig]]:
+        """
+        Read and parse the stat configuration JSON.
+
+        Returns:
+            Dict[str, StatConfig] | None: Parsed configs, or None if the file
+            could not be read or decoded.
+        """
         try:
             with open(self.config_path, "r", encoding="utf-8") as f:
                 raw: Dict[str, Any] = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(
-                f"Error loading stats config from {self.config_path}: {e}",
+                "Error loading stats config from %s: %s", self.config_path, e,
                 exc_info=True
             )
-            raw = {}
+            return None
 
-        # Build internal mapping from stat key to StatConfig
-        self._stat_configs: Dict[str, StatConfig] = {}
+        configs: Dict[str, StatConfig] = {}
         for key, cfg in raw.items():
             # Determine associated event type, if configured
             ev_type = None
@@ -67,32 +118,174 @@ class StatManager:
                 ev_type = EventType[cfg.get("event_type")]
             except Exception:
                 logger.error(
-                    f"Unknown event_type '{cfg.get('event_type')}' for stat '{key}'",
+                    "Unknown event_type '%s' for stat '%s'", cfg.get("event_type"), key,
                     exc_info=True
                 )
             # Store config with defaults for missing fields
-            self._stat_configs[key] = StatConfig(
+            configs[key] = StatConfig(
                 initial=cfg.get("initial", 0),
                 min=cfg.get("min", 0),
                 max=cfg.get("max", cfg.get("initial", 0)),
                 event_type=ev_type
             )
+        return configs
 
-        # Initialize current stat values based on initial config
-        self.stats: Dict[str, float] = {
-            k: sc.initial for k, sc in self._stat_configs.items()
-        }
-        # Map stat keys to event types for dispatching
-        self._event_map: Dict[str, EventType] = {
-            k: sc.event_type for k, sc in self._stat_configs.items()
-        }
+    def enable_live_reload(self, interval: float = 1.0, debounce: float = 0.25) -> None:
+        """
+        Watch the stat config file and apply edits while the game is running.
+
+        The file is polled from update(); see reload_config() for how changes
+        are merged into the current state.
+
+        Args:
+            interval (float, optional): Seconds between mtime checks.
+            debounce (float, optional): Settle time after a detected change.
+        """
+        if self._watcher is None:
+            self._watcher = FileWatcher(
+                self.config_path, lambda path: self.reload_config(),
+                interval=interval, debounce=debounce
+            )
+            logger.info("Live reload enabled for %s", self.config_path)
+
+    def reload_config(self) -> bool:
+        """
+        Re-read the stat config and migrate the current state to it.
+
+        New stats start at their initial value, removed stats are dropped
+        together with their modifiers, thresholds, handles and history, and
+        existing stats keep their current value re-clamped to the new bounds.
+        Change events are dispatched only for stats whose effective value
+        changed. A config that fails to load leaves the state untouched.
+
+        Returns:
+            bool: True if the new config was applied.
+        """
+        new_configs = self._load_configs()
+        if new_configs is None:
+            logger.warning("Stats config reload skipped; keeping current stats.")
+            return False
+        old_configs = self._stat_configs
+        self._stat_configs = new_configs
+
+        for key in old_configs.keys() - new_configs.keys():
+            self._drop_stat(key)
+
+        for key, cfg in new_configs.items():
+            self._event_map[key] = cfg.event_type
+            if key not in old_configs:
+                self.stats[key] = cfg.initial
+                self._effective[key] = cfg.initial
+                if self.history is not None:
+                    self.history.add_stat(key)
+                logger.info("Stat '%s' added by reload.", key)
+                continue
+            if cfg == old_configs[key]:
+                continue
+            self.stats[key] = max(cfg.min, min(cfg.max, self.stats[key]))
+            handle = self._handles.get(key)
+            if handle is not None:
+                handle._min, handle._max = cfg.min, cfg.max
+            self._refresh(key)
+
+        logger.info("Stats config reloaded from %s", self.config_path)
+        return True
+
+    def _drop_stat(self, key: str) -> None:
+        """
+        Remove a stat and everything attached to it.
 
-        logger.debug(f"StatManager initialized with stats: {self.stats}")
+        Args:
+            key (str): The stat identifier.
+        """
+        for mod in self._modifiers.pop(key, ()):
+            mod.active = False
+        self._thresholds.clear(key)
+        self._handles.pop(key, None)
+        self._event_map.pop(key, None)
+        self.stats.pop(key, None)
+        self._effective.pop(key, None)
+        if self.history is not None:
+            self.history.remove_stat(key)
+        logger.info("Stat '%s' removed by reload.", key)
+
+    def enable_history(
+        self,
+        tick_capacity: int = 3600,
+        phase_capacity: int = 512,
+        day_capacity: int = 365,
+        tick_interval: float = 0.0
+    ) -> StatHistory:
+        """
+        Start recording stat values over simulation time.
+
+        Tick samples are taken in update(); phase and day rollups are closed
+        on DAYTIME_CHANGED and DAY_CHANGED events.
+
+        Args:
+            tick_capacity (int, optional): Raw samples kept per stat.
+            phase_capacity (int, optional): Day-phase rollups kept per stat.
+            day_capacity (int, optional): Daily rollups kept per stat.
+            tick_interval (float, optional): Simulation seconds between samples.
+
+        Returns:
+            StatHistory: The active history (existing one if already enabled).
+        """
+        if self.history is not None:
+            return self.history
+        self.history = StatHistory(
+            self.stats.keys(),
+            tick_capacity=tick_capacity,
+            phase_capacity=phase_capacity,
+            day_capacity=day_capacity,
+            tick_interval=tick_interval
+        )
+        self.event_manager.register(EventType.DAYTIME_CHANGED, self._on_phase_changed)
+        self.event_manager.register(EventType.DAY_CHANGED, self._on_day_changed)
+        logger.info("Stat history enabled (tick capacity %d).", tick_capacity)
+        return self.history
+
+    def update(self, dt: float) -> None:
+        """
+        Advance the simulation clock, poll the config watcher, expire due
+        modifiers and record a history sample.
+
+        Only modifiers whose expiry time has been reached are touched; the
+        heap keeps the next expiry at its root.
+
+        Args:
+            dt (float): Elapsed simulation time in seconds.
+        """
+        self.sim_time += dt
+        if self._watcher is not None:
+            self._watcher.poll()
+        heap = self._expiry_heap
+        if heap and heap[0][0] <= self.sim_time:
+            touched: Set[str] = set()
+            while heap and heap[0][0] <= self.sim_time:
+                _, _, mod = heapq.heappop(heap)
+                # Skip entries for modifiers that were removed early
+                if mod.active:
+                    self._detach_modifier(mod)
+                    touched.add(mod.key)
+                    logger.debug("Modifier expired: %s", mod)
+            for key in touched:
+                self._refresh(key)
+        if self.history is not None:
+            self.history.record(self.sim_time, self._effective)
+
+    def _on_phase_changed(self, phase: str) -> None:
+        """Close the current phase bucket of the history."""
+        self.history.rollup("phase", self.sim_time)
+
+    def _on_day_changed(self, day: int) -> None:
+        """Close the current day bucket of the history."""
+        self.history.rollup("day", self.sim_time)
 
     @ensure_key
     def get(self, key: str) -> float:
         """
-        Retrieve the current value of a statistic.
+        Retrieve the current effective value of a statistic (modifiers applied).
 
         Args:
             key (str): The stat identifier.
@@ -100,10 +293,23 @@ class StatManager:
         Returns:
             float: Current value (or 0 if not set).
         """
-        value = self.stats.get(key, 0)
-        logger.debug(f"Getting stat '{key}': {value}")
+        value = self._effective.get(key, 0)
+        logger.debug("Getting stat '%s': %s", key, value)
         return value
 
+    @ensure_key
+    def get_base(self, key: str) -> float:
+        """
+        Retrieve the base value of a statistic, ignoring modifiers.
+
+        Args:
+            key (str): The stat identifier.
+
+        Returns:
+            float: Current base value.
+        """
+        return self.stats[key]
+
     @ensure_key
     def get_max(self, key: str) -> float:
         """
@@ -116,7 +322,7 @@ class StatManager:
             float: Configured maximum value.
         """
         max_value = self._stat_configs[key].max
-        logger.debug(f"Getting max for stat '{key}': {max_value}")
+        logger.debug("Getting max for stat '%s': %s", key, max_value)
         return max_value
 
     @ensure_key
@@ -131,21 +337,21 @@ class StatManager:
             float: Configured minimum value.
         """
         min_value = self._stat_configs[key].min
-        logger.debug(f"Getting min for stat '{key}': {min_value}")
+        logger.debug("Getting min for stat '%s': %s", key, min_value)
         return min_value
 
     @ensure_key
     def set(self, key: str, value: float) -> bool:
         """
-        Set a new value for a statistic, clamped between its min and max.
-        Dispatches an event if the value changes.
+        Set a new base value for a statistic, clamped between its min and max.
+        Dispatches an event if the effective value changes.
 
         Args:
             key (str): The stat identifier.
             value (float): New desired value.
 
         Returns:
-            bool: True if the value was changed, False if unchanged.
+            bool: True if the base value was changed, False if unchanged.
         """
         cfg = self._stat_configs[key]
         old_value = self.stats[key]
@@ -153,23 +359,22 @@ class StatManager:
         new_value = max(cfg.min, min(cfg.max, value))
         if new_value == old_value:
             logger.debug(
-                f"Stat '{key}' unchanged at {old_value} (clamped {cfg.min}-{cfg.max})."
+                "Stat '%s' unchanged at %s (clamped %s-%s).",
+                key, old_value, cfg.min, cfg.max
             )
             return False
 
-        # Update and dispatch event
+        # Update base value, then recompute effective value and dispatch
         self.stats[key] = new_value
-        logger.debug(f"Stat '{key}' set to {new_value}")
-        event_type = self._event_map.get(key)
-        if event_type:
-            self.event_manager.dispatch(event_type, new_value=new_value)
+        logger.debug("Stat '%s' set to %s", key, new_value)
+        self._refresh(key)
         return True
 
     @ensure_key
     def modify(self, key: str, delta: float) -> bool:
         """
-        Change a statistic by a delta amount, respecting min/max limits.
-        Dispatches an event if the value changes.
+        Change a statistic's base value by a delta, respecting min/max limits.
+        Dispatches an event if the effective value changes.
 
         Args:
             key (str): The stat identifier.
@@ -178,6 +383,263 @@ class StatManager:
         Returns:
             bool: True if the value was changed.
         """
-        logger.debug(f"Modifying stat '{key}' by {delta}")
+        logger.debug("Modifying stat '%s' by %s", key, delta)
         # Use set() to handle clamping and event dispatch
-        return self.set(key, self.get(key) + delta)
+        return self.set(key, self.stats[key] + delta)
+
+    @ensure_key
+    def add_modifier(
+        self,
+        key: str,
+        amount: float,
+        kind: str = "add",
+        source: Any = None,
+        duration: Optional[float] = None
+    ) -> StatModifier:
+        """
+        Attach a modifier (buff/debuff) to a statistic.
+
+        Additive modifiers are summed onto the base value, then the result is
+        scaled by all multiplicative modifiers and clamped to the stat range.
+
+        Args:
+            key (str): The stat identifier.
+            amount (float): Offset for "add", factor for "mul".
+            kind (str, optional): "add" or "mul". Defaults to "add".
+            source (Any, optional): Owner tag for remove_modifiers_by_source().
+            duration (float, optional): Lifetime in simulation seconds;
+                None for a permanent modifier.
+
+        Returns:
+            StatModifier: The created modifier, usable with remove_modifier().
+        """
+        expires_at = None if duration is None else self.sim_time + duration
+        mod = StatModifier(key, amount, kind=kind, source=source, expires_at=expires_at)
+        self._modifiers.setdefault(key, []).append(mod)
+        if expires_at is not None:
+            heapq.heappush(
+                self._expiry_heap, (expires_at, next(self._expiry_seq), mod)
+            )
+        logger.debug("Added modifier: %s", mod)
+        self._refresh(key)
+        return mod
+
+    def remove_modifier(self, modifier: StatModifier) -> bool:
+        """
+        Remove a modifier before it expires.
+
+        Its heap entry is discarded lazily when it reaches the top.
+
+        Args:
+            modifier (StatModifier): A modifier returned by add_modifier().
+
+        Returns:
+            bool: True if the modifier was active and has been removed.
+        """
+        if not modifier.active:
+            return False
+        self._detach_modifier(modifier)
+        self._refresh(modifier.key)
+        return True
+
+    def remove_modifiers_by_source(self, source: Any) -> int:
+        """
+        Remove all active modifiers that carry the given source tag.
+
+        Args:
+            source (Any): Owner tag passed to add_modifier().
+
+        Returns:
+            int: Number of modifiers removed.
+        """
+        matches = [
+            mod for stack in self._modifiers.values()
+            for mod in stack if mod.source == source
+        ]
+        touched: Set[str] = set()
+        for mod in matches:
+            self._detach_modifier(mod)
+            touched.add(mod.key)
+        for key in touched:
+            self._refresh(key)
+        return len(matches)
+
+    def get_modifiers(self, key: str) -> List[StatModifier]:
+        """
+        Return the active modifiers of a statistic.
+
+        Args:
+            key (str): The stat identifier.
+
+        Returns:
+            List[StatModifier]: Copy of the stat's modifier stack.
+        """
+        return list(self._modifiers.get(key, ()))
+
+    def _detach_modifier(self, mod: StatModifier) -> None:
+        """Deactivate a modifier and drop it from its stat's stack."""
+        mod.active = False
+        stack = self._modifiers.get(mod.key)
+        if stack is not None:
+            stack.remove(mod)
+            if not stack:
+                del self._modifiers[mod.key]
+
+    def _refresh(self, key: str) -> None:
+        """
+        Recompute a stat's effective value and dispatch its event on change.
+
+        Args:
+            key (str): The stat identifier.
+        """
+        value = self.stats[key]
+        stack = self._modifiers.get(key)
+        if stack:
+            cfg = self._stat_configs[key]
+            value = max(cfg.min, min(cfg.max, apply_modifiers(value, stack)))
+        old = self._effective[key]
+        if value == old:
+            return
+        self._effective[key] = value
+        event_type = self._event_map.get(key)
+        if event_type:
+            self.event_manager.dispatch(event_type, new_value=value)
+        if key in self._thresholds:
+            self._thresholds.check(key, old, value)
+
+    @ensure_key
+    def add_threshold(
+        self,
+        key: str,
+        value: float,
+        callback: Callable[[float, float], None],
+        direction: str = "both"
+    ) -> Threshold:
+        """
+        Call `callback(old, new)` whenever the stat's effective value crosses
+        `value`.
+
+        Rising means moving from below `value` to `value` or above; falling
+        means moving from `value` or above to below it.
+
+        Args:
+            key (str): The stat identifier.
+            value (float): Threshold value.
+            callback (Callable[[float, float], None]): Receives old and new value.
+            direction (str, optional): "up", "down" or "both". Defaults to "both".
+
+        Returns:
+            Threshold: Token for remove_threshold().
+        """
+        return self._thresholds.add(key, value, callback, direction)
+
+    def remove_threshold(self, threshold: Threshold) -> bool:
+        """
+        Unregister a threshold callback.
+
+        Args:
+            threshold (Threshold): Token returned by add_threshold().
+
+        Returns:
+            bool: True if the threshold was registered.
+        """
+        return self._thresholds.remove(threshold)
+
+    def handle(self, key: str) -> "StatHandle":
+        """
+        Return a pre-resolved handle for fast repeated access to one stat.
+
+        The handle skips key validation and debug logging on every call, which
+        makes it the preferred API for hot loops such as per-tick decay.
+
+        Args:
+            key (str): The stat identifier.
+
+        Returns:
+            StatHandle: Cached handle for the stat.
+
+        Raises:
+            KeyError: If the stat is not defined.
+        """
+        handle = self._handles.get(key)
+        if handle is None:
+            if key not in self._stat_configs:
+                logger.warning("Stat '%s' not found. Cannot create handle.", key)
+                raise KeyError(key)
+            handle = self._handles[key] = StatHandle(self, key)
+        return handle
+
+
+class StatHandle:
+    """
+    Fast accessor for a single statistic with key, bounds and event type
+    resolved once.
+
+    Behaves like StatManager.get/set/modify for that key: `value` is the
+    effective value (modifiers applied), set/add change the base value clamped
+    to the configured range, and the stat's change event is dispatched when the
+    effective value changes. Obtain instances via StatManager.handle().
+
+    Attributes:
+        key (str): The stat identifier this handle is bound to.
+    """
+    __slots__ = ("key", "_stats", "_effective", "_min", "_max", "_refresh")
+
+    def __init__(self, manager: StatManager, key: str) -> None:
+        """
+        Bind the handle to a stat of the given manager.
+
+        Args:
+            manager (StatManager): Owner of the stat.
+            key (str): A stat identifier present in the manager's config.
+        """
+        cfg = manager._stat_configs[key]
+        self.key = key
+        self._stats = manager.stats
+        self._effective = manager._effective
+        self._min = cfg.min
+        self._max = cfg.max
+        self._refresh = manager._refresh
+
+    @property
+    def value(self) -> float:
+        """Current effective value of the stat."""
+        return self._effective[self.key]
+
+    @property
+    def base(self) -> float:
+        """Current base value of the stat, ignoring modifiers."""
+        return self._stats[self.key]
+
+    def set(self, value: float) -> bool:
+        """
+        Set the base value, clamped to its range; dispatches the stat's event
+        if the effective value changes.
+
+        Args:
+            value (float): New desired value.
+
+        Returns:
+            bool: True if the base value was changed.
+        """
+        if value < self._min:
+            value = self._min
+        elif value > self._max:
+            value = self._max
+        if value == self._stats[self.key]:
+            return False
+        self._stats[self.key] = value
+        self._refresh(self.key)
+        return True
+
+    def add(self, delta: float) -> bool:
+        """
+        Change the base value by a delta, clamped to its range.
+
+        Args:
+            delta (float): Amount to adjust the stat by.
+
+        Returns:
+            bool: True if the value was changed.
+        """
+        return self.set(self._stats[self.key] + delta)
@@ -0,0 +1,91 @@
+"""
+Module core/stat_modifiers.py
+
+Defines StatModifier, a temporary or permanent buff/debuff applied on top of
+a stat's base value, and the helper that folds a stack of modifiers into an
+effective value. Expiry scheduling lives in StatManager.
+"""
+
+import math
+from typing import Any, Iterable, Optional
+
+# Supported modifier kinds: additive offset or multiplicative factor
+MODIFIER_KINDS = ("add", "mul")
+
+
+class StatModifier:
+    """
+    A single additive or multiplicative stat modifier.
+
+    Attributes:
+        key (str): Stat the modifier applies to.
+        kind (str): "add" for an offset, "mul" for a factor.
+        amount (float): Offset or factor value.
+        source (Any): Optional owner tag (e.g. item or effect name) used for
+            bulk removal.
+        expires_at (float): Simulation time at which the modifier expires;
+            math.inf for permanent modifiers.
+        active (bool): False once the modifier has expired or been removed.
+    """
+    __slots__ = ("key", "kind", "amount", "source", "expires_at", "active")
+
+    def __init__(
+        self,
+        key: str,
+        amount: float,
+        kind: str = "add",
+        source: Any = None,
+        expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Create a modifier.
+
+        Args:
+            key (str): Stat identifier.
+            amount (float): Offset ("add") or factor ("mul").
+            kind (str, optional): One of MODIFIER_KINDS. Defaults to "add".
+            source (Any, optional): Owner tag for bulk removal.
+            expires_at (float, optional): Absolute expiry in simulation time;
+                None for a permanent modifier.
+
+        Raises:
+            ValueError: If kind is not a supported modifier kind.
+        """
+        if kind not in MODIFIER_KINDS:
+            raise ValueError(f"Unknown modifier kind '{kind}'")
+        self.key = key
+        self.kind = kind
+        self.amount = amount
+        self.source = source
+        self.expires_at = math.inf if expires_at is None else expires_at
+        self.active = True
+
+    def __repr__(self) -> str:
+        return (
+            f"StatModifier({self.key!r}, {self.kind} {self.amount}, "
+            f"source={self.source!r}, expires_at={self.expires_at})"
+        )
+
+
+def apply_modifiers(base: float, modifiers: Iterable[StatModifier]) -> float:
+    """
+    Compute the effective value of a stat from its base and modifier stack.
+
+    All additive offsets are summed onto the base first, then the result is
+    scaled by the product of all multiplicative factors.
+
+    Args:
+        base (float): Unmodified stat value.
+        modifiers (Iterable[StatModifier]): Active modifiers for the stat.
+
+    Returns:
+        float: Effective (unclamped) value.
+    """
+    offset = 0.0
+    factor = 1.0
+    for mod in modifiers:
+        if mod.kind == "add":
+            offset += mod.amount
+        else:
+            factor *= mod.amount
+    return (base + offset) * factor
@@ -0,0 +1,192 @@
+"""
+Module core/stat_thresholds.py
+
+Provides ThresholdIndex, which maps stat values to "crossed threshold"
+callbacks. Thresholds are kept sorted per stat, so a value change finds the
+crossed thresholds with a binary search instead of asking every rule.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Supported crossing directions
+DIRECTIONS = ("up", "down", "both")
+
+
+class Threshold:
+    """
+    A single registered threshold rule.
+
+    A stat crosses the threshold upwards when it moves from below `value` to
+    `value` or above, and downwards when it moves from `value` or above to
+    below it.
+
+    Attributes:
+        key (str): Stat the threshold watches.
+        value (float): Threshold value.
+        callback (Callable[[float, float], None]): Called with (old, new).
+        direction (str): "up", "down" or "both".
+        active (bool): False once the threshold has been removed.
+    """
+    __slots__ = ("key", "value", "callback", "direction", "active")
+
+    def __init__(
+        self,
+        key: str,
+        value: float,
+        callback: Callable[[float, float], None],
+        direction: str = "both"
+    ) -> None:
+        """
+        Create a threshold rule.
+
+        Args:
+            key (str): Stat identifier.
+            value (float): Threshold value.
+            callback (Callable[[float, float], None]): Receives old and new value.
+            direction (str, optional): One of DIRECTIONS. Defaults to "both".
+
+        Raises:
+            ValueError: If direction is not supported.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown threshold direction '{direction}'")
+        self.key = key
+        self.value = value
+        self.callback = callback
+        self.direction = direction
+        self.active = True
+
+    def __repr__(self) -> str:
+        return f"Threshold({self.key!r}, {self.direction} {self.value})"
+
+
+class ThresholdIndex:
+    """
+    Sorted per-stat threshold tables.
+
+    For every stat the distinct threshold values are kept in an ascending list
+    with a parallel list of rule buckets, so `check()` costs
+    O(log n + crossed) per change.
+    """
+    def __init__(self) -> None:
+        """Create an empty index."""
+        # key -> (sorted threshold values, rule bucket per value)
+        self._tables: Dict[str, Tuple[List[float], List[List[Threshold]]]] = {}
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if any threshold is registered for the stat."""
+        return key in self._tables
+
+    def add(
+        self,
+        key: str,
+        value: float,
+        callback: Callable[[float, float], None],
+        direction: str = "both"
+    ) -> Threshold:
+        """
+        Register a threshold rule.
+
+        Args:
+            key (str): Stat identifier.
+            value (float): Threshold value.
+            callback (Callable[[float, float], None]): Receives old and new value.
+            direction (str, optional): "up", "down" or "both".
+
+        Returns:
+            Threshold: Token for remove().
+        """
+        threshold = Threshold(key, value, callback, direction)
+        values, buckets = self._tables.setdefault(key, ([], []))
+        i = bisect_left(values, value)
+        if i < len(values) and values[i] == value:
+            buckets[i].append(threshold)
+        else:
+            values.insert(i, value)
+            buckets.insert(i, [threshold])
+        logger.debug("Registered %s", threshold)
+        return threshold
+
+    def remove(self, threshold: Threshold) -> bool:
+        """
+        Unregister a threshold rule.
+
+        Args:
+            threshold (Threshold): Token returned by add().
+
+        Returns:
+            bool: True if the threshold was registered.
+        """
+        if not threshold.active:
+            return False
+        threshold.active = False
+        values, buckets = self._tables[threshold.key]
+        i = bisect_left(values, threshold.value)
+        buckets[i].remove(threshold)
+        if not buckets[i]:
+            del values[i]
+            del buckets[i]
+            if not values:
+                del self._tables[threshold.key]
+        return True
+
+    def clear(self, key: str) -> None:
+        """
+        Drop all thresholds of a stat.
+
+        Args:
+            key (str): Stat identifier.
+        """
+        table = self._tables.pop(key, None)
+        if table is not None:
+            for bucket in table[1]:
+                for threshold in bucket:
+                    threshold.active = False
+
+    def check(self, key: str, old: float, new: float) -> int:
+        """
+        Fire callbacks of all thresholds crossed by a change from old to new.
+
+        Thresholds fire in the order they are crossed (ascending when rising,
+        descending when falling). Callback errors are logged and do not stop
+        the remaining callbacks.
+
+        Args:
+            key (str): Stat identifier.
+            old (float): Previous value.
+            new (float): Current value.
+
+        Returns:
+            int: Number of callbacks invoked.
+        """
+        table = self._tables.get(key)
+        if table is None or old == new:
+            return 0
+        values, buckets = table
+        if new > old:
+            # Rising: old < t <= new
+            lo, hi = bisect_right(values, old), bisect_right(values, new)
+            crossed = buckets[lo:hi]
+            skip = "down"
+        else:
+            # Falling: new < t <= old
+            lo, hi = bisect_right(values, new), bisect_right(values, old)
+            crossed = buckets[lo:hi][::-1]
+            skip = "up"
+
+        # Snapshot first so callbacks may add or remove thresholds safely
+        fired = [t for bucket in crossed for t in bucket if t.direction != skip]
+        count = 0
+        for threshold in fired:
+            if not threshold.active:
+                continue
+            count += 1
+            try:
+                threshold.callback(old, new)
+            except Exception:
+                logger.exception("Threshold callback failed for %s", threshold)
+        return count
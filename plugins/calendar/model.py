@@ -7,7 +7,7 @@ class CalendarModel:
         self.context = context
         self.day = 1
         self.weekday_index = 0
-        self.last_phase = context.get_day_phase()
+        self.last_phase = context.services.get("daytime").get_phase()
 
         self.context.event_manager.register(
             EventType.DAYTIME_CHANGED,
@@ -18,6 +18,7 @@ class CalendarModel:
         if self.last_phase == "Night" and phase == "Morning":
             self.day += 1
             self.weekday_index = (self.weekday_index + 1) % len(WEEKDAYS)
+            self.context.event_manager.dispatch(EventType.DAY_CHANGED, day=self.day)
         self.last_phase = phase
 
     def get_day(self):
@@ -6,11 +6,12 @@ logger = logging.getLogger(__name__)
 
 def on_sleep_button_clicked(context):
     """
-    Sets the current daytime phase to 'Morning' via the DaytimeCycle plugin API.
+    Sets the current daytime phase to 'Morning' via the DaytimeCycle service.
     """
-    if hasattr(context, "set_day_phase"):
+    daytime = context.services.get("daytime", None)
+    if daytime is not None:
         logger.info("[SleepPlugin] Sleeping... setting time to Morning.")
-        context.set_day_phase("Morning")
+        daytime.set_phase("Morning")
     else:
         logger.warning("[SleepPlugin] DaytimeCycle API not available.")
 
@@ -16,7 +16,8 @@ class DaytimeModel:
     def update(self, dt):
         self.elapsed_time += dt
         if self.elapsed_time >= self.change_interval:
-            self.elapsed_time = 0
+            # Keep the remainder so coarse update rates do not drift
+            self.elapsed_time -= self.change_interval
             self.advance()
 
     def advance(self):
@@ -3,7 +3,6 @@
 import logging
 import os
 from core.plugin import Plugin
-from ui.components.button import UIButton
 from setup.config import sounds, paths
 
 
@@ -22,22 +21,10 @@ class PluginImpl(Plugin):
                 logger.error(f"Fehler beim Laden von Sound '{key}': {e}")
         logger.debug(f"[DefaultSoundsPlugin] initalized")
 
-    def on_start(self):
-        pass
-
     def on_event(self, event):
-        if isinstance(event, UIButton):
-            sound_key = getattr(event, "sound_key", None) or "default_click"
-            try:
-                self.app.context.sound_manager.play(sound_key)
-            except Exception as e:
-                logger.error(f"Error playing sound '{sound_key}': {e}")
-
-    def on_update(self, dt):
-        return super().on_update(dt)  
-
-    def on_render(self, surface):
-        return super().on_render(surface)
-
-    def on_shutdown(self):
-        return super().on_shutdown()
+        # Subscribed to UI_BUTTON_CLICKED only (see plugin.yaml)
+        sound_key = getattr(event.source, "sound_key", None) or "default_click"
+        try:
+            self.app.context.sound_manager.play(sound_key)
+        except Exception as e:
+            logger.error(f"Error playing sound '{sound_key}': {e}")
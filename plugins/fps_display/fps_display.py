@@ -1,27 +1,24 @@
 # plugins/fps_display.py
 import logging
-import pygame
 from core.plugin import Plugin
+from ui.font_cache import get_font
 
 logger = logging.getLogger(__name__)
 
 class PluginImpl(Plugin):
+    # Redrawn only when the displayed value changes
+    retained = True
+
     def on_init(self):
-        self.font = pygame.font.SysFont("Arial", 14)
+        self.font = get_font("Arial", 14)
+        self.fps = None
 
-    def on_start(self):
-        return super().on_start()
+    def on_update(self, dt):
+        fps = int(self.app.clock.get_fps())
+        if fps != self.fps:
+            self.fps = fps
+            self.mark_dirty()
 
     def on_render(self, surface):
-        fps = int(self.app.clock.get_fps())
-        text = self.font.render(f"FPS: {fps}", True, (0, 255, 0))
+        text = self.font.render(f"FPS: {self.fps}", True, (0, 255, 0))
         surface.blit(text, (10, 10))
-
-    def on_event(self, event):
-        return super().on_event(event)
-
-    def on_update(self, dt):
-        return super().on_update(dt)
-
-    def on_shutdown(self):
-        return super().on_shutdown()
\ No newline at end of file
@@ -46,3 +46,4 @@ class TileMapView(UIElement):
             current = self.model.get(grid_x, grid_y)
             new_value = (current + 1) % len(TILE_COLORS)
             self.model.set(grid_x, grid_y, new_value)
+            self.mark_dirty()
@@ -1,28 +1,25 @@
 # plugins/fps_display.py
 import logging
 import time
-import pygame
 from core.plugin import Plugin
+from ui.font_cache import get_font
 
 logger = logging.getLogger(__name__)
 
 class PluginImpl(Plugin):
+    # Redrawn only when the displayed second changes
+    retained = True
+
     def on_init(self):
-        self.font = pygame.font.SysFont("Arial", 14)
+        self.font = get_font("Arial", 14)
+        self.current_time = None
 
-    def on_start(self):
-        return super().on_start()
+    def on_update(self, dt):
+        current_time = time.strftime("%H:%M:%S", time.localtime())
+        if current_time != self.current_time:
+            self.current_time = current_time
+            self.mark_dirty()
 
     def on_render(self, surface):
-        current_time = time.strftime("%H:%M:%S", time.localtime())
-        text = self.font.render(f"Uhrzeit: {current_time}", True, (0, 255, 0))
+        text = self.font.render(f"Uhrzeit: {self.current_time}", True, (0, 255, 0))
         surface.blit(text, (400, 10))
-
-    def on_event(self, event):
-        return super().on_event(event)
-
-    def on_update(self, dt):
-        return super().on_update(dt)
-
-    def on_shutdown(self):
-        return super().on_shutdown()
\ No newline at end of file
@@ -27,6 +27,10 @@ class GameScene:
     - Perform per-frame UI updates based on input/state
     - Render background and UI elements
     """
+    # Keep simulating at a low rate while covered by an overlay
+    background_update = "reduced"
+    background_hz = 5.0
+
     def __init__(
         self,
         context: object,
@@ -62,10 +66,9 @@ class GameScene:
 
     def update(self) -> None:
         """
-        Update UI state each frame, passing current mouse position.
+        Update animating UI elements; hover follows pointer motion events.
         """
-        mouse_pos = pygame.mouse.get_pos()
-        self.ui.update(mouse_pos)
+        self.ui.update()
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -74,7 +77,5 @@ class GameScene:
         Args:
             surface (pygame.Surface): The target surface for rendering.
         """
-        # Fill background color from theme
-        surface.fill(get_color("background"))
-        # Draw UI elements on top
-        self.ui.draw(surface)
+        # Composite the retained UI over the theme background
+        self.ui.draw(surface, background=get_color("background"))
@@ -11,7 +11,7 @@ import logging
 
 from themes.theme_manager import get_color
 from core.scene_registry import scene
-from setup.game_ui_setup import create_game_ui
+from setup.game_ui_setup import create_game_ui, prepare_game_ui
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,20 @@ class GameScene:
     - Perform per-frame UI updates based on input/state
     - Render background and UI elements
     """
+    # Keep simulating at a low rate while covered by an overlay
+    background_update = "reduced"
+    background_hz = 5.0
+
+    @classmethod
+    def prepare(cls, context: object) -> None:
+        """
+        Render the UI text on the scene preparation thread.
+
+        Args:
+            context: GameContext providing the stat_manager.
+        """
+        prepare_game_ui(context.stat_manager)
+
     def __init__(
         self,
         context: object,
@@ -62,10 +76,9 @@ class GameScene:
 
     def update(self) -> None:
         """
-        Update UI state each frame, passing current mouse position.
+        Update animating UI elements; hover follows pointer motion events.
         """
-        mouse_pos = pygame.mouse.get_pos()
-        self.ui.update(mouse_pos)
+        self.ui.update()
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -74,7 +87,5 @@ class GameScene:
         Args:
             surface (pygame.Surface): The target surface for rendering.
         """
-        # Fill background color from theme
-        surface.fill(get_color("background"))
-        # Draw UI elements on top
-        self.ui.draw(surface)
+        # Composite the retained UI over the theme background
+        self.ui.draw(surface, background=get_color("background"))
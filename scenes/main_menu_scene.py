@@ -64,10 +64,9 @@ class MainMenuScene:
 
     def update(self) -> None:
         """
-        Update UI elements each frame with current input state.
+        Update animating UI elements; hover follows pointer motion events.
         """
-        mouse_pos = pygame.mouse.get_pos()
-        self.ui.update(mouse_pos)
+        self.ui.update()
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -76,5 +75,4 @@ class MainMenuScene:
         Args:
             surface: The Pygame Surface to draw onto.
         """
-        surface.fill(get_color("background"))
-        self.ui.draw(surface)
+        self.ui.draw(surface, background=get_color("background"))
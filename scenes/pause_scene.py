@@ -0,0 +1,80 @@
+"""
+Module scenes/pause_scene.py
+
+Defines PauseScene, a translucent overlay pushed on top of a running scene.
+The covered scene stays visible (dimmed) and keeps simulating according to
+its background_update policy. Registered in the scene_registry under the
+key "pause".
+"""
+
+import logging
+
+import pygame
+
+from core.scene_registry import scene
+from setup.pause_ui_setup import create_pause_ui
+
+logger = logging.getLogger(__name__)
+
+# Colour and alpha of the shade drawn over the covered scene
+DIM_COLOR = (0, 0, 0, 140)
+
+
+@scene("pause")
+class PauseScene:
+    """
+    Overlay scene offering to resume or return to the main menu.
+
+    Attributes:
+        opaque (bool): False, so the scenes below are drawn first.
+    """
+    opaque = False
+
+    def __init__(
+        self,
+        context: object,
+        switch_scene_callback: callable,
+        pop_scene_callback: callable
+    ) -> None:
+        """
+        Set up the pause overlay.
+
+        Args:
+            context: GameContext providing the event_manager.
+            switch_scene_callback (callable): Function to invoke to change active scene.
+            pop_scene_callback (callable): Function that closes this overlay.
+        """
+        self.context = context
+        self.ui = create_pause_ui(
+            event_manager=self.context.event_manager,
+            switch_scene_callback=switch_scene_callback,
+            resume_callback=pop_scene_callback
+        )
+        self._shade = None
+        logger.debug("PauseScene initialized.")
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Forward events to the overlay UI.
+
+        Args:
+            event (pygame.event.Event): The Pygame event to process.
+        """
+        self.ui.handle_event(event)
+
+    def update(self) -> None:
+        """Update animating UI elements; hover follows pointer motion events."""
+        self.ui.update()
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Dim the covered scene and draw the overlay UI.
+
+        Args:
+            surface (pygame.Surface): The target surface for rendering.
+        """
+        if self._shade is None or self._shade.get_size() != surface.get_size():
+            self._shade = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self._shade.fill(DIM_COLOR)
+        surface.blit(self._shade, (0, 0))
+        self.ui.draw(surface)
@@ -2,8 +2,8 @@
 Module scenes/plugin_manager_scene.py
 
 Defines PluginManagerScene, responsible for displaying and managing game plugins.
-Shows a list of available plugins with enable/disable toggles and handles
-plugin lifecycle through UI interactions.
+Shows a list of available plugins with enable/disable toggles and reload
+buttons, and handles plugin lifecycle through UI interactions.
 Registered in the scene_registry under the key "plugins".
 """
 
@@ -12,7 +12,7 @@ import logging
 
 from themes.theme_manager import get_color
 from core.scene_registry import scene
-from setup.plugin_ui_setup import create_plugin_manager_ui
+from setup.plugin_ui_setup import create_plugin_manager_ui, prepare_plugin_manager_ui
 
 logger = logging.getLogger(__name__)
 
@@ -23,10 +23,20 @@ class PluginManagerScene:
     Scene class for the plugin management interface.
 
     Responsibilities:
-    - Display list of plugins with enable/disable controls
+    - Display list of plugins with enable/disable and reload controls
     - Handle user input to toggle plugin states
     - Refresh UI to reflect plugin state changes
     """
+    @classmethod
+    def prepare(cls, context: object) -> None:
+        """
+        Render the plugin table text on the scene preparation thread.
+
+        Args:
+            context: GameContext containing the PluginManager instance.
+        """
+        prepare_plugin_manager_ui(context.plugin_manager)
+
     def __init__(
         self,
         context: object,
@@ -49,10 +59,20 @@ class PluginManagerScene:
             self.pm,
             event_manager=self.context.event_manager,
             toggle_callback=self._toggle,
-            switch_scene_callback=self.switch_scene
+            switch_scene_callback=self.switch_scene,
+            reload_callback=self._reload
         )
         logger.debug("PluginManagerScene initialized with UI components.")
 
+    def _reload(self, meta: dict) -> None:
+        """
+        Hot-reload a plugin's code.
+
+        Args:
+            meta (dict): Metadata dict for the plugin.
+        """
+        self.pm.reload_plugin(meta["name"])
+
     def _toggle(self, meta: dict) -> None:
         """
         Enable or disable a plugin and rebuild the UI.
@@ -67,12 +87,19 @@ class PluginManagerScene:
             self.pm.enable_plugin(meta["name"])
             meta["enabled"] = True
         # Rebuild UI to reflect the updated plugin states
+        previous = self.ui
         self.ui = create_plugin_manager_ui(
             self.pm,
             event_manager=self.context.event_manager,
             toggle_callback=self._toggle,
-            switch_scene_callback=self.switch_scene
+            switch_scene_callback=self.switch_scene,
+            reload_callback=self._reload
         )
+        # Keep keyboard focus and hover on the rebuilt controls
+        self.ui.adopt_focus(previous)
+        self.ui.pointer_moved(pygame.mouse.get_pos())
+        if self.context.ui_manager is previous:
+            self.context.ui_manager = self.ui
         logger.debug(
             "Plugin '%s' toggled, UI rebuilt.", meta.get("name")
         )
@@ -88,10 +115,9 @@ class PluginManagerScene:
 
     def update(self) -> None:
         """
-        Update UI elements each frame with current mouse position.
+        Update animating UI elements; hover follows pointer motion events.
         """
-        mouse_pos = pygame.mouse.get_pos()
-        self.ui.update(mouse_pos)
+        self.ui.update()
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -100,5 +126,4 @@ class PluginManagerScene:
         Args:
             surface: The Pygame Surface to draw onto.
         """
-        surface.fill(get_color("background"))
-        self.ui.draw(surface)
\ No newline at end of file
+        self.ui.draw(surface, background=get_color("background"))
\ No newline at end of file
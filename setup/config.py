@@ -37,8 +37,10 @@ logging = _data.get('logging', {})
 fonts = _data.get('fonts', {})
 ui = _data.get('ui', {})
 theme = _data.get('theme', {})
+stats = _data.get('stats', {})
 scenes = _data.get('scenes', {})
 plugins = _data.get('plugins', [])
+plugin_profiling = _data.get('plugin_profiling', {})
 sounds = _data.get('sounds', {})
 
 
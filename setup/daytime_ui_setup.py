@@ -18,10 +18,10 @@ def create_game_ui(stat_manager, event_manager, switch_scene_callback, context):
         align="center"
     )
 
-    daytime_model = context.create_daytime()
+    daytime_model = context.services.get("daytime")
     daytime_label = DaytimeLabel(daytime_model, x=0, y=0)
 
-    cal_model = context.create_calendar()
+    cal_model = context.services.get("calendar")
     cal_label = CalendarLabel(cal_model, x=0, y=0)
     
     # Back button to return to the main menu
@@ -41,7 +41,6 @@ def create_game_ui(stat_manager, event_manager, switch_scene_callback, context):
     handler = make_daytime_changed_handler(daytime_label)
     context.event_manager.register(EventType.DAYTIME_CHANGED, handler)
 
-    for element in layout.get_elements():
-        ui.add(element)
+    ui.add(layout)
 
     return ui
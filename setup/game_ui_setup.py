@@ -17,6 +17,33 @@ from ui.ui_manager import UIManager
 from ui.layout.horizontal import HorizontalLayout
 from ui.layout.vertical import VerticalLayout
 from ui.components.text_input import UITextInput
+from ui import font_cache
+from themes.theme_manager import get_color
+
+TITLE_TEXT = "Game Scene"
+
+
+def _stat_text(key: str, value) -> str:
+    """Label text of a stat, e.g. 'Energy: 100'."""
+    return f"{key.capitalize()}: {value}"
+
+
+def prepare_game_ui(stat_manager) -> None:
+    """
+    Render the label text of the game UI into the font cache.
+
+    Runs on the scene preparation thread, so create_game_ui() only looks the
+    rendered text up.
+
+    Args:
+        stat_manager: StatManager providing the current stat values.
+    """
+    title = Config.fonts["title"]
+    default = Config.fonts["default"]
+    specs = [(title["name"], title["size"], TITLE_TEXT)]
+    for key in ("energy", "health"):
+        specs.append((default["name"], default["size"], _stat_text(key, stat_manager.get(key))))
+    font_cache.warm_texts(specs, get_color("foreground"))
 
 
 def create_game_ui(
@@ -44,7 +71,7 @@ def create_game_ui(
     # Title label
     title_label = UILabel(        
         x=0, y=0,
-        text="Game Scene",
+        text=TITLE_TEXT,
         font_size=Config.fonts["title"]["size"],
         font_name=Config.fonts["title"]["name"]
     )
@@ -53,7 +80,7 @@ def create_game_ui(
     energy_label = UILabel(        
         x=0,        
         y=0,
-        text=f"{energy_key.capitalize()}: {stat_manager.get(energy_key)}",
+        text=_stat_text(energy_key, stat_manager.get(energy_key)),
     )
 
     energy_bar = UIProgressBar(
@@ -111,7 +138,7 @@ def create_game_ui(
     # Health UI Elements
     health_label = UILabel(        
         x=0, y=0,
-        text=f"{health_key.capitalize()}: {stat_manager.get(health_key)}"
+        text=_stat_text(health_key, stat_manager.get(health_key))
     )
     health_bar = UIProgressBar(
         x=0, y=0,
@@ -228,8 +255,7 @@ def create_game_ui(
     veri.add(hori)
     veri.add(back_button)
 
-    for element in veri.get_elements():
-        ui.add(element)
+    ui.add(veri)
 
     # Register event handlers for dynamic stat updates
     event_manager.register(
@@ -97,8 +97,7 @@ def create_main_menu_ui(
     layout.add(plugins_button)
     layout.add(exit_button)
 
-    # Register layout elements with UI manager
-    for element in layout.get_elements():
-        ui.add(element)
+    # Register the layout tree with the UI manager
+    ui.add(layout)
 
     return ui
@@ -0,0 +1,63 @@
+# setup/pause_ui_setup.py
+
+"""
+Module for constructing the pause overlay UI.
+"""
+
+import setup.config as Config
+from ui.components.button import UIButton
+from ui.components.label import UILabel
+from ui.ui_manager import UIManager
+from ui.layout.vertical import VerticalLayout
+
+
+def create_pause_ui(
+    event_manager,
+    switch_scene_callback: callable,
+    resume_callback: callable
+) -> UIManager:
+    """
+    Create and return the pause overlay UI manager with title and buttons.
+
+    Args:
+        switch_scene_callback (callable): Function to switch scenes.
+        resume_callback (callable): Function that closes the overlay.
+
+    Returns:
+        UIManager: Configured UI manager for the pause overlay.
+    """
+    ui = UIManager(event_manager)
+
+    layout = VerticalLayout(x=300, y=180, spacing=10, align="center")
+
+    title_label = UILabel(
+        x=0,
+        y=0,
+        text="Pause",
+        font_size=Config.fonts["title"]["size"],
+        font_name=Config.fonts["title"]["name"]
+    )
+
+    resume_button = UIButton(
+        x=0, y=0,
+        width=200, height=50,
+        text="Weiter",
+        callback=resume_callback,
+        sound_key="start_click"
+    )
+
+    menu_button = UIButton(
+        x=0, y=0,
+        width=200, height=50,
+        text="Hauptmenü",
+        callback=lambda: switch_scene_callback("menu"),
+        sound_key="exit_click"
+    )
+
+    layout.add(title_label)
+    layout.add(resume_button)
+    layout.add(menu_button)
+
+    ui.add(layout)
+
+    return ui
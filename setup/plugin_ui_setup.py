@@ -6,25 +6,59 @@ Table spans the full window width minus padding.
 """
 
 import setup.config as Config
+from themes.theme_manager import get_color
+from ui import font_cache
 from ui.components.table import UITable
 from ui.components.button import UIButton
 from ui.ui_manager import UIManager
 
 
+def _headers(with_reload: bool) -> list:
+    """Column headers; the Reload column only exists with a reload callback."""
+    return ["Plugin", "Status", "Action"] + (["Reload"] if with_reload else [])
+
+
+def _status_text(meta: dict) -> str:
+    """Status cell text of a plugin."""
+    return "On" if meta['enabled'] else "Off"
+
+
+def prepare_plugin_manager_ui(plugin_manager, with_reload: bool = True) -> None:
+    """
+    Render the table text of the plugin manager UI into the font cache.
+
+    Runs on the scene preparation thread, so the table labels created by
+    create_plugin_manager_ui() only look the rendered text up.
+
+    Args:
+        plugin_manager: Provides .available list of plugin metadata.
+        with_reload (bool, optional): Whether the Reload column is shown.
+    """
+    name = Config.fonts['default']['name']
+    size = Config.fonts['default']['size']
+    texts = _headers(with_reload)
+    for meta in list(plugin_manager.available):
+        texts += [meta['name'], _status_text(meta)]
+    font_cache.warm_texts(((name, size, text) for text in texts), get_color("foreground"))
+
+
 def create_plugin_manager_ui(
     plugin_manager,
     event_manager,
     toggle_callback: callable,
-    switch_scene_callback: callable
+    switch_scene_callback: callable,
+    reload_callback: callable = None
 ) -> UIManager:
     """
     Create and return the UI for the plugin manager scene using a full-width Table
-    listing plugins with inline toggle buttons.
+    listing plugins with inline toggle and reload buttons.
 
     Args:
         plugin_manager: Provides .available list of plugin metadata.
         toggle_callback (callable): Called with plugin metadata to toggle enable/disable.
         switch_scene_callback (callable): Function to switch back to main menu.
+        reload_callback (callable, optional): Called with plugin metadata to
+            hot-reload an enabled plugin; the Reload column is omitted if None.
 
     Returns:
         UIManager: Configured UI manager for plugin manager.
@@ -36,11 +70,17 @@ def create_plugin_manager_ui(
     screen_w = Config.screen['width']
     available_w = screen_w - padding * 2
 
-    # Allocate more width to the name column, less to status and action
-    name_w = int(available_w * 0.6)
-    status_w = int(available_w * 0.2)
-    action_w = available_w - name_w - status_w
-    column_widths = [name_w, status_w, action_w]
+    # Allocate more width to the name column, less to status and actions
+    headers = _headers(reload_callback is not None)
+    if reload_callback is None:
+        name_w = int(available_w * 0.6)
+        status_w = int(available_w * 0.2)
+        column_widths = [name_w, status_w, available_w - name_w - status_w]
+    else:
+        name_w = int(available_w * 0.45)
+        status_w = int(available_w * 0.15)
+        action_w = int(available_w * 0.2)
+        column_widths = [name_w, status_w, action_w, available_w - name_w - status_w - action_w]
 
     # Instantiate the Table
     table = UITable(
@@ -48,14 +88,14 @@ def create_plugin_manager_ui(
         y=80,
         column_widths=column_widths,
         row_height=30,
-        headers=["Plugin", "Status", "Action"],
+        headers=headers,
         font_size=Config.fonts['default']['size'],
         font_name=Config.fonts['default']['name']
     )
 
     # Populate table rows with data and inline toggle Button
     for meta in plugin_manager.available:
-        status = "On" if meta['enabled'] else "Off"
+        status = _status_text(meta)
         toggle_btn = UIButton(
             x=0, y=0,
             width=column_widths[2] - 10,
@@ -63,7 +103,24 @@ def create_plugin_manager_ui(
             text="Toggle",
             callback=lambda m=meta: toggle_callback(m)
         )
-        table.add_row([meta['name'], status, toggle_btn])
+        # Stable ids let a rebuilt UI keep keyboard focus on the same control
+        toggle_btn.focus_id = f"toggle:{meta['name']}"
+        row = [meta['name'], status, toggle_btn]
+        if reload_callback is not None:
+            # Only enabled plugins have code loaded that can be reloaded
+            if meta['enabled']:
+                reload_btn = UIButton(
+                    x=0, y=0,
+                    width=column_widths[3] - 10,
+                    height=table.row_height - 10,
+                    text="Reload",
+                    callback=lambda m=meta: reload_callback(m)
+                )
+                reload_btn.focus_id = f"reload:{meta['name']}"
+                row.append(reload_btn)
+            else:
+                row.append("")
+        table.add_row(row)
 
     ui.add(table)
 
@@ -78,6 +135,7 @@ def create_plugin_manager_ui(
         callback=lambda: switch_scene_callback("menu"),
         sound_key="exit_click"
     )
+    back_button.focus_id = "back"
     ui.add(back_button)
 
     return ui
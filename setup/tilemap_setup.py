@@ -26,7 +26,7 @@ def create_game_ui(stat_manager, event_manager, switch_scene_callback, context):
         font_name=Config.fonts["title"]["name"]
     )
     
-    tile_map_model, map_view = context.create_tilemap(width=12, height=6, pos=(0, 0))
+    tile_map_model, map_view = context.services.get("create_tilemap")(width=12, height=6, pos=(0, 0))
 
     # Back button to return to the main menu
     back_button = UIButton(
@@ -41,7 +41,6 @@ def create_game_ui(stat_manager, event_manager, switch_scene_callback, context):
     layout.add(map_view)
     layout.add(back_button)
     
-    for element in layout.get_elements():
-        ui.add(element)
+    ui.add(layout)
 
     return ui
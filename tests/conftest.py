@@ -1,4 +1,45 @@
 # tests/conftest.py
 import os, sys
 # Projekt‑Root (eine Ebene über tests/) zum Pfad hinzufügen
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
\ No newline at end of file
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import json
+
+import pytest
+
+from core.stat_manager import StatManager
+
+# Stats config shared by the stat tests
+STATS_CONFIG = {
+    "energy": {"initial": 100, "min": 0, "max": 150, "event_type": "ENERGY_CHANGED"},
+    "health": {"initial": 50, "min": 0, "max": 100, "event_type": "HEALTH_CHANGED"}
+}
+
+
+class DummyEventManager:
+    """Records dispatched events instead of delivering them."""
+    def __init__(self):
+        self.dispatched = []
+    def register(self, event_type, callback):
+        pass
+    def dispatch(self, event_type, *args, **kwargs):
+        self.dispatched.append((event_type, args, kwargs))
+
+
+@pytest.fixture
+def stats_config_file(tmp_path):
+    file_path = tmp_path / "stats_config.json"
+    file_path.write_text(json.dumps(STATS_CONFIG))
+    return file_path
+
+
+@pytest.fixture
+def stat_manager(stats_config_file):
+    return StatManager(DummyEventManager(), config_path=str(stats_config_file))
+
+
+@pytest.fixture
+def ui():
+    """An empty UIManager without an event manager."""
+    from ui.ui_manager import UIManager
+    return UIManager(event_manager=None)
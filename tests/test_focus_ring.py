@@ -0,0 +1,105 @@
+# tests/test_focus_ring.py
+# Tests for the incremental focus ring: identity-tracked focus, nested focusables and rebuilds.
+
+import pygame
+
+from ui.components.panel import UIPanel
+from ui.components.table import UITable
+from ui.focus_ring import FocusRing
+from ui.ui_manager import UIManager
+from ui_helpers import DummyElement
+
+pygame.init()
+
+
+def focusable(name, **kwargs):
+    return DummyElement(name=name, focusable=True, **kwargs)
+
+
+def test_ring_links_and_unlinks():
+    ring = FocusRing()
+    a, b, c = focusable("a"), focusable("b"), focusable("c", focus_id="c")
+    for element in (a, b, c):
+        ring.add(element)
+    assert list(ring) == [a, b, c]
+    assert ring.next_of(c) is a and ring.prev_of(a) is c
+    assert ring.find("c") is c
+
+    ring.remove(a)
+    assert list(ring) == [b, c] and ring.first is b
+    assert ring.next_of(a) is b  # unknown elements restart at the front
+    ring.remove(c)
+    assert ring.find("c") is None and list(ring) == [b]
+
+
+def test_focus_tracked_by_identity_across_changes(ui):
+    a, label, b, c = (focusable("a"), DummyElement(name="label"),
+                      focusable("b"), focusable("c"))
+    for element in (a, label, b, c):
+        ui.add(element)
+    ui.focus_next()
+    ui.focus_next()
+    assert ui.focused_element is b and b.focused
+
+    # Removing an earlier element does not move focus
+    ui.remove(a)
+    assert ui.focused_element is b
+    ui.focus_next()
+    assert ui.focused_element is c and not b.focused
+    ui.activate_focused()
+    assert c.activations == 1
+
+    ui.remove(c)
+    assert ui.focused_element is None and not c.focused
+    ui.focus_prev()
+    assert ui.focused_element is b
+
+
+def test_ring_includes_widgets_nested_in_tables(ui):
+    table = UITable(x=0, y=0, column_widths=[20, 20], row_height=20)
+    first, second = focusable("first"), focusable("second")
+    table.add_row([first, second])
+    ui.add(table)
+    ui.add(focusable("back"))
+    assert [e.name for e in ui.focus_ring] == ["first", "second", "back"]
+
+
+def test_adopt_focus_restores_focus_after_rebuild(ui):
+    ui.add(focusable("x", focus_id="toggle:x"))
+    ui.add(focusable("y", focus_id="toggle:y"))
+    ui.focus_prev()
+    assert ui.focused_element.name == "y"
+
+    rebuilt = UIManager(event_manager=None)
+    rebuilt.add(focusable("x", focus_id="toggle:x"))
+    new_y = focusable("y", focus_id="toggle:y")
+    rebuilt.add(new_y)
+    rebuilt.adopt_focus(ui)
+    assert rebuilt.focused_element is new_y and new_y.focused
+
+
+def test_keyed_elements_keep_tree_order():
+    ring = FocusRing()
+    a, b, c, d = (focusable(n) for n in "abcd")
+    ring.add(b, (1,))
+    ring.add(d, (3,))
+    ring.add(a, (0, 5))
+    ring.add(c, (2,))
+    assert list(ring) == [a, b, c, d] and ring.first is a
+    ring.remove(b)
+    ring.add(b, (1,))
+    assert list(ring) == [a, b, c, d]
+
+
+def test_reshown_and_late_elements_take_their_tree_position(ui):
+    panel = UIPanel(x=0, y=0, padding=0)
+    first, second = focusable("first"), focusable("second")
+    panel.add(first)
+    panel.add(second)
+    ui.add(panel)
+    ui.add(focusable("back"))
+
+    first.set_visible(False)
+    first.set_visible(True)
+    panel.add(focusable("late"))
+    assert [e.name for e in ui.focus_ring] == ["first", "second", "late", "back"]
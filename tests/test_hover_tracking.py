@@ -0,0 +1,50 @@
+# tests/test_hover_tracking.py
+# Tests for hover driven by pointer motion and per-frame updates of animating elements only.
+
+import pygame
+
+from ui.components.table import UITable
+from ui_helpers import DummyElement, motion
+
+pygame.init()
+
+
+def test_motion_notifies_only_left_and_entered_elements(ui):
+    a, b, c = DummyElement(0, 0), DummyElement(20, 0), DummyElement(40, 0)
+    for element in (a, b, c):
+        ui.add(element)
+
+    ui.handle_event(motion((5, 5)))
+    ui.handle_event(motion((6, 6)))  # still over a: no notification
+    ui.handle_event(motion((25, 5)))
+    assert (a.hover_calls, b.hover_calls, c.hover_calls) == ([True, False], [True], [])
+    assert ui.hovered_element is b
+
+    ui.handle_event(pygame.event.Event(pygame.WINDOWLEAVE))
+    assert not b.hovered and ui.hovered_element is None
+
+
+def test_update_reaches_only_animating_elements(ui):
+    still, blinking = DummyElement(0, 0), DummyElement(20, 0, animating=True)
+    ui.add(still)
+    ui.add(blinking)
+    for _ in range(3):
+        ui.update()
+    assert (still.updates, blinking.updates) == (0, 3)
+
+    ui.set_animating(blinking, False)
+    ui.update()
+    assert blinking.updates == 3
+
+
+def test_hover_resolves_widgets_inside_tables(ui):
+    table = UITable(x=0, y=0, column_widths=[50, 50], row_height=20)
+    button = DummyElement(0, 0, 40, 10)
+    table.add_row(["name", button])
+    ui.add(table)
+
+    ui.handle_event(motion((60, 8)))
+    assert ui.hovered_element is button and button.hovered
+
+    ui.remove(table)
+    assert not button.hovered and ui.hovered_element is None
@@ -0,0 +1,77 @@
+# tests/test_plugin_dispatch.py
+# Unit tests for per-hook plugin dispatch: only overridden hooks are called, tuples follow the active set.
+
+from types import SimpleNamespace
+
+import pytest
+
+import core.plugin_manager as pm_mod
+from core.plugin import Plugin
+from core.plugin_manager import PluginManager
+
+
+class UpdateOnly(Plugin):
+    def __init__(self, app):
+        super().__init__(app)
+        self.updates = []
+    def on_update(self, dt):
+        self.updates.append(dt)
+
+
+class Passive(Plugin):
+    pass
+
+
+class Failing(Plugin):
+    def on_update(self, dt):
+        raise RuntimeError("boom")
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setitem(pm_mod.paths, "plugins_path", str(tmp_path))
+    monkeypatch.setitem(pm_mod.paths, "plugin_index", None)
+    monkeypatch.setitem(pm_mod.paths, "plugin_state", None)
+    return PluginManager(app=None)
+
+
+def activate(manager, *plugins):
+    manager.plugins.extend(plugins)
+    manager._rebuild_dispatch()
+
+
+def test_only_overriding_plugins_are_dispatched(manager):
+    active, passive = UpdateOnly(None), Passive(None)
+    activate(manager, active, passive)
+    assert [p for p, _ in manager._hooks["on_update"]] == [active]
+    assert manager._hooks["on_render"] == ()
+
+    manager.on_update(0.5)
+    assert active.updates == [0.5]
+
+
+def test_error_in_one_plugin_does_not_stop_others(manager):
+    active = UpdateOnly(None)
+    activate(manager, Failing(None), active)
+    manager.on_update(1.0)
+    assert active.updates == [1.0]
+
+
+def test_rebuild_reflects_removed_plugins(manager):
+    active = UpdateOnly(None)
+    activate(manager, active)
+    manager.plugins.remove(active)
+    manager._rebuild_dispatch()
+    manager.on_update(1.0)
+    assert active.updates == []
+
+
+def test_hooks_are_not_timed_without_profiler(manager, monkeypatch):
+    manager.profiler = None
+    active = UpdateOnly(None)
+    activate(manager, active)
+    calls = []
+    monkeypatch.setattr(pm_mod, "time", SimpleNamespace(perf_counter=lambda: calls.append(1) or 0.0))
+    manager.on_update(0.5)
+    assert active.updates == [0.5]
+    assert calls == []
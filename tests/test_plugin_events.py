@@ -0,0 +1,85 @@
+# tests/test_plugin_events.py
+# Unit tests for event-type subscriptions: per-type routing of pygame events and EventType dispatches.
+
+import pygame
+import pytest
+
+import core.plugin_manager as pm_mod
+from core.events.event_manager import EventManager
+from core.events.event_types import EventType
+from core.plugin import Plugin
+from core.plugin_manager import PluginManager
+
+
+class Recorder(Plugin):
+    def __init__(self, app):
+        super().__init__(app)
+        self.seen = []
+    def on_event(self, event):
+        self.seen.append(event)
+
+
+class KeysOnly(Recorder):
+    events = ("KEYDOWN",)
+
+
+class Clicks(Recorder):
+    events = (EventType.UI_BUTTON_CLICKED,)
+
+
+class DummyContext:
+    def __init__(self):
+        self.event_manager = EventManager()
+
+
+class DummyApp:
+    def __init__(self):
+        self.context = DummyContext()
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setitem(pm_mod.paths, "plugins_path", str(tmp_path))
+    monkeypatch.setitem(pm_mod.paths, "plugin_index", None)
+    monkeypatch.setitem(pm_mod.paths, "plugin_state", None)
+    return PluginManager(DummyApp())
+
+
+def activate(manager, *plugins):
+    manager.plugins.extend(plugins)
+    manager._rebuild_dispatch()
+
+
+def test_pygame_events_reach_only_subscribers(manager):
+    keys, clicks, legacy = KeysOnly(None), Clicks(None), Recorder(None)
+    activate(manager, keys, clicks, legacy)
+
+    manager.on_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)))
+    manager.on_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+    assert [e.type for e in keys.seen] == [pygame.KEYDOWN]
+    assert clicks.seen == []
+    # Plugins without subscriptions still receive every pygame event
+    assert len(legacy.seen) == 2
+
+
+def test_event_type_subscription_receives_game_event(manager):
+    clicks, keys = Clicks(None), KeysOnly(None)
+    activate(manager, clicks, keys)
+    button = object()
+    manager.app.context.event_manager.dispatch(EventType.UI_BUTTON_CLICKED, button)
+
+    assert len(clicks.seen) == 1
+    assert clicks.seen[0].type is EventType.UI_BUTTON_CLICKED
+    assert clicks.seen[0].source is button
+    assert keys.seen == []
+
+
+def test_forwarder_is_removed_with_last_subscriber(manager):
+    clicks = Clicks(None)
+    activate(manager, clicks)
+    listeners = manager.app.context.event_manager.listeners
+    assert len(listeners[EventType.UI_BUTTON_CLICKED]) == 1
+
+    manager.plugins.remove(clicks)
+    manager._rebuild_dispatch()
+    assert listeners[EventType.UI_BUTTON_CLICKED] == []
@@ -0,0 +1,82 @@
+# tests/test_plugin_host.py
+# Tests for out-of-process plugin hosting: state diffs, forwarded events, and crash isolation.
+
+import textwrap
+import time
+import uuid
+
+import pytest
+
+from core.events.event_manager import EventManager
+from core.events.event_types import EventType
+from core.plugin_host import ProcessPluginHost
+
+COUNTER_WORKER = textwrap.dedent('''
+    from core.plugin_host import WorkerPlugin
+
+    class WorkerImpl(WorkerPlugin):
+        def on_start(self):
+            self.state["elapsed"] = 0.0
+        def on_update(self, dt):
+            self.state["elapsed"] += dt
+        def on_event(self, event_name, data):
+            if event_name == "DAY_CHANGED":
+                raise RuntimeError("simulated crash")
+            self.state["phase"] = data["phase"]
+''')
+
+
+class DummyContext:
+    def __init__(self):
+        self.event_manager = EventManager()
+
+
+class DummyApp:
+    def __init__(self):
+        self.context = DummyContext()
+
+
+@pytest.fixture
+def host(tmp_path, monkeypatch):
+    module = "worker_" + uuid.uuid4().hex[:8]
+    (tmp_path / f"{module}.py").write_text(COUNTER_WORKER)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    meta = {
+        "name": "Counter", "module": module,
+        "forward_events": ["DAYTIME_CHANGED", "DAY_CHANGED"]
+    }
+    host = ProcessPluginHost(DummyApp(), meta)
+    host.on_init()
+    yield host
+    host.on_shutdown()
+
+
+def pump(host, until, dt=0.01, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not until():
+        assert time.monotonic() < deadline, "worker did not respond"
+        host.on_update(dt)
+        time.sleep(0.01)
+
+
+def test_worker_state_diffs_and_events_reach_main_process(host):
+    seen = []
+    host.app.context.event_manager.register(
+        EventType.PLUGIN_STATE_CHANGED, lambda **kw: seen.append(kw)
+    )
+    pump(host, lambda: host.state.get("elapsed", 0) > 0.05)
+    assert seen and seen[-1]["plugin"] == "Counter"
+
+    host.app.context.event_manager.dispatch(EventType.DAYTIME_CHANGED, phase="Night")
+    pump(host, lambda: "phase" in host.state, dt=0.0)
+    assert host.state["phase"] == "Night"
+
+
+def test_worker_crash_is_isolated(host):
+    # The worker raises on DAY_CHANGED; the host goes inert instead of raising
+    pump(host, lambda: "elapsed" in host.state)
+    host.app.context.event_manager.dispatch(EventType.DAY_CHANGED, day=2)
+    pump(host, lambda: host.crashed)
+    elapsed = host.state["elapsed"]
+    host.on_update(1.0)
+    assert host.state["elapsed"] == elapsed
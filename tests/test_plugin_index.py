@@ -0,0 +1,82 @@
+# tests/test_plugin_index.py
+# Unit tests for PluginIndex: warm cache hits, incremental reparse, and removal of vanished plugins.
+
+import json
+import os
+
+import pytest
+
+from core.plugin_index import PluginIndex
+
+
+def write_manifest(base, dirname, name):
+    sub = base / dirname
+    sub.mkdir(exist_ok=True)
+    path = sub / "plugin.yaml"
+    path.write_text(f"name: {name}\nmodule: plugins.{dirname}.main\nenabled: true\n")
+    return path
+
+
+@pytest.fixture
+def plugins_dir(tmp_path):
+    base = tmp_path / "plugins"
+    base.mkdir()
+    write_manifest(base, "alpha", "Alpha")
+    write_manifest(base, "beta", "Beta")
+    (base / "no_manifest").mkdir()
+    return base
+
+
+def test_cold_scan_parses_and_writes_index(plugins_dir, tmp_path):
+    index_path = tmp_path / "index.json"
+    index = PluginIndex(plugins_dir, index_path)
+    names = [data["name"] for _, data in index.scan()]
+    assert names == ["Alpha", "Beta"]
+    assert index.parsed == 2
+    assert set(json.loads(index_path.read_text())["entries"]) == {"alpha", "beta"}
+
+
+def test_warm_scan_only_reparses_changed_manifests(plugins_dir, tmp_path):
+    index_path = tmp_path / "index.json"
+    PluginIndex(plugins_dir, index_path).scan()
+
+    warm = PluginIndex(plugins_dir, index_path)
+    warm.scan()
+    assert warm.parsed == 0
+
+    path = write_manifest(plugins_dir, "beta", "Beta Renamed")
+    # Guarantee a different mtime even on coarse-grained filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    changed = PluginIndex(plugins_dir, index_path)
+    names = [data["name"] for _, data in changed.scan()]
+    assert changed.parsed == 1
+    assert names == ["Alpha", "Beta Renamed"]
+
+
+def test_removed_plugin_is_dropped_from_index(plugins_dir, tmp_path):
+    index_path = tmp_path / "index.json"
+    PluginIndex(plugins_dir, index_path).scan()
+    (plugins_dir / "alpha" / "plugin.yaml").unlink()
+
+    results = PluginIndex(plugins_dir, index_path).scan()
+    assert [data["name"] for _, data in results] == ["Beta"]
+    assert set(json.loads(index_path.read_text())["entries"]) == {"beta"}
+
+
+def test_corrupt_index_falls_back_to_parsing(plugins_dir, tmp_path):
+    index_path = tmp_path / "index.json"
+    index_path.write_text("{ broken")
+    index = PluginIndex(plugins_dir, index_path)
+    assert len(index.scan()) == 2
+    assert index.parsed == 2
+
+
+def test_unencodable_manifest_is_returned_without_index(plugins_dir, tmp_path):
+    (plugins_dir / "alpha" / "plugin.yaml").write_text(
+        "name: Alpha\nmodule: plugins.alpha.main\nreleased: 2024-01-01\n"
+    )
+    index_path = tmp_path / "index.json"
+    results = PluginIndex(plugins_dir, index_path).scan()
+    assert [data["name"] for _, data in results] == ["Alpha", "Beta"]
+    assert not index_path.exists()
@@ -0,0 +1,129 @@
+# tests/test_plugin_lazy.py
+# Unit tests for lazy plugin activation: lazy service providers, dependency activation, and late on_start.
+
+import sys
+import textwrap
+import uuid
+
+import pytest
+
+import core.plugin_manager as pm_mod
+from core.plugin_manager import PluginManager
+from core.services import ServiceRegistry
+
+PLUGIN_SOURCE = textwrap.dedent('''
+    from core.plugin import Plugin
+
+    CALLS = []
+
+    class PluginImpl(Plugin):
+        def on_init(self):
+            CALLS.append(("init", NAME))
+        def on_start(self):
+            CALLS.append(("start", NAME))
+        def on_event(self, event):
+            pass
+        def on_update(self, dt):
+            pass
+        def on_render(self, surface):
+            pass
+        def on_shutdown(self):
+            pass
+        def make_thing(self, size):
+            return ("thing", size)
+''')
+
+
+class DummyContext:
+    def __init__(self):
+        self.services = ServiceRegistry()
+
+
+class DummyApp:
+    def __init__(self):
+        self.context = DummyContext()
+
+
+@pytest.fixture
+def make_manager(tmp_path, monkeypatch):
+    # Build a throwaway plugins package and point the manager at it
+    package = "lazy_" + uuid.uuid4().hex[:8]
+    base = tmp_path / package
+    base.mkdir()
+    (base / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(pm_mod.paths, "plugins_path", str(base))
+    monkeypatch.setitem(pm_mod.paths, "plugin_index", None)
+    monkeypatch.setitem(pm_mod.paths, "plugin_state", None)
+
+    def add_plugin(dirname, manifest):
+        sub = base / dirname
+        sub.mkdir()
+        (sub / "__init__.py").write_text("")
+        (sub / "main.py").write_text(f"NAME = {dirname!r}\n" + PLUGIN_SOURCE)
+        (sub / "plugin.yaml").write_text(
+            f"module: {package}.{dirname}.main\nenabled: true\n" + manifest
+        )
+
+    def build():
+        manager = PluginManager(DummyApp())
+        manager.load_plugins()
+        return manager
+
+    yield add_plugin, build, package
+    for mod in [m for m in sys.modules if m.startswith(package)]:
+        del sys.modules[mod]
+
+
+def calls_of(package, dirname):
+    return sys.modules[f"{package}.{dirname}.main"].CALLS
+
+
+def test_provider_is_deferred_until_first_use(make_manager):
+    add_plugin, build, package = make_manager
+    add_plugin("maps", "name: Maps\nprovides: [make_thing]\n")
+    manager = build()
+
+    assert manager.plugins == []
+    assert f"{package}.maps.main" not in sys.modules
+    services = manager.app.context.services
+    assert "make_thing" in services and not services.is_built("make_thing")
+
+    assert services.get("make_thing")(3) == ("thing", 3)
+    # The lazy provider is replaced by the real bound method after activation
+    assert services.get_provider("make_thing") == manager.plugins[0].make_thing
+    assert len(manager.plugins) == 1
+    assert calls_of(package, "maps") == [("init", "maps")]
+
+
+def test_activation_loads_dependencies_and_catches_up_on_start(make_manager):
+    add_plugin, build, package = make_manager
+    add_plugin("base", "name: Base\nprovides: [base_cap]\n")
+    add_plugin("maps", "name: Maps\ndepends: [Base]\nprovides: [make_thing]\n")
+    manager = build()
+    manager.on_start()
+
+    manager.app.context.services.get("make_thing")(1)
+    assert calls_of(package, "base") == [("init", "base"), ("start", "base")]
+    assert calls_of(package, "maps") == [("init", "maps"), ("start", "maps")]
+
+
+def test_provider_needed_by_eager_plugin_loads_eagerly(make_manager):
+    add_plugin, build, package = make_manager
+    add_plugin("maps", "name: Maps\nprovides: [make_thing]\n")
+    add_plugin("game", "name: Game\ndepends: [Maps]\n")
+    manager = build()
+    assert len(manager.plugins) == 2
+    assert manager.lazy_providers == {}
+
+
+def test_disable_drops_services(make_manager):
+    add_plugin, build, package = make_manager
+    add_plugin("maps", "name: Maps\nprovides: [make_thing]\n")
+    manager = build()
+    services = manager.app.context.services
+    services.get("make_thing")
+
+    manager.disable_plugin("Maps")
+    assert "make_thing" not in services
+    assert manager.plugins == []
@@ -0,0 +1,74 @@
+# tests/test_plugin_profiler.py
+# Unit tests for PluginProfiler: rolling stats, budget reporting, throttling with dt accumulation, and recovery.
+
+import logging
+
+from core.plugin_profiler import PluginProfiler
+
+
+class DummyPlugin:
+    pass
+
+
+def run_frame(profiler, plugin, elapsed):
+    profiler.record(plugin, "on_update", elapsed)
+    profiler.end_frame()
+
+
+def test_record_keeps_hook_and_frame_stats():
+    profiler = PluginProfiler(window=4)
+    plugin = DummyPlugin()
+    profiler.register(plugin, "Slow")
+    profiler.record(plugin, "on_update", 0.002)
+    profiler.record(plugin, "on_render", 0.001)
+    profiler.end_frame()
+
+    row = profiler.report()[0]
+    assert row["name"] == "Slow"
+    assert round(row["mean_ms"], 6) == 3.0
+    assert row["hooks"]["on_update"]["calls"] == 1
+
+
+def test_over_budget_is_reported_once_and_throttles(caplog):
+    profiler = PluginProfiler(over_budget_frames=3, throttle_factor=2)
+    plugin = DummyPlugin()
+    profiler.register(plugin, "Slow", budget_ms=1.0)
+
+    with caplog.at_level(logging.WARNING, logger="core.plugin_profiler"):
+        for _ in range(5):
+            run_frame(profiler, plugin, 0.005)
+    assert sum("over budget" in r.getMessage() for r in caplog.records) == 1
+    assert profiler.get(plugin).throttle == 2
+
+    # Every second frame runs with the dt of both frames
+    assert profiler.update_step(plugin, 0.1) is None
+    assert profiler.update_step(plugin, 0.1) == 0.2
+
+
+def test_throttle_is_lifted_after_recovery():
+    profiler = PluginProfiler(over_budget_frames=1, recover_frames=2, throttle_factor=3)
+    plugin = DummyPlugin()
+    profiler.register(plugin, "Slow", budget_ms=1.0)
+    run_frame(profiler, plugin, 0.005)
+    assert profiler.get(plugin).throttle == 3
+
+    run_frame(profiler, plugin, 0.0001)
+    run_frame(profiler, plugin, 0.0001)
+    assert profiler.get(plugin).throttle == 1
+    assert profiler.update_step(plugin, 0.1) == 0.1
+
+
+def test_log_report_prints_one_line_per_plugin(caplog):
+    profiler = PluginProfiler()
+    fast, slow = DummyPlugin(), DummyPlugin()
+    profiler.register(fast, "Fast")
+    profiler.register(slow, "Slow", budget_ms=2.0)
+    profiler.record(fast, "on_update", 0.001)
+    profiler.record(slow, "on_render", 0.003)
+    profiler.end_frame()
+
+    with caplog.at_level(logging.INFO, logger="core.plugin_profiler"):
+        profiler.log_report()
+    lines = [r.getMessage() for r in caplog.records]
+    assert lines[1] == "Slow: 3.00/3.00, budget 2.00 [on_render=3.00]"
+    assert lines[2] == "Fast: 1.00/1.00 [on_update=1.00]"
@@ -0,0 +1,48 @@
+# tests/test_plugin_registry.py
+# Unit tests for PluginRegistry: indexed lookup, load order, cycle reports, and transitive dependents.
+
+from core.plugin_registry import PluginRegistry
+
+
+def meta(name, *depends):
+    return {"name": name, "module": f"plugins.{name.lower()}.main", "depends": list(depends)}
+
+
+def test_lookup_by_name_and_module():
+    registry = PluginRegistry([meta("A"), meta("B", "A")])
+    assert registry.get("B")["depends"] == ["A"]
+    assert registry.by_module("plugins.a.main")["name"] == "A"
+    assert registry.get("Missing") is None
+    assert registry.dependents["A"] == {"B"}
+
+
+def test_resolve_order_puts_dependencies_first():
+    registry = PluginRegistry([meta("C", "B"), meta("B", "A"), meta("A"), meta("D", "A", "C")])
+    order, excluded = registry.resolve_order()
+    assert excluded == {}
+    assert order.index("A") < order.index("B") < order.index("C") < order.index("D")
+
+
+def test_cycle_is_named_and_excluded():
+    registry = PluginRegistry([
+        meta("Base"), meta("X", "Y"), meta("Y", "Z"), meta("Z", "X"), meta("Leaf", "X"),
+    ])
+    order, excluded = registry.resolve_order()
+    assert order == ["Base"]
+    assert "X -> Y -> Z -> X" in excluded["X"]
+    assert "cycle" in excluded["Z"]
+    assert "cycle" not in excluded["Leaf"]
+
+
+def test_disabled_dependency_excludes_dependent():
+    registry = PluginRegistry([meta("A"), meta("B", "A"), meta("C")])
+    order, excluded = registry.resolve_order(["B", "C"])
+    assert order == ["C"]
+    assert "A" in excluded["B"]
+
+
+def test_transitive_dependents_in_unload_order():
+    registry = PluginRegistry([meta("A"), meta("B", "A"), meta("C", "B"), meta("D", "A", "C")])
+    order = registry.transitive_dependents("A")
+    assert set(order) == {"B", "C", "D"}
+    assert order.index("D") < order.index("C") < order.index("B")
@@ -0,0 +1,100 @@
+# tests/test_plugin_reload.py
+# Tests for plugin hot reload: fresh submodules, listener/context cleanup, and state hand-off.
+
+import sys
+import textwrap
+import uuid
+
+import pytest
+
+import core.plugin_manager as pm_mod
+from core.events.event_manager import EventManager
+from core.events.event_types import EventType
+from core.plugin_manager import PluginManager
+
+PLUGIN_SOURCE = textwrap.dedent('''
+    from core.events.event_types import EventType
+    from core.plugin import Plugin
+    from . import model
+
+    class PluginImpl(Plugin):
+        def on_init(self):
+            self.seen = []
+            self.count = 0
+            self.app.context.get_value = lambda: model.VALUE
+            self.app.context.event_manager.register(
+                EventType.DAY_CHANGED, lambda day: self.seen.append(day)
+            )
+        def on_before_reload(self):
+            return {"count": self.count}
+        def on_after_reload(self, state):
+            self.count = state["count"]
+''')
+
+
+class DummyContext:
+    def __init__(self):
+        self.event_manager = EventManager()
+
+
+class DummyApp:
+    def __init__(self):
+        self.context = DummyContext()
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    package = "reload_" + uuid.uuid4().hex[:8]
+    base = tmp_path / package
+    sub = base / "counter"
+    sub.mkdir(parents=True)
+    (base / "__init__.py").write_text("")
+    (sub / "__init__.py").write_text("")
+    (sub / "main.py").write_text(PLUGIN_SOURCE)
+    (sub / "model.py").write_text("VALUE = 1\n")
+    (sub / "plugin.yaml").write_text(
+        f"name: Counter\nmodule: {package}.counter.main\nenabled: true\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(pm_mod.paths, "plugins_path", str(base))
+    monkeypatch.setitem(pm_mod.paths, "plugin_index", None)
+    monkeypatch.setitem(pm_mod.paths, "plugin_state", None)
+
+    manager = PluginManager(DummyApp())
+    manager.load_plugins()
+    yield manager, sub
+    for mod in [m for m in sys.modules if m.startswith(package)]:
+        del sys.modules[mod]
+
+
+def test_reload_picks_up_changed_submodule(setup):
+    manager, sub = setup
+    context = manager.app.context
+    assert context.get_value() == 1
+
+    (sub / "model.py").write_text("VALUE = 2\n")
+    assert manager.reload_plugin("Counter") is True
+    assert context.get_value() == 2
+
+
+def test_reload_replaces_listeners_and_hands_over_state(setup):
+    manager, _ = setup
+    old = manager.plugins[0]
+    old.count = 7
+
+    manager.reload_plugin("Counter")
+    new = manager.plugins[0]
+    assert new is not old
+    assert new.count == 7
+
+    manager.app.context.event_manager.dispatch(EventType.DAY_CHANGED, day=3)
+    assert old.seen == []
+    assert new.seen == [3]
+
+
+def test_unload_undoes_registrations(setup):
+    manager, _ = setup
+    manager._unload(manager.available[0], manager.plugins[0])
+    context = manager.app.context
+    assert not hasattr(context, "get_value")
+    assert context.event_manager.listeners[EventType.DAY_CHANGED] == []
@@ -0,0 +1,76 @@
+# tests/test_plugin_scheduler.py
+# Unit tests for TickScheduler and PluginManager frequency dispatch: dt accumulation, staggering, cached overlays.
+
+import pygame
+import pytest
+
+import core.plugin_manager as pm_mod
+from core.plugin import Plugin
+from core.plugin_manager import PluginManager
+from core.plugin_scheduler import TickScheduler
+
+
+class DummyPlugin:
+    pass
+
+
+def run(scheduler, plugin, frames, dt=0.1):
+    return [scheduler.step(plugin, "on_update", dt) for _ in range(frames)]
+
+
+def test_unscheduled_hook_runs_every_frame():
+    scheduler = TickScheduler()
+    assert run(scheduler, DummyPlugin(), 3) == [0.1, 0.1, 0.1]
+
+
+def test_scheduled_hook_gets_accumulated_dt():
+    scheduler = TickScheduler()
+    plugin = DummyPlugin()
+    scheduler.register(plugin, "on_update", 2.5)  # every 0.4 s
+    steps = run(scheduler, plugin, 8)
+    fired = [round(s, 6) for s in steps if s is not None]
+    assert fired == [0.4, 0.4]
+
+
+def test_same_rate_plugins_are_staggered():
+    scheduler = TickScheduler()
+    a, b = DummyPlugin(), DummyPlugin()
+    scheduler.register(a, "on_update", 5.0)
+    scheduler.register(b, "on_update", 5.0)
+    due_a = [i for i, s in enumerate(run(scheduler, a, 10)) if s is not None]
+    due_b = [i for i, s in enumerate(run(scheduler, b, 10)) if s is not None]
+    assert len(due_a) == len(due_b)
+    assert not set(due_a) & set(due_b)
+
+
+class CountingOverlay(Plugin):
+    def __init__(self, app):
+        super().__init__(app)
+        self.renders = 0
+    def on_render(self, surface):
+        self.renders += 1
+        surface.fill((255, 0, 0, 255), pygame.Rect(0, 0, 2, 2))
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setitem(pm_mod.paths, "plugins_path", str(tmp_path))
+    monkeypatch.setitem(pm_mod.paths, "plugin_index", None)
+    monkeypatch.setitem(pm_mod.paths, "plugin_state", None)
+    return PluginManager(app=None)
+
+
+def test_render_hz_reuses_cached_overlay(manager):
+    plugin = CountingOverlay(None)
+    manager.plugins.append(plugin)
+    manager.scheduler.register(plugin, "on_render", 1.0)
+    manager._rebuild_dispatch()
+
+    screen = pygame.Surface((8, 8))
+    for _ in range(5):
+        screen.fill((0, 0, 0))
+        manager.on_update(0.1)
+        manager.on_render(screen)
+        # The cached overlay is drawn every frame
+        assert screen.get_at((0, 0))[:3] == (255, 0, 0)
+    assert plugin.renders == 1
@@ -0,0 +1,74 @@
+# tests/test_plugin_state.py
+# Unit tests for PluginStateStore: debounced background writes, atomic file contents, and manifest overrides.
+
+import json
+import time
+
+import core.plugin_manager as pm_mod
+from core.events.event_manager import EventManager
+from core.plugin_manager import PluginManager
+from core.plugin_state import PluginStateStore
+
+
+class DummyContext:
+    def __init__(self):
+        self.event_manager = EventManager()
+
+
+class DummyApp:
+    def __init__(self):
+        self.context = DummyContext()
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "state file was not written"
+        time.sleep(0.01)
+
+
+def test_changes_are_batched_into_one_write(tmp_path):
+    path = tmp_path / "state.json"
+    store = PluginStateStore(path, debounce=0.05)
+    for i in range(20):
+        store.set(f"Plugin-{i}", i % 2 == 0)
+    # In-memory state is authoritative before anything is written
+    assert store.get("Plugin-3") is False
+    wait_for(lambda: store.writes > 0)
+    time.sleep(0.1)
+    assert store.writes == 1
+    data = json.loads(path.read_text())
+    assert data["enabled"]["Plugin-0"] is True
+    assert not (tmp_path / "state.json.tmp").exists()
+    store.close()
+
+
+def test_close_flushes_pending_changes(tmp_path):
+    path = tmp_path / "state.json"
+    store = PluginStateStore(path, debounce=60.0)
+    store.set("Clock", False)
+    store.close()
+    assert PluginStateStore(path).get("Clock") is False
+
+
+def test_state_file_overrides_manifest_and_manifest_is_untouched(tmp_path, monkeypatch):
+    base = tmp_path / "plugins"
+    sub = base / "clock"
+    sub.mkdir(parents=True)
+    manifest = sub / "plugin.yaml"
+    manifest.write_text("name: Clock\nmodule: plugins.clock.main\nenabled: false\n")
+    state = tmp_path / "state.json"
+    state.write_text(json.dumps({"version": 1, "enabled": {"Clock": True}}))
+    monkeypatch.setitem(pm_mod.paths, "plugins_path", str(base))
+    monkeypatch.setitem(pm_mod.paths, "plugin_index", None)
+    monkeypatch.setitem(pm_mod.paths, "plugin_state", str(state))
+
+    manager = PluginManager(DummyApp())
+    assert manager.registry.get("Clock")["enabled"] is True
+
+    before = manifest.read_text()
+    manager.disable_plugin("Clock")
+    assert manager.registry.get("Clock")["enabled"] is False
+    manager.state_store.close()
+    assert manifest.read_text() == before
+    assert json.loads(state.read_text())["enabled"]["Clock"] is False
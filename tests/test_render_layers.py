@@ -0,0 +1,65 @@
+# tests/test_render_layers.py
+# Unit tests for retained plugin render layers: redraw on mark_dirty only, z-ordered compositing.
+
+import pygame
+import pytest
+
+import core.plugin_manager as pm_mod
+from core.plugin import Plugin
+from core.plugin_manager import PluginManager
+
+
+class Square(Plugin):
+    retained = True
+
+    def __init__(self, app, color, z=0):
+        super().__init__(app)
+        self.color = color
+        self.render_z = z
+        self.renders = 0
+
+    def on_render(self, surface):
+        self.renders += 1
+        surface.fill(self.color, pygame.Rect(2, 2, 3, 3))
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setitem(pm_mod.paths, "plugins_path", str(tmp_path))
+    monkeypatch.setitem(pm_mod.paths, "plugin_index", None)
+    monkeypatch.setitem(pm_mod.paths, "plugin_state", None)
+    return PluginManager(app=None)
+
+
+def frames(manager, count):
+    screen = pygame.Surface((16, 16))
+    for _ in range(count):
+        screen.fill((0, 0, 0))
+        manager.on_update(0.016)
+        manager.on_render(screen)
+    return screen
+
+
+def test_retained_layer_redraws_only_when_dirty(manager):
+    plugin = Square(None, (255, 0, 0, 255))
+    manager.plugins.append(plugin)
+    manager._rebuild_dispatch()
+
+    screen = frames(manager, 5)
+    assert plugin.renders == 1
+    assert screen.get_at((3, 3))[:3] == (255, 0, 0)
+    assert screen.get_at((8, 8))[:3] == (0, 0, 0)
+
+    plugin.mark_dirty()
+    frames(manager, 3)
+    assert plugin.renders == 2
+
+
+def test_layers_are_composited_in_z_order(manager):
+    top = Square(None, (0, 0, 255, 255), z=10)
+    bottom = Square(None, (255, 0, 0, 255), z=-1)
+    manager.plugins.extend([top, bottom])
+    manager._rebuild_dispatch()
+
+    screen = frames(manager, 1)
+    assert screen.get_at((3, 3))[:3] == (0, 0, 255)
@@ -0,0 +1,112 @@
+# tests/test_scene_loading.py
+# Tests for background scene preparation, the loading phase, and idle-frame prewarming.
+
+import threading
+import time
+from collections import OrderedDict
+
+import pygame
+import pytest
+
+from core.scene_manager import SceneManager
+from core.scene_registry import scene_registry
+from themes.theme_manager import get_color
+from ui import font_cache
+from ui.components.label import UILabel
+
+pygame.init()
+
+
+class DummyContext:
+    ui_manager = None
+
+
+class SlowScene:
+    release = threading.Event()
+
+    @classmethod
+    def prepare(cls, context):
+        cls.release.wait(5)
+        return {"rows": 3}
+
+    def __init__(self, context, switch_scene_callback, prepared=None):
+        self.prepared = prepared
+        self.ui = object()
+        self.events = []
+
+    def handle_event(self, event):
+        self.events.append(event)
+
+    def update(self):
+        pass
+
+    def draw(self, surface):
+        pass
+
+
+class QuickScene(SlowScene):
+    prepare = None
+
+    def __init__(self, context, switch_scene_callback):
+        super().__init__(context, switch_scene_callback)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(font_cache, "configured_fonts", lambda: [])
+    monkeypatch.setitem(scene_registry, "slow", SlowScene)
+    monkeypatch.setitem(scene_registry, "quick", QuickScene)
+    SlowScene.release.clear()
+    manager = SceneManager(DummyContext(), app=None)
+    yield manager
+    SlowScene.release.set()
+    manager.shutdown()
+
+
+def wait_loaded(manager):
+    deadline = time.monotonic() + 5
+    while manager.loading is not None:
+        assert time.monotonic() < deadline
+        manager.update()
+        time.sleep(0.01)
+
+
+def test_switch_waits_for_preparation(manager):
+    manager.switch_scene("quick")
+    quick = manager.current_scene
+    manager.switch_scene("slow")
+    assert manager.loading == "slow"
+    manager.update()
+    # The old scene stays current but does not receive input while loading
+    manager.handle_event("click")
+    assert manager.current_scene is quick and quick.events == []
+
+    SlowScene.release.set()
+    wait_loaded(manager)
+    assert isinstance(manager.current_scene, SlowScene)
+    assert manager.current_scene.prepared == {"rows": 3}
+
+
+def test_prewarm_builds_scene_on_idle_frames(manager):
+    SlowScene.release.set()
+    manager.prewarm(["slow"])
+    deadline = time.monotonic() + 5
+    while "slow" not in manager.scene_cache:
+        assert time.monotonic() < deadline
+        manager.update()
+        time.sleep(0.01)
+    manager.switch_scene("slow")
+    assert manager.loading is None
+    assert manager.current_scene is manager.scene_cache["slow"]
+
+
+def test_text_rendered_in_prepare_is_reused_by_labels(monkeypatch):
+    renders = []
+    rendered = pygame.Surface((30, 10))
+    font = type("Font", (), {"render": lambda self, text, *a: renders.append(text) or rendered})()
+    monkeypatch.setattr(font_cache, "get_font", lambda name, size: font)
+    monkeypatch.setattr(font_cache, "_texts", OrderedDict())
+
+    font_cache.warm_texts([("arial", 18, "Prepared")], get_color("foreground"))
+    label = UILabel(x=0, y=0, text="Prepared", font_size=18, font_name="arial")
+    assert renders == ["Prepared"] and label.rect.size == (30, 10)
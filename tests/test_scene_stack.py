@@ -0,0 +1,126 @@
+# tests/test_scene_stack.py
+# Tests for pushing/popping overlay scenes, snapshots, and background update policies.
+
+import pygame
+import pytest
+
+from core.scene_manager import SceneManager
+from core.scene_registry import scene_registry
+from ui import font_cache
+
+
+class DummyContext:
+    ui_manager = None
+
+
+class DummyScene:
+    prepare = None
+    background_update = "none"
+    color = (10, 20, 30)
+
+    def __init__(self, context, switch_scene_callback):
+        self.ui = object()
+        self.updates = 0
+        self.draws = 0
+        self.events = []
+
+    def handle_event(self, event):
+        self.events.append(event)
+
+    def update(self):
+        self.updates += 1
+
+    def draw(self, surface):
+        self.draws += 1
+        surface.fill(self.color)
+
+
+class FullScene(DummyScene):
+    background_update = "full"
+
+
+class ReducedScene(DummyScene):
+    background_update = "reduced"
+    background_hz = 4.0
+
+
+class OverlayScene(DummyScene):
+    opaque = False
+
+    def __init__(self, context, switch_scene_callback, pop_scene_callback):
+        super().__init__(context, switch_scene_callback)
+        self.pop = pop_scene_callback
+
+    def draw(self, surface):
+        self.draws += 1
+        pygame.draw.rect(surface, (200, 0, 0), (0, 0, 4, 4))
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(font_cache, "configured_fonts", lambda: [])
+    for key, cls in [("base", DummyScene), ("full", FullScene),
+                     ("reduced", ReducedScene), ("overlay", OverlayScene)]:
+        monkeypatch.setitem(scene_registry, key, cls)
+    manager = SceneManager(DummyContext(), app=None)
+    yield manager
+    manager.shutdown()
+
+
+def test_push_and_pop_restore_scene_and_ui(manager):
+    manager.switch_scene("base")
+    base = manager.current_scene
+    manager.push_scene("overlay")
+    overlay = manager.current_scene
+    assert manager.stack == [base, overlay]
+    assert manager.context.ui_manager is overlay.ui
+    manager.handle_event("click")
+    assert overlay.events == ["click"] and base.events == []
+
+    overlay.pop()
+    assert manager.stack == [base]
+    assert manager.context.ui_manager is base.ui
+    manager.pop_scene()  # the last scene is never popped
+    assert manager.stack == [base]
+
+
+def test_toggle_overlay_and_switch_clears_stack(manager):
+    manager.switch_scene("base")
+    manager.toggle_overlay("overlay")
+    assert manager.current_key == "overlay"
+    manager.toggle_overlay("overlay")
+    assert manager.current_key == "base"
+
+    manager.push_scene("overlay")
+    manager.switch_scene("full")
+    assert manager.stack == [manager.scene_cache["full"]]
+
+
+def test_covered_scene_drawn_from_snapshot(manager):
+    surface = pygame.Surface((8, 8))
+    manager.switch_scene("base")
+    base = manager.current_scene
+    manager.push_scene("overlay")
+    for _ in range(3):
+        manager.update(1 / 60)
+        manager.draw(surface)
+    assert base.draws == 1
+    assert base.updates == 0
+    assert surface.get_at((6, 6))[:3] == DummyScene.color
+    assert surface.get_at((1, 1))[:3] == (200, 0, 0)
+
+
+@pytest.mark.parametrize("key, updates, draws", [
+    ("full", 60, 60), ("reduced", 4, 5), ("base", 0, 1)
+])
+def test_background_update_policies(manager, key, updates, draws):
+    surface = pygame.Surface((8, 8))
+    manager.switch_scene(key)
+    covered = manager.current_scene
+    manager.push_scene("overlay")
+    for _ in range(60):
+        manager.update(1 / 60)
+        manager.draw(surface)
+    assert covered.updates == updates
+    # The snapshot is drawn on push and redrawn after each background update
+    assert covered.draws == draws
@@ -0,0 +1,112 @@
+# tests/test_scene_transitions.py
+# Tests for scene transitions blended from cached off-screen surfaces.
+
+import pygame
+import pytest
+
+import setup.config as Config
+from core.scene_manager import SceneManager
+from core.scene_registry import scene_registry
+from core.scene_transitions import (
+    CrossfadeTransition, SceneTransition, SlideTransition, create_transition
+)
+from ui import font_cache
+
+
+class DummyContext:
+    ui_manager = None
+
+
+class RedScene:
+    prepare = None
+    color = (255, 0, 0)
+
+    def __init__(self, context, switch_scene_callback):
+        self.ui = object()
+        self.draws = 0
+
+    def handle_event(self, event):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, surface):
+        self.draws += 1
+        surface.fill(self.color)
+
+
+class BlueScene(RedScene):
+    color = (0, 0, 255)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(font_cache, "configured_fonts", lambda: [])
+    monkeypatch.setitem(scene_registry, "red", RedScene)
+    monkeypatch.setitem(scene_registry, "blue", BlueScene)
+    monkeypatch.setitem(Config.scenes, "transition", {"type": "crossfade", "duration": 0.5})
+    manager = SceneManager(DummyContext(), app=None)
+    yield manager
+    manager.shutdown()
+
+
+def test_transition_draws_each_scene_once(manager):
+    surface = pygame.Surface((10, 10))
+    manager.switch_scene("red")
+    red = manager.current_scene
+    manager.draw(surface)
+    manager.switch_scene("blue")
+    blue = manager.current_scene
+    assert manager.transition is not None
+
+    for _ in range(10):
+        manager.draw(surface)
+        manager.update(0.02)
+    assert (red.draws, blue.draws) == (2, 1)
+    # Halfway through the colours are blended
+    r, _, b = surface.get_at((5, 5))[:3]
+    assert 0 < r < 255 and 0 < b < 255
+
+    for _ in range(20):
+        manager.update(0.02)
+    assert manager.transition is None
+    manager.draw(surface)
+    assert blue.draws == 2
+    assert surface.get_at((5, 5))[:3] == BlueScene.color
+
+
+def test_no_transition_when_disabled(manager, monkeypatch):
+    monkeypatch.setitem(Config.scenes, "transition", {"type": "none"})
+    manager.switch_scene("red")
+    manager.switch_scene("blue")
+    assert manager.transition is None
+
+
+def test_slide_positions_surfaces():
+    target = pygame.Surface((10, 4))
+    slide = SlideTransition(duration=1.0, direction="left")
+    slide.outgoing = pygame.Surface((10, 4))
+    slide.outgoing.fill(RedScene.color)
+    slide.incoming = pygame.Surface((10, 4))
+    slide.incoming.fill(BlueScene.color)
+    slide.advance(0.5)
+    slide.draw(target)
+    assert target.get_at((0, 0))[:3] == RedScene.color
+    assert target.get_at((9, 0))[:3] == BlueScene.color
+
+
+def test_create_transition_from_settings():
+    assert isinstance(create_transition({"type": "crossfade"}), CrossfadeTransition)
+    slide = create_transition({"type": "slide", "duration": 1.0, "direction": "right"})
+    assert slide.direction == "right" and slide.duration == 1.0
+    assert create_transition({"type": "spin"}) is None
+    assert create_transition(None) is None
+
+
+def test_transition_without_draw_cannot_be_created():
+    class Incomplete(SceneTransition):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(duration=1.0)
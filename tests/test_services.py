@@ -0,0 +1,59 @@
+# tests/test_services.py
+# Unit tests for ServiceRegistry: lazy providers, cached lookups, typed keys, and owner cleanup.
+
+import pytest
+
+from core.services import ServiceRegistry
+
+
+class Clock:
+    pass
+
+
+def test_lazy_provider_is_built_once_on_first_lookup():
+    services = ServiceRegistry()
+    built = []
+    services.register("clock", lambda: built.append(1) or Clock(), lazy=True)
+    assert built == [] and not services.is_built("clock")
+
+    first = services.get("clock")
+    assert services.get("clock") is first
+    assert built == [1]
+
+
+def test_missing_service_raises_or_returns_default():
+    services = ServiceRegistry()
+    with pytest.raises(KeyError):
+        services.get("missing")
+    assert services.get("missing", None) is None
+
+
+def test_typed_keys_are_checked():
+    services = ServiceRegistry()
+    services.register(Clock, Clock())
+    assert isinstance(services.get(Clock), Clock)
+    with pytest.raises(TypeError):
+        services.register(Clock, object())
+    services.register(Clock, object, lazy=True)
+    with pytest.raises(TypeError):
+        services.get(Clock)
+
+
+def test_self_referencing_provider_is_reported():
+    services = ServiceRegistry()
+    services.register("loop", lambda: services.get("loop"), lazy=True)
+    with pytest.raises(LookupError):
+        services.get("loop")
+
+
+def test_unregister_owner_drops_only_its_services():
+    services = ServiceRegistry()
+    with services.owned_by("Calendar"):
+        services.register("calendar", Clock())
+    services.register("daytime", Clock(), owner="Daytime")
+    # Replacing a service transfers ownership
+    services.register("shared", Clock(), owner="Calendar")
+    services.register("shared", Clock(), owner="Daytime")
+
+    assert services.unregister_owner("Calendar") == 1
+    assert services.keys() == ["daytime", "shared"]
@@ -0,0 +1,71 @@
+# tests/test_spatial_index.py
+# Tests for the UI hit-test grid and pointer/keyboard routing in UIManager and UITable.
+
+import pygame
+
+from ui.components.table import UITable
+from ui.spatial_index import SpatialIndex
+from ui_helpers import DummyElement, click, key
+
+pygame.init()
+
+
+def test_query_returns_topmost_first_and_follows_moves():
+    index = SpatialIndex(cell_size=16)
+    below, above = DummyElement(0, 0, 40, 40), DummyElement(10, 10, 10, 10)
+    index.insert(below, below.rect)
+    index.insert(above, above.rect)
+    assert index.query_point((15, 15)) == [above, below]
+    assert index.topmost((35, 35)) is below
+
+    above.rect.topleft = (100, 100)
+    index.update(above, above.rect)
+    assert index.query_point((15, 15)) == [below]
+    assert index.topmost((105, 105)) is above
+
+    index.remove(below)
+    assert index.topmost((15, 15)) is None
+    assert len(index) == 1
+
+
+def test_pointer_events_reach_only_topmost_element(ui):
+    below, above = DummyElement(0, 0, 100, 100), DummyElement(10, 10, 20, 20)
+    other = DummyElement(200, 0, 10, 10)
+    for element in (below, above, other):
+        ui.add(element)
+    ui.handle_event(click((15, 15)))
+    assert (below.events, above.events, other.events) == ([], [pygame.MOUSEBUTTONDOWN], [])
+
+    # set_position keeps the index in sync
+    above.set_position(300, 300)
+    ui.handle_event(click((15, 15)))
+    assert below.events == [pygame.MOUSEBUTTONDOWN]
+
+
+def test_keyboard_events_go_to_focused_element(ui):
+    first, second = DummyElement(0, 0, focusable=True), DummyElement(20, 0, focusable=True)
+    ui.add(first)
+    ui.add(second)
+    ui.handle_event(key(pygame.K_a))
+    assert first.events == [] and second.events == []
+
+    ui.focus_next()
+    ui.handle_event(key(pygame.K_a))
+    assert first.events == [pygame.KEYDOWN] and second.events == []
+
+    # Clicking elsewhere removes focus
+    ui.handle_event(click((25, 5)))
+    assert not first.focused and ui.focused_element is None
+
+
+def test_table_routes_clicks_to_cell_arithmetically():
+    table = UITable(x=10, y=10, column_widths=[50, 30], row_height=20, headers=["A", "B"])
+    cells = [DummyElement(0, 0, 20, 10) for _ in range(4)]
+    table.add_row(["a", cells[0]])
+    table.add_row([cells[1], cells[2]])
+    assert table.cell_at((65, 35)) is cells[0]
+    assert table.cell_at((15, 55)) is cells[1]
+    assert table.cell_at((15, 15)) is None  # header row
+
+    table.handle_event(click((70, 55)))
+    assert [len(c.events) for c in cells[:3]] == [0, 0, 1]
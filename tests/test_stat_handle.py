@@ -0,0 +1,43 @@
+# tests/test_stat_handle.py
+# Unit tests for StatHandle: cached resolution, clamping, and event dispatch parity with StatManager.
+
+import pytest
+
+from core.events.event_types import EventType
+
+
+def test_handle_is_cached_per_key(stat_manager):
+    # Repeated lookups return the same resolved handle
+    assert stat_manager.handle("energy") is stat_manager.handle("energy")
+
+
+def test_handle_unknown_key_raises(stat_manager):
+    with pytest.raises(KeyError):
+        stat_manager.handle("unknown")
+
+
+def test_handle_set_clamps_and_dispatches(stat_manager):
+    # Values are clamped to the configured range and the stat event fires
+    h = stat_manager.handle("energy")
+    assert h.set(500) is True
+    assert h.value == 150
+    assert stat_manager.get("energy") == 150
+    assert stat_manager.event_manager.dispatched == [
+        (EventType.ENERGY_CHANGED, (), {"new_value": 150})
+    ]
+
+
+def test_handle_add_no_change_returns_false(stat_manager):
+    # Adding past the bound when already clamped is a no-op without events
+    h = stat_manager.handle("health")
+    assert h.add(-80) is True
+    assert h.value == 0
+    assert h.add(-1) is False
+    assert len(stat_manager.event_manager.dispatched) == 1
+
+
+def test_handle_sees_changes_made_through_manager(stat_manager):
+    # Handle and manager share the same underlying value storage
+    h = stat_manager.handle("energy")
+    stat_manager.modify("energy", -30)
+    assert h.value == 70
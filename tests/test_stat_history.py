@@ -0,0 +1,89 @@
+# tests/test_stat_history.py
+# Unit tests for StatHistory: ring buffer wrap-around, rollups, export, and StatManager wiring.
+
+import io
+import json
+import math
+
+from core.events.event_manager import EventManager
+from core.events.event_types import EventType
+from core.stat_history import RingSeries, StatHistory
+from core.stat_manager import StatManager
+
+
+def test_ring_series_overwrites_oldest_rows():
+    # Capacity 3: the fourth append drops the first row
+    ring = RingSeries(3, ["a"])
+    for t in range(4):
+        ring.append(float(t), {"a": t * 10.0})
+    assert len(ring) == 3
+    assert ring.column("a") == ([1.0, 2.0, 3.0], [10.0, 20.0, 30.0])
+
+
+def test_ring_series_new_column_reads_nan_for_old_rows():
+    # Rows written before a column existed are NaN, later rows are stored
+    ring = RingSeries(4, ["a"])
+    ring.append(0.0, {"a": 1.0})
+    ring.add_column("b")
+    ring.append(1.0, {"a": 2.0, "b": 5.0})
+    _, values = ring.column("b")
+    assert math.isnan(values[0]) and values[1] == 5.0
+
+
+def test_tick_interval_limits_samples():
+    # Samples closer together than the interval are skipped
+    history = StatHistory(["energy"], tick_interval=1.0)
+    assert history.record(0.0, {"energy": 1}) is True
+    assert history.record(0.5, {"energy": 2}) is False
+    assert history.record(1.0, {"energy": 3}) is True
+    assert history.get_series("energy") == ([0.0, 1.0], [1.0, 3.0])
+
+
+def test_rollup_stores_mean_min_max_and_resets():
+    # A phase rollup aggregates all samples since the previous rollup
+    history = StatHistory(["energy"])
+    for t, v in enumerate([10, 20, 60]):
+        history.record(float(t), {"energy": v})
+    history.rollup("phase", 3.0)
+    history.record(4.0, {"energy": 5})
+    history.rollup("phase", 5.0)
+
+    assert history.get_series("energy", "phase", "mean") == ([3.0, 5.0], [30.0, 5.0])
+    assert history.get_series("energy", "phase", "min")[1] == [10.0, 5.0]
+    assert history.get_series("energy", "phase", "max")[1] == [60.0, 5.0]
+    # The day bucket is still open and keeps accumulating all four samples
+    history.rollup("day", 6.0)
+    assert history.get_series("energy", "day", "mean")[1] == [23.75]
+
+
+def test_export_csv_and_jsonl_stream_rows():
+    # Exports write a header (CSV) and one row/object per sample
+    history = StatHistory(["energy", "health"])
+    history.record(0.0, {"energy": 1, "health": 2})
+    history.record(1.0, {"energy": 3, "health": 4})
+
+    csv_out = io.StringIO()
+    assert history.export_csv(csv_out, stats=["energy"]) == 2
+    assert csv_out.getvalue().splitlines() == ["time,energy", "0.0,1.0", "1.0,3.0"]
+
+    jsonl_out = io.StringIO()
+    assert history.export_jsonl(jsonl_out) == 2
+    first = json.loads(jsonl_out.getvalue().splitlines()[0])
+    assert first == {"time": 0.0, "energy": 1.0, "health": 2.0}
+
+
+def test_stat_manager_records_and_rolls_up_on_events(stats_config_file):
+    # update() samples stats; DAYTIME_CHANGED and DAY_CHANGED close buckets
+    events = EventManager()
+    sm = StatManager(events, config_path=stats_config_file)
+    history = sm.enable_history()
+
+    sm.update(1.0)
+    sm.set("energy", 50)
+    sm.update(1.0)
+    events.dispatch(EventType.DAYTIME_CHANGED, phase="Afternoon")
+    events.dispatch(EventType.DAY_CHANGED, day=2)
+
+    assert history.get_series("energy") == ([1.0, 2.0], [100.0, 50.0])
+    assert history.get_series("energy", "phase")[1] == [75.0]
+    assert history.get_series("health", "day", "max") == ([2.0], [50.0])
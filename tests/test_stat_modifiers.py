@@ -0,0 +1,63 @@
+# tests/test_stat_modifiers.py
+# Unit tests for timed stat modifiers: stacking, clamping, heap expiry, and event dispatch.
+
+import pytest
+
+from core.events.event_types import EventType
+from core.stat_modifiers import StatModifier, apply_modifiers
+
+
+def test_apply_modifiers_adds_before_multiplying():
+    mods = [StatModifier("x", 10), StatModifier("x", 2, kind="mul")]
+    assert apply_modifiers(5, mods) == 30
+
+
+def test_unknown_kind_raises():
+    with pytest.raises(ValueError):
+        StatModifier("x", 1, kind="pow")
+
+
+def test_modifier_changes_effective_not_base(stat_manager):
+    # Effective value is clamped; the base value is left untouched
+    stat_manager.add_modifier("energy", 80)
+    assert stat_manager.get("energy") == 150
+    assert stat_manager.get_base("energy") == 100
+    assert stat_manager.handle("energy").value == 150
+    assert stat_manager.event_manager.dispatched == [
+        (EventType.ENERGY_CHANGED, (), {"new_value": 150})
+    ]
+
+
+def test_timed_modifiers_expire_in_order(stat_manager):
+    stat_manager.add_modifier("health", 10, duration=2.0)
+    stat_manager.add_modifier("health", 2, kind="mul", duration=5.0)
+    assert stat_manager.get("health") == 100
+
+    stat_manager.update(1.0)
+    assert stat_manager.get("health") == 100
+    stat_manager.update(1.5)
+    assert stat_manager.get("health") == 100  # additive expired; 50 * 2 hits the max
+    stat_manager.update(3.0)
+    assert stat_manager.get("health") == 50
+    assert stat_manager.get_modifiers("health") == []
+
+
+def test_removed_modifier_is_skipped_on_expiry(stat_manager):
+    # Early removal leaves a stale heap entry that must be ignored
+    mod = stat_manager.add_modifier("health", -20, duration=1.0)
+    assert stat_manager.remove_modifier(mod) is True
+    assert stat_manager.remove_modifier(mod) is False
+    stat_manager.event_manager.dispatched.clear()
+    stat_manager.update(2.0)
+    assert stat_manager.get("health") == 50
+    assert stat_manager.event_manager.dispatched == []
+
+
+def test_remove_by_source_and_base_changes_reapply(stat_manager):
+    stat_manager.add_modifier("energy", 0.5, kind="mul", source="sick")
+    stat_manager.add_modifier("health", -10, source="sick")
+    stat_manager.set("energy", 80)
+    assert stat_manager.get("energy") == 40
+    assert stat_manager.remove_modifiers_by_source("sick") == 2
+    assert stat_manager.get("energy") == 80
+    assert stat_manager.get("health") == 50
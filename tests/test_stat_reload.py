@@ -0,0 +1,69 @@
+# tests/test_stat_reload.py
+# Unit tests for live reload of the stats config: diff migration, event emission, and the file watcher.
+
+import json
+
+from core.events.event_types import EventType
+from core.file_watcher import FileWatcher
+
+
+def test_reload_migrates_state_and_emits_only_changes(stat_manager, stats_config_file):
+    handle = stat_manager.handle("energy")
+    stat_manager.set("health", 80)
+    stat_manager.event_manager.dispatched.clear()
+
+    new_config = {
+        "energy": {"initial": 100, "min": 0, "max": 60, "event_type": "ENERGY_CHANGED"},
+        "health": {"initial": 10, "min": 0, "max": 100, "event_type": "HEALTH_CHANGED"},
+        "hunger": {"initial": 5, "min": 0, "max": 10, "event_type": "ENERGY_CHANGED"}
+    }
+    stats_config_file.write_text(json.dumps(new_config))
+    assert stat_manager.reload_config() is True
+
+    # energy is re-clamped, health keeps its session value, hunger is added
+    assert stat_manager.get("energy") == 60
+    assert stat_manager.get("health") == 80
+    assert stat_manager.get("hunger") == 5
+    assert stat_manager.event_manager.dispatched == [
+        (EventType.ENERGY_CHANGED, (), {"new_value": 60})
+    ]
+    # Existing handles pick up the new bounds
+    handle.set(1000)
+    assert handle.value == 60
+
+
+def test_reload_drops_removed_stats(stat_manager, stats_config_file):
+    stat_manager.enable_history()
+    stat_manager.add_modifier("health", 5)
+    energy = json.loads(stats_config_file.read_text())["energy"]
+    stats_config_file.write_text(json.dumps({"energy": energy}))
+    stat_manager.reload_config()
+
+    assert "health" not in stat_manager.stats
+    assert stat_manager.get_modifiers("health") == []
+    assert "health" not in stat_manager.history.series["tick"].columns
+
+
+def test_invalid_reload_keeps_state(stat_manager, stats_config_file):
+    stats_config_file.write_text("{ not json")
+    assert stat_manager.reload_config() is False
+    assert stat_manager.get("health") == 50
+
+
+def test_file_watcher_debounces_changes(tmp_path):
+    path = tmp_path / "watched.json"
+    path.write_text("a")
+    now = [0.0]
+    calls = []
+    watcher = FileWatcher(str(path), calls.append, interval=0.0, debounce=1.0,
+                          clock=lambda: now[0])
+
+    assert watcher.poll() is False
+    path.write_text("changed")
+    assert watcher.poll() is False  # change seen, settle timer started
+    now[0] = 0.5
+    assert watcher.poll() is False
+    now[0] = 1.5
+    assert watcher.poll() is True
+    assert calls == [str(path)]
+    assert watcher.poll() is False
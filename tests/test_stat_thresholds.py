@@ -0,0 +1,56 @@
+# tests/test_stat_thresholds.py
+# Unit tests for ThresholdIndex: crossing semantics, direction filtering, removal, and StatManager wiring.
+
+from core.stat_thresholds import ThresholdIndex
+
+
+def test_crossing_fires_in_crossing_order():
+    index = ThresholdIndex()
+    calls = []
+    for v in (10, 50, 30):
+        index.add("x", v, lambda old, new, v=v: calls.append(v))
+    assert index.check("x", 60, 5) == 3
+    assert calls == [50, 30, 10]
+    calls.clear()
+    assert index.check("x", 5, 30) == 2
+    assert calls == [10, 30]
+
+
+def test_boundary_and_direction_filtering():
+    # Reaching the value counts as rising, leaving it downwards as falling
+    index = ThresholdIndex()
+    calls = []
+    index.add("x", 10, lambda old, new: calls.append("up"), direction="up")
+    index.add("x", 10, lambda old, new: calls.append("down"), direction="down")
+    index.check("x", 9, 10)
+    index.check("x", 10, 11)
+    index.check("x", 11, 9.5)
+    assert calls == ["up", "down"]
+
+
+def test_removed_threshold_does_not_fire():
+    index = ThresholdIndex()
+    calls = []
+    token = index.add("x", 10, lambda old, new: calls.append(1))
+    assert index.remove(token) is True
+    assert index.remove(token) is False
+    assert "x" not in index
+    assert index.check("x", 0, 20) == 0
+    assert calls == []
+
+
+def test_manager_fires_on_effective_value_changes(stat_manager):
+    # Both base changes and modifiers can cross a threshold
+    calls = []
+    stat_manager.add_threshold("energy", 10, lambda old, new: calls.append((old, new)), "down")
+    stat_manager.set("energy", 20)
+    stat_manager.add_modifier("energy", -15)
+    assert calls == [(20, 5)]
+
+
+def test_failing_callback_does_not_block_others(stat_manager):
+    calls = []
+    stat_manager.add_threshold("energy", 50, lambda old, new: 1 / 0)
+    stat_manager.add_threshold("energy", 50, lambda old, new: calls.append(new))
+    stat_manager.set("energy", 40)
+    assert calls == [40]
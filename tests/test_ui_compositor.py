@@ -0,0 +1,97 @@
+# tests/test_ui_compositor.py
+# Tests for retained UI compositing: dirty flags, partial repaints and cached text.
+
+import pygame
+
+import themes.theme_manager as theme_manager
+from ui.components.label import UILabel
+from ui.components.panel import UIPanel
+from ui.components.table import UITable
+from ui_helpers import DummyElement as Box
+
+pygame.init()
+
+BACKGROUND = (0, 0, 0)
+
+
+def test_clean_frames_do_not_redraw_elements(ui):
+    a, b = Box(0, 0), Box(100, 100)
+    ui.add(a)
+    ui.add(b)
+    surface = pygame.Surface((200, 200))
+    for _ in range(5):
+        ui.draw(surface, background=BACKGROUND)
+    assert (a.draws, b.draws) == (1, 1)
+    assert surface.get_at((5, 5))[:3] == (200, 0, 0)
+
+    b.set_hovered(True)
+    ui.draw(surface, background=BACKGROUND)
+    assert (a.draws, b.draws) == (1, 2)
+
+
+def test_move_repaints_old_and_new_area(ui):
+    box = Box(0, 0)
+    ui.add(box)
+    surface = pygame.Surface((100, 100))
+    ui.draw(surface, background=BACKGROUND)
+    box.set_position(50, 50)
+    ui.draw(surface, background=BACKGROUND)
+    assert surface.get_at((5, 5))[:3] == BACKGROUND
+    assert surface.get_at((55, 55))[:3] == (200, 0, 0)
+
+
+def test_dirty_flag_propagates_to_container(ui):
+    panel = UIPanel(x=0, y=0, width=50, height=50, padding=0)
+    child = Box(5, 5)
+    panel.add(child)
+    ui.add(panel)
+    ui.draw(pygame.Surface((100, 100)), background=BACKGROUND)
+    assert not panel.dirty and not child.dirty
+
+    child.set_focus(True)
+    assert child.dirty and panel.dirty
+    ui.draw(pygame.Surface((100, 100)), background=BACKGROUND)
+    assert not panel.dirty and not child.dirty
+
+
+def test_theme_switch_repaints_everything(ui, monkeypatch):
+    box = Box(0, 0)
+    ui.add(box)
+    surface = pygame.Surface((50, 50))
+    ui.draw(surface, background=BACKGROUND)
+    monkeypatch.setattr(theme_manager, "_theme_version", theme_manager.get_theme_version() + 1)
+    ui.draw(surface, background=BACKGROUND)
+    assert box.draws == 2
+
+
+def test_label_renders_text_only_on_change(ui, monkeypatch):
+    label = UILabel(x=0, y=0, text="a")
+    renders = []
+    real_render = label.font.render
+    monkeypatch.setattr(label, "font", type("Font", (), {
+        "render": lambda self, *a: renders.append(a[0]) or real_render(*a),
+        "size": lambda self, text: (8 * len(text), 10),
+    })())
+    surface = pygame.Surface((50, 50))
+    for _ in range(3):
+        label.draw(surface)
+    assert renders == []
+    label.set_text("bb")
+    label.draw(surface)
+    label.draw(surface)
+    assert renders == ["bb"] and label.rect.size == (16, 10)
+
+
+def test_cached_cell_labels_follow_a_moved_table(ui):
+    table = UITable(x=0, y=0, column_widths=[80], row_height=20)
+    table.add_row(["hello"])
+    ui.add(table)
+    surface = pygame.Surface((300, 300))
+    ui.draw(surface, background=BACKGROUND)
+    label = table._cell_labels[(0, 0)]
+    assert label.rect.topleft == (5, 5)
+
+    table.set_position(200, 200)
+    ui.draw(surface, background=BACKGROUND)
+    assert table._cell_labels[(0, 0)] is label
+    assert label.rect.topleft == (205, 205)
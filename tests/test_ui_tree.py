@@ -0,0 +1,130 @@
+# tests/test_ui_tree.py
+# Tests for the UI container tree: ownership, subtree registration, hide, disable, move and remove.
+
+import pygame
+import pytest
+
+from ui.components.container import UIContainer
+from ui.components.panel import UIPanel
+from ui.components.table import UITable
+from ui.layout.vertical import VerticalLayout
+from ui_helpers import DummyElement, click
+
+pygame.init()
+
+
+def leaf(name, **kwargs):
+    return DummyElement(width=20, name=name, focusable=True, **kwargs)
+
+
+@pytest.fixture
+def tree(ui):
+    """A layout holding a leaf and a panel with two leaves."""
+    root = VerticalLayout(x=0, y=0, spacing=0)
+    top = leaf("top")
+    panel = UIPanel(x=0, y=0, padding=0)
+    a, b = leaf("a", animating=True), leaf("b")
+    panel.add(a)
+    b.set_position(20, 0)
+    panel.add(b)
+    root.add(top)
+    root.add(panel)
+    ui.add(root)
+    return root, top, panel, a, b
+
+
+def test_containers_own_children_and_register_leaves(ui, tree):
+    root, top, panel, a, b = tree
+    assert root.children == [top, panel] and a.parent is panel and panel.parent is root
+    assert a.ui_manager is ui
+    assert len(ui.spatial_index) == 3 and panel not in ui.spatial_index
+    assert [e.name for e in ui.focus_ring] == ["top", "a", "b"]
+
+    ui.handle_event(click(b.rect.center))
+    assert b.events == [pygame.MOUSEBUTTONDOWN] and a.events == []
+
+
+def test_hidden_subtree_leaves_input_focus_and_updates(ui, tree):
+    root, top, panel, a, b = tree
+    ui.focus(b)
+    panel.set_visible(False)
+    assert ui.focused_element is None and not b.focused
+    assert list(ui.focus_ring) == [top] and a not in ui.spatial_index
+    ui.update()
+    assert a.updates == 0
+
+    surface = pygame.Surface((100, 100))
+    ui.draw(surface, background=(0, 0, 0))
+    assert surface.get_at(a.rect.center)[:3] == (0, 0, 0)
+
+    panel.set_visible(True)
+    ui.update()
+    ui.draw(surface, background=(0, 0, 0))
+    assert a.updates == 1 and b in ui.spatial_index
+    assert surface.get_at(a.rect.center)[:3] == (200, 0, 0)
+
+
+def test_disabled_subtree_keeps_updating_without_input(ui, tree):
+    root, top, panel, a, b = tree
+    panel.set_enabled(False)
+    ui.handle_event(click(a.rect.center))
+    ui.update()
+    assert a.events == [] and a.updates == 1
+    assert list(ui.focus_ring) == [top]
+
+    # Children of a disabled container stay inert when re-enabled themselves
+    a.set_enabled(True)
+    assert a not in ui.spatial_index
+    panel.set_enabled(True)
+    ui.handle_event(click(a.rect.center))
+    assert a.events == [pygame.MOUSEBUTTONDOWN]
+
+
+def test_moving_a_container_moves_and_reindexes_subtree(ui, tree):
+    root, top, panel, a, b = tree
+    root.set_position(100, 50)
+    assert top.rect.topleft == (100, 50) and a.rect.topleft == (100, 60)
+    assert ui.spatial_index.topmost((125, 65)) is b
+    assert ui.spatial_index.topmost(b.rect.center) is b
+
+
+def test_nested_add_and_remove_update_registration(ui, tree):
+    root, top, panel, a, b = tree
+    late = leaf("late")
+    panel.add(late)
+    assert late in ui.spatial_index and ui.focus_ring.last is late
+
+    ui.focus(a)
+    ui.remove(panel)
+    assert panel.parent is None and root.children == [top]
+    assert ui.focused_element is None and list(ui.focus_ring) == [top]
+    assert len(ui.spatial_index) == 1 and a.ui_manager is None
+
+
+def test_hit_order_follows_draw_order_after_tree_changes(ui):
+    below = UIContainer(0, 0)
+    a, b = leaf("a"), leaf("b")
+    below.add(a)
+    below.add(b)
+    ui.add(below)
+    above = leaf("above")
+    ui.add(above)
+
+    late = leaf("late")
+    below.add(late)
+    assert ui.spatial_index.query_point((5, 5)) == [above, late, b, a]
+
+    above.set_visible(False)
+    a.set_visible(False)
+    a.set_visible(True)
+    assert ui.spatial_index.topmost((5, 5)) is late
+
+
+def test_removing_a_table_cell_widget_only_warns(ui, caplog):
+    table = UITable(x=0, y=0, column_widths=[40], row_height=20)
+    cell = leaf("cell")
+    table.add_row([cell])
+    ui.add(table)
+    ui.remove(cell)
+    assert "non-existent" in caplog.text
+    assert table.rows == [[cell]] and cell in ui.focus_ring
@@ -0,0 +1,55 @@
+# tests/ui_helpers.py
+# Shared UI test doubles and pygame event builders for the UI manager, tree and compositor tests.
+
+import pygame
+
+from ui.components.base import UIElement
+
+
+class DummyElement(UIElement):
+    """Element recording events, hover changes, updates, activations and draws."""
+    def __init__(self, x=0, y=0, width=10, height=10, name=None,
+                 focusable=False, animating=False, focus_id=None, color=(200, 0, 0)):
+        super().__init__(x, y, width, height)
+        self.name = name
+        self.focusable = focusable
+        self.animating = animating
+        self.focus_id = focus_id
+        self.color = color
+        self.events = []
+        self.hover_calls = []
+        self.updates = 0
+        self.activations = 0
+        self.draws = 0
+
+    def handle_event(self, event):
+        self.events.append(event.type)
+
+    def set_hovered(self, hovered):
+        super().set_hovered(hovered)
+        self.hover_calls.append(hovered)
+
+    def update(self, mouse_pos):
+        self.updates += 1
+
+    def activate(self):
+        self.activations += 1
+
+    def draw(self, surface):
+        self.draws += 1
+        surface.fill(self.color, self.rect)
+
+    def __repr__(self):
+        return self.name or super().__repr__()
+
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+def motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+def key(k):
+    return pygame.event.Event(pygame.KEYDOWN, key=k, mod=0, unicode="a")
@@ -28,6 +28,8 @@ _current_theme: Dict[str, Tuple[int, ...]] = THEMES.get(
     _current_theme_name,
     dark_theme.theme
 )
+# Incremented on every theme switch so caches of rendered UI can detect it
+_theme_version: int = 0
 
 
 def set_theme(name: str) -> None:
@@ -39,10 +41,11 @@ def set_theme(name: str) -> None:
 
     If the provided name is not found, the current theme remains unchanged.
     """
-    global _current_theme, _current_theme_name
+    global _current_theme, _current_theme_name, _theme_version
     if name in THEMES:
         _current_theme = THEMES[name]
         _current_theme_name = name
+        _theme_version += 1
         logger.info("Theme switched to '%s'.", name)
     else:
         logger.warning(
@@ -85,6 +88,16 @@ def get_theme_name() -> str:
     return _current_theme_name
 
 
+def get_theme_version() -> int:
+    """
+    Retrieve a counter that changes whenever the active theme changes.
+
+    Returns:
+        int: Theme version; compare with a stored value to detect switches.
+    """
+    return _theme_version
+
+
 def random_color() -> Tuple[int, int, int]:
     """
     Generate and return a random RGB color.
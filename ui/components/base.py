@@ -3,10 +3,18 @@ Module ui/components/base.py
 
 Defines the UIElement base class for all UI components.
 Provides position, size, hit detection, keyboard focus handling, and lifecycle hooks.
+
+Elements are drawn retained: state changes call mark_dirty(), which flags the
+element and its containers and tells the owning UIManager which screen area
+to repaint.
+
+Elements form a tree: containers (see UIContainer) own their `children` and
+set each child's `parent`. Leaves have no children. Hiding or disabling an
+element applies to its whole subtree.
 """
 
 import pygame
-from typing import Tuple
+from typing import Iterator, Optional, Sequence, Tuple
 
 
 class UIElement:
@@ -21,7 +29,27 @@ class UIElement:
         rect (pygame.Rect): Rectangle used for hit detection and layout.
         focusable (bool): Whether the element can receive keyboard focus.
         focused (bool): Current keyboard focus state.
+        focus_id (str | None): Stable identifier used to restore focus when
+            a UI is rebuilt.
+        hovered (bool): Whether the pointer is over the element; set by
+            UIManager from pointer motion.
+        animating (bool): Whether the element needs update() every frame
+            (e.g. a blinking cursor). Others are only updated on demand.
+        dirty (bool): Whether the element changed since it was last drawn.
+        visible (bool): Whether the element and its subtree are drawn and
+            receive input.
+        enabled (bool): Whether the element and its subtree receive input.
+        parent (UIElement | None): Container the element is nested in.
+        children (Sequence[UIElement]): Nested elements; empty for leaves.
+        tree_order (int): Position among its siblings (or UIManager's roots)
+            in drawing order, assigned when the element is added.
+        manager (UIManager | None): Set by UIManager on top-level elements;
+            nested elements reach it through `ui_manager`.
+        spatial_index (SpatialIndex | None): Hit-test index of the owning
+            UIManager, kept in sync when the rect changes.
     """
+    children: Sequence["UIElement"] = ()
+
     def __init__(self, x: int, y: int, width: int = 0, height: int = 0) -> None:
         """
         Initialize a UIElement with position and size.
@@ -38,8 +66,95 @@ class UIElement:
         self.height = height
         self.focusable = False
         self.focused = False
+        self.focus_id: Optional[str] = None
+        self.hovered = False
+        self.animating = False
         # Rect for click and mouse-over detection
         self.rect = pygame.Rect(x, y, width, height)
+        self.spatial_index = None
+        self.dirty = True
+        self.visible = True
+        self.enabled = True
+        self.parent: Optional["UIElement"] = None
+        self.tree_order = 0
+        self.manager = None
+
+    @property
+    def ui_manager(self):
+        """The UIManager owning the tree this element is in, or None."""
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        return root.manager
+
+    def tree_key(self) -> Tuple[int, ...]:
+        """
+        Return the element's position in drawing order across the whole tree.
+
+        Keys compare like the draw order: an element drawn later (on top)
+        has a greater key. UIManager uses them for hit-testing and Tab order.
+
+        Returns:
+            tuple[int, ...]: tree_order of the root, ..., this element.
+        """
+        key = (self.tree_order,)
+        node = self.parent
+        while node is not None:
+            key = (node.tree_order,) + key
+            node = node.parent
+        return key
+
+    def walk(self) -> Iterator["UIElement"]:
+        """Yield this element and all its descendants, parents first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def set_visible(self, visible: bool) -> None:
+        """
+        Show or hide the element and its subtree.
+
+        Hidden elements are neither drawn nor hit-tested, lose keyboard focus
+        and stop receiving per-frame updates.
+
+        Args:
+            visible (bool): False to hide, True to show again.
+        """
+        if visible == self.visible:
+            return
+        manager = self.ui_manager
+        if visible:
+            self.visible = True
+            self.mark_dirty()
+            if manager is not None:
+                manager.attach_subtree(self)
+        else:
+            # Invalidate while still visible so the painted area is cleared
+            self.mark_dirty()
+            self.visible = False
+            if manager is not None:
+                manager.detach_subtree(self)
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable input for the element and its subtree.
+
+        Disabled elements are still drawn and updated, but receive no pointer
+        events and are skipped by keyboard focus.
+
+        Args:
+            enabled (bool): False to disable, True to enable again.
+        """
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        self.mark_dirty()
+        manager = self.ui_manager
+        if manager is not None:
+            if enabled:
+                manager.attach_subtree(self)
+            else:
+                manager.detach_subtree(self, keep_updates=True)
 
     def set_focus(self, focused: bool) -> None:
         """
@@ -48,7 +163,72 @@ class UIElement:
         Args:
             focused (bool): True to give focus, False to remove.
         """
-        self.focused = focused
+        if focused != self.focused:
+            self.focused = focused
+            self.mark_dirty()
+
+    def iter_focusables(self) -> Iterator["UIElement"]:
+        """
+        Yield the focusable elements of this element in Tab order.
+
+        Containers override this to include their nested children.
+        """
+        if self.focusable:
+            yield self
+
+    def set_hovered(self, hovered: bool) -> None:
+        """
+        Called by UIManager when the pointer enters or leaves the element.
+
+        Args:
+            hovered (bool): True on enter, False on leave.
+        """
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.mark_dirty()
+
+    def draw_bounds(self) -> pygame.Rect:
+        """
+        Return the screen area the element paints, including focus glow.
+
+        Returns:
+            pygame.Rect: Area to repaint when the element changes.
+        """
+        return self.rect.inflate(8, 8)
+
+    def mark_clean(self) -> None:
+        """Clear the dirty flag after a full repaint; containers recurse."""
+        self.dirty = False
+
+    def mark_dirty(self, previous: Optional[pygame.Rect] = None) -> None:
+        """
+        Flag the element for redraw, up through its containers.
+
+        Args:
+            previous (pygame.Rect, optional): Area the element painted before
+                a move or resize, which must be repainted as well.
+        """
+        self.dirty = True
+        root = self
+        while root.parent is not None:
+            root = root.parent
+            root.dirty = True
+        if root.manager is not None:
+            root.manager.invalidate(self, previous)
+
+    def element_at(self, pos: Tuple[int, int]) -> "UIElement":
+        """
+        Return the innermost element at a point inside this one.
+
+        Containers override this to resolve their children.
+
+        Args:
+            pos (tuple[int, int]): (x, y) coordinates within this element.
+
+        Returns:
+            UIElement: This element.
+        """
+        return self
 
     def activate(self) -> None:
         """
@@ -81,7 +261,7 @@ class UIElement:
 
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """
-        Update element state each frame (e.g., hover visuals).
+        Update element state each frame; only called for animating elements.
 
         Args:
             mouse_pos (tuple[int, int]): Current mouse coordinates.
@@ -96,9 +276,23 @@ class UIElement:
             x (int): New X-coordinate.
             y (int): New Y-coordinate.
         """
+        if (x, y) == self.rect.topleft and (self.x, self.y) == (x, y):
+            return
+        previous = self.draw_bounds()
         self.x = x
         self.y = y
         self.rect.topleft = (x, y)
+        self._bounds_changed()
+        self.mark_dirty(previous)
+
+    def _bounds_changed(self) -> None:
+        """
+        Re-index the element after its rect moved or resized.
+
+        Subclasses that change `rect` other than via set_position call this.
+        """
+        if self.spatial_index is not None:
+            self.spatial_index.update(self, self.rect)
 
     def contains(self, point: Tuple[int, int]) -> bool:
         """
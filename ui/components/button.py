@@ -12,6 +12,7 @@ import setup.config as Config
 from themes.theme_manager import get_color
 from core.events.event_types import EventType
 from ui.components.base import UIElement
+from ui.font_cache import get_font
 
 logger = logging.getLogger(__name__)
 
@@ -63,9 +64,10 @@ class UIButton(UIElement):
 
         # Configure font for button label
         font_cfg = Config.fonts["default"]
-        self.font = pygame.font.SysFont(
-            font_cfg["name"], font_cfg["size"]
-        )
+        self.font = get_font(font_cfg["name"], font_cfg["size"])
+        # Rendered label, reused until the text or its colour changes
+        self._text_surf = None
+        self._text_key = None
         logger.debug(
             "UIButton initialized at (%d, %d) size (%d,%d) with text '%s'",
             x, y, width, height, text
@@ -94,8 +96,11 @@ class UIButton(UIElement):
             Config.ui["default"]["border_width"]
         )
 
-        # Render and center the text label
-        text_surf = self.font.render(self.text, True, text_color)
+        # Render (if changed) and center the text label
+        if self._text_key != (self.text, text_color):
+            self._text_key = (self.text, text_color)
+            self._text_surf = self.font.render(self.text, True, text_color)
+        text_surf = self._text_surf
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -126,6 +131,9 @@ class UIButton(UIElement):
         """
         Update the hovered state based on the current mouse position.
 
+        UIManager drives hover through set_hovered() on pointer motion
+        instead; this remains for standalone use.
+
         Args:
             mouse_pos (tuple[int, int]): The (x, y) coordinates of the mouse pointer.
         """
@@ -10,6 +10,7 @@ import pygame
 from ui.components.base import UIElement
 from themes.theme_manager import get_color
 import setup.config as Config
+from ui.font_cache import get_font
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,10 @@ class UICheckbox(UIElement):
 
         # Prepare font for optional label text
         font_cfg = Config.fonts["default"]
-        self.font = pygame.font.SysFont(font_cfg["name"], font_cfg["size"])
+        self.font = get_font(font_cfg["name"], font_cfg["size"])
+        # Rendered label, reused until its colour changes
+        self._label_surf = None
+        self._label_color = None
 
         logger.debug(
             "UICheckbox initialized at (%d,%d) size %d label '%s' checked=%s",
@@ -92,7 +96,10 @@ class UICheckbox(UIElement):
 
         # Draw label text to the right if provided
         if self.label:
-            text_surf = self.font.render(self.label, True, text_color)
+            if self._label_color != text_color:
+                self._label_color = text_color
+                self._label_surf = self.font.render(self.label, True, text_color)
+            text_surf = self._label_surf
             text_pos = (
                 self.rect.right + 8,
                 self.rect.y + (self.rect.height - text_surf.get_height()) // 2
@@ -104,6 +111,21 @@ class UICheckbox(UIElement):
             glow_rect = self.rect.inflate(6, 6)
             pygame.draw.rect(surface, focus_glow, glow_rect, 2)
 
+    def draw_bounds(self) -> pygame.Rect:
+        """
+        Return the painted area: the box, its focus glow and the label.
+
+        Returns:
+            pygame.Rect: Area to repaint when the checkbox changes.
+        """
+        bounds = self.rect.inflate(8, 8)
+        if self.label:
+            label_w, label_h = self.font.size(self.label)
+            bounds.union_ip(pygame.Rect(
+                self.rect.right, self.rect.centery - label_h // 2, 8 + label_w, label_h
+            ))
+        return bounds
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """
         Handle mouse clicks to toggle state, and keyboard activation via UIManager.
@@ -137,6 +159,7 @@ class UICheckbox(UIElement):
         Internal helper to invert the checked flag and invoke callback.
         """
         self.checked = not self.checked
+        self.mark_dirty()
         logger.debug("UICheckbox '%s' toggled to %s", self.label, self.checked)
         if self.callback:
             try:
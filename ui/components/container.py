@@ -0,0 +1,215 @@
+"""
+Module ui/components/container.py
+
+Defines UIContainer, the base class for UI elements that own child elements.
+Containers form the UI tree: they set each child's `parent`, move, hide,
+disable and remove whole subtrees, and draw, route events to and resolve hits
+in their children by walking `children` directly, so no element lists are
+built per frame.
+
+Panels and layouts derive from it and only add their own positioning.
+"""
+
+import logging
+from typing import Iterator, List, Tuple
+
+import pygame
+from ui.components.base import UIElement
+
+logger = logging.getLogger(__name__)
+
+
+class UIContainer(UIElement):
+    """
+    UI element that owns and positions child elements.
+
+    Attributes:
+        children (List[UIElement]): Child elements in drawing order; later
+            children are drawn on top and hit first.
+    """
+    def __init__(self, x: int, y: int, width: int = 0, height: int = 0) -> None:
+        """
+        Initialize an empty container.
+
+        Args:
+            x (int): X-coordinate of the container's top-left corner.
+            y (int): Y-coordinate of the container's top-left corner.
+            width (int, optional): Width in pixels. Defaults to 0.
+            height (int, optional): Height in pixels. Defaults to 0.
+        """
+        super().__init__(x, y, width, height)
+        self.children: List[UIElement] = []
+        # Next tree_order; children are only appended, so orders keep
+        # matching list positions after removals
+        self._next_order = 0
+        # Union of the areas painted by the subtree, valid while clean
+        self._bounds: pygame.Rect | None = None
+
+    def add(self, element: UIElement) -> None:
+        """
+        Append a child element; subclasses position it first.
+
+        Args:
+            element (UIElement): The element to add.
+        """
+        self.add_child(element)
+
+    def add_child(self, element: UIElement) -> None:
+        """
+        Take ownership of an element and register it with the owning UIManager.
+
+        Args:
+            element (UIElement): The element to append to `children`.
+        """
+        element.parent = self
+        element.tree_order = self._next_order
+        self._next_order += 1
+        self.children.append(element)
+        element.mark_dirty()
+        manager = self.ui_manager
+        if manager is not None:
+            manager.attach_subtree(element)
+
+    def remove(self, element: UIElement) -> None:
+        """
+        Remove a child element and its subtree.
+
+        Args:
+            element (UIElement): A direct child of this container.
+        """
+        index = self.children.index(element)
+        previous = element.draw_bounds()
+        manager = self.ui_manager
+        if manager is not None:
+            manager.detach_subtree(element)
+        del self.children[index]
+        element.parent = None
+        self._child_removed(index)
+        self.mark_dirty(previous)
+
+    def _child_removed(self, index: int) -> None:
+        """
+        Hook for subclasses keeping per-child state; called after removal.
+
+        Args:
+            index (int): Former position of the child in `children`.
+        """
+        pass
+
+    def get_elements(self) -> List[UIElement]:
+        """
+        Retrieve a flat list of all nested leaf elements.
+
+        Builds a new list; per-frame traversal uses `children` instead.
+
+        Returns:
+            List[UIElement]: Leaves of the subtree in drawing order.
+        """
+        return [el for el in self.walk() if not el.children and el is not self]
+
+    def draw_bounds(self) -> pygame.Rect:
+        """
+        Return the area painted by the container and its visible children.
+
+        Recomputed only while the subtree is dirty.
+
+        Returns:
+            pygame.Rect: Area to repaint when the subtree changes.
+        """
+        if self.dirty or self._bounds is None:
+            bounds = self.rect.inflate(8, 8)
+            for child in self.children:
+                if child.visible:
+                    bounds.union_ip(child.draw_bounds())
+            self._bounds = bounds
+        return pygame.Rect(self._bounds)
+
+    def mark_clean(self) -> None:
+        """Clear the dirty flags of the container and its children."""
+        super().mark_clean()
+        for child in self.children:
+            child.mark_clean()
+
+    def iter_focusables(self) -> Iterator[UIElement]:
+        """Yield focusable visible, enabled descendants in the order they were added."""
+        for child in self.children:
+            if child.visible and child.enabled:
+                yield from child.iter_focusables()
+
+    def element_at(self, pos: Tuple[int, int]) -> UIElement:
+        """
+        Return the topmost nested element at a point, or the container itself.
+
+        Args:
+            pos (Tuple[int, int]): Screen coordinates inside the container.
+
+        Returns:
+            UIElement: The hit descendant, or this container.
+        """
+        for child in reversed(self.children):
+            if child.visible and child.enabled and child.rect.collidepoint(pos):
+                return child.element_at(pos)
+        return self
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Propagate a Pygame event to the visible, enabled children.
+
+        Pointer events go only to the topmost child under the pointer.
+
+        Args:
+            event (pygame.event.Event): The event to dispatch.
+        """
+        pos = getattr(event, "pos", None)
+        if pos is not None:
+            for child in reversed(self.children):
+                if child.visible and child.enabled and child.rect.collidepoint(pos):
+                    child.handle_event(event)
+                    return
+            return
+        for child in self.children:
+            if child.visible and child.enabled:
+                try:
+                    child.handle_event(event)
+                except Exception:
+                    logger.exception("Error in handle_event of %s", child)
+
+    def update(self, mouse_pos: Tuple[int, int]) -> None:
+        """
+        Update the visible children.
+
+        UIManager updates animating descendants directly; this is for callers
+        driving a detached subtree.
+
+        Args:
+            mouse_pos (Tuple[int, int]): Current mouse coordinates.
+        """
+        for child in self.children:
+            if child.visible:
+                child.update(mouse_pos)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the visible children, skipping those outside the repainted area.
+
+        Args:
+            surface (pygame.Surface): Drawing target for rendering.
+        """
+        clip = surface.get_clip()
+        for child in self.children:
+            if child.visible and child.draw_bounds().colliderect(clip):
+                child.draw(surface)
+
+    def set_position(self, x: int, y: int) -> None:
+        """
+        Move the container and its whole subtree by the same offset.
+
+        Args:
+            x (int): New X-coordinate.
+            y (int): New Y-coordinate.
+        """
+        dx = x - self.x
+        dy = y - self.y
+        super().set_position(x, y)
+        for child in self.children:
+            child.set_position(child.x + dx, child.y + dy)
@@ -11,6 +11,7 @@ from typing import Tuple
 import setup.config as Config
 from themes.theme_manager import get_color
 from ui.components.base import UIElement
+from ui.font_cache import get_font, render_text
 
 
 class UILabel(UIElement):
@@ -44,9 +45,10 @@ class UILabel(UIElement):
         font_name = font_name or Config.fonts["default"]["name"]
         font_size = font_size or Config.fonts["default"]["size"]
 
-        # Create font and render initial text to calculate size
-        font = pygame.font.SysFont(font_name, font_size)
-        text_surf = font.render(text, True, get_color("foreground"))
+        # Create font and render initial text to calculate size; text
+        # rendered by a scene's prepare step is taken from the cache
+        font = get_font(font_name, font_size)
+        text_surf = render_text(font_name, font_size, text, get_color("foreground"))
         width, height = text_surf.get_size()
 
         # Initialize base UIElement with computed size
@@ -55,6 +57,9 @@ class UILabel(UIElement):
         self.text = text
         self.font = font
         self.color_key = "foreground"
+        # Rendered text, reused until the text or its colour changes
+        self._text_surf = text_surf
+        self._text_key = (text, get_color("foreground"))
 
     def set_text(self, new_text: str) -> None:
         """
@@ -63,13 +68,25 @@ class UILabel(UIElement):
         Args:
             new_text (str): The new text string to display.
         """
+        if new_text == self.text:
+            return
+        previous = self.draw_bounds()
         self.text = new_text
-        # Render text to determine new dimensions
-        text_surf = self.font.render(self.text, True, get_color(self.color_key))
-        w, h = text_surf.get_size()
+        # Size from the font metrics; the surface is rendered on the next draw
+        w, h = self.font.size(self.text)
         # Update element size and hitbox
         self.width, self.height = w, h
         self.rect.size = (w, h)
+        self._bounds_changed()
+        self.mark_dirty(previous)
+
+    def _render_text(self) -> pygame.Surface:
+        """Return the rendered text, re-rendering only after a change."""
+        key = (self.text, get_color(self.color_key))
+        if key != self._text_key:
+            self._text_surf = self.font.render(key[0], True, key[1])
+            self._text_key = key
+        return self._text_surf
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -78,7 +95,4 @@ class UILabel(UIElement):
         Args:
             surface (pygame.Surface): Target surface for drawing.
         """
-        color = get_color(self.color_key)
-        # Render text and blit at the element's position
-        text_surf = self.font.render(self.text, True, color)
-        surface.blit(text_surf, self.rect.topleft)
+        surface.blit(self._render_text(), self.rect.topleft)
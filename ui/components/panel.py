@@ -1,9 +1,9 @@
 """
 Module ui/components/panel.py
 
-Defines Panel UIElement as a container for grouping other UI components.
-Supports background, border, padding, dynamic resizing based on children,
-and event propagation to nested elements.
+Defines Panel UIContainer for grouping other UI components.
+Supports background, border, padding and dynamic resizing based on children;
+event propagation, hit testing and subtree moves come from UIContainer.
 """
 
 import pygame
@@ -12,14 +12,15 @@ from typing import Tuple
 import setup.config as Config
 from themes.theme_manager import get_color
 from ui.components.base import UIElement
+from ui.components.container import UIContainer
 
 
-class UIPanel(UIElement):
+class UIPanel(UIContainer):
     """
     Container for grouping UI elements with background, border, and padding.
 
     Automatically resizes to accommodate children unless fixed dimensions are provided.
-    Provides event propagation, update, and drawing for nested elements.
+    Draws its background and border beneath its children.
     """
     def __init__(
         self,
@@ -54,8 +55,7 @@ class UIPanel(UIElement):
         self.border_key = border_key
         self.padding = padding if padding is not None else Config.ui["default"]["padding"]
 
-        # Child elements and their positions relative to panel
-        self.elements: list[UIElement] = []
+        # Child positions relative to panel, parallel to `children`
         self.child_positions: list[Tuple[int, int]] = []
 
     def add(self, element: UIElement) -> None:
@@ -73,23 +73,27 @@ class UIPanel(UIElement):
         element.set_position(self.x + rel_x, self.y + rel_y)
 
         # Store element and its relative position for resizing
-        self.elements.append(element)
         self.child_positions.append((rel_x, rel_y))
+        self.add_child(element)
 
         # Resize panel to fit all children
         self._resize_to_children()
 
+    def _child_removed(self, index: int) -> None:
+        """Forget the relative position of a removed child."""
+        del self.child_positions[index]
+
     def _resize_to_children(self) -> None:
         """
         Adjust panel dimensions to enclose all child elements plus padding.
         """
-        if not self.elements:
+        if not self.children:
             return
 
         # Compute maximum extents required by children
         max_w = 0
         max_h = 0
-        for el, (rel_x, rel_y) in zip(self.elements, self.child_positions):
+        for el, (rel_x, rel_y) in zip(self.children, self.child_positions):
             max_w = max(max_w, rel_x + el.rect.width)
             max_h = max(max_h, rel_y + el.rect.height)
 
@@ -98,46 +102,14 @@ class UIPanel(UIElement):
         target_h = max(self.height, max_h + self.padding)
 
         # Apply new size to panel and update rect
+        if (target_w, target_h) == self.rect.size:
+            return
+        previous = self.draw_bounds()
         self.width = target_w
         self.height = target_h
         self.rect.size = (self.width, self.height)
-
-    def get_elements(self) -> list[UIElement]:
-        """
-        Retrieve a flat list of all nested UI elements.
-
-        Returns:
-            list[UIElement]: Flattened list of panel's child elements,
-            including children of nested Panels.
-        """
-        flat: list[UIElement] = []
-        for el in self.elements:
-            # If element contains its own children (e.g., nested Panel)
-            if hasattr(el, "get_elements"):
-                flat.extend(el.get_elements())
-            else:
-                flat.append(el)
-        return flat
-
-    def handle_event(self, event: pygame.event.Event) -> None:
-        """
-        Propagate a Pygame event to all nested UI elements.
-
-        Args:
-            event (pygame.event.Event): The event to dispatch.
-        """
-        for el in self.get_elements():
-            el.handle_event(event)
-
-    def update(self, mouse_pos: tuple[int, int]) -> None:
-        """
-        Update state of nested UI elements (e.g., hover effects).
-
-        Args:
-            mouse_pos (tuple[int,int]): Current mouse coordinates.
-        """
-        for el in self.get_elements():
-            el.update(mouse_pos)
+        self._bounds_changed()
+        self.mark_dirty(previous)
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -157,24 +129,5 @@ class UIPanel(UIElement):
             Config.ui["default"]["border_width"]
         )
 
-        # Render each nested element
-        for el in self.get_elements():
-            el.draw(surface)
-
-    def set_position(self, x: int, y: int) -> None:
-        """
-        Move panel and adjust positions of all child elements by same offset.
-
-        Args:
-            x (int): New X-coordinate for panel.
-            y (int): New Y-coordinate for panel.
-        """
-        # Compute offset difference
-        dx = x - self.x
-        dy = y - self.y
-        # Update panel position
-        super().set_position(x, y)
-
-        # Move children by the panel's offset
-        for el in self.elements:
-            el.set_position(el.x + dx, el.y + dy)
\ No newline at end of file
+        # Render nested elements, skipping those outside the repainted area
+        super().draw(surface)
@@ -84,4 +84,7 @@ class UIProgressBar(UIElement):
             value (float): The new value to represent.
         """
         # Clamp value to valid range
-        self.current_value = max(0.0, min(self.max_value, value))
+        value = max(0.0, min(self.max_value, value))
+        if value != self.current_value:
+            self.current_value = value
+            self.mark_dirty()
@@ -6,7 +6,9 @@ Supports custom column widths, row heights, alternating row backgrounds, and for
 """
 
 import pygame
-from typing import Any, List, Tuple
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import setup.config as Config
 from themes.theme_manager import get_color
@@ -55,6 +57,8 @@ class UITable(UIElement):
         super().__init__(x, y, total_width, initial_height)
 
         self.column_widths = column_widths
+        # Right edge of each column relative to the table, for hit testing
+        self._column_edges = list(accumulate(column_widths))
         self.row_height = row_height
         self.headers = headers or []
         self.rows: List[List[Any]] = []
@@ -63,6 +67,9 @@ class UITable(UIElement):
         self.font_name = font_name or Config.fonts['default']['name']
         self.font_size = font_size or Config.fonts['default']['size']
 
+        # Labels of primitive cells by (row, column), created on first draw
+        self._cell_labels: Dict[Tuple[int, int], UILabel] = {}
+
         # Create header label objects if headers provided
         self.header_labels: List[UILabel] = []
         if self.headers:
@@ -104,14 +111,46 @@ class UITable(UIElement):
         total_rows = len(self.rows) + (1 if self.headers else 0)
         self.height = total_rows * self.row_height
         self.rect.height = self.height
+        self._bounds_changed()
+        self.mark_dirty()
+        # Place embedded widgets now so they can be hit before the first draw
+        y_off = self.y + (total_rows - 1) * self.row_height
+        for cidx, cell in enumerate(values):
+            if isinstance(cell, UIElement):
+                cell.parent = self
+                dx = self.x + (self._column_edges[cidx - 1] if cidx else 0)
+                cell.set_position(dx + 5, y_off + 5)
+                self.animating = self.animating or cell.animating
 
     def clear(self) -> None:
         """
         Remove all data rows while preserving header row.
         """
+        previous = self.draw_bounds()
         self.rows.clear()
+        self._cell_labels.clear()
         self.height = (1 if self.headers else 0) * self.row_height
         self.rect.height = self.height
+        self._bounds_changed()
+        self.mark_dirty(previous)
+
+    def cell_at(self, pos: Tuple[int, int]) -> Optional[Any]:
+        """
+        Find the data cell under a point arithmetically, without scanning rows.
+
+        Args:
+            pos (Tuple[int, int]): Screen coordinates.
+
+        Returns:
+            Any: The cell value or widget, or None outside the data rows.
+        """
+        if not self.rect.collidepoint(pos):
+            return None
+        ridx = (pos[1] - self.y) // self.row_height - (1 if self.headers else 0)
+        cidx = bisect_right(self._column_edges, pos[0] - self.x)
+        if 0 <= ridx < len(self.rows) and cidx < len(self.column_widths):
+            return self.rows[ridx][cidx]
+        return None
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -130,9 +169,14 @@ class UITable(UIElement):
             for lbl in self.header_labels:
                 lbl.draw(surface)
 
-        # Draw each data row with alternating backgrounds
-        for ridx, row in enumerate(self.rows):
-            y_off = self.y + (ridx + (1 if self.headers else 0)) * self.row_height
+        # Draw the data rows intersecting the repainted area, found arithmetically
+        header_rows = 1 if self.headers else 0
+        clip = surface.get_clip()
+        first = max(0, (clip.top - self.y) // self.row_height - header_rows)
+        last = min(len(self.rows), -(-(clip.bottom - self.y) // self.row_height) - header_rows)
+        for ridx in range(first, last):
+            row = self.rows[ridx]
+            y_off = self.y + (ridx + header_rows) * self.row_height
             dx = self.x
             for cidx, cell in enumerate(row):
                 col_w = self.column_widths[cidx]
@@ -147,25 +191,66 @@ class UITable(UIElement):
                     cell.set_position(dx + 5, y_off + 5)
                     cell.draw(surface)
                 else:
-                    # Render primitive value as a Label
-                    text_lbl = UILabel(                        
-                        x=dx + 5,
-                        y=y_off + 5,
-                        text=str(cell),
-                        font_size=self.font_size,
-                        font_name=self.font_name
-                    )
+                    # Render primitive value as a Label, kept for later frames
+                    text_lbl = self._cell_labels.get((ridx, cidx))
+                    if text_lbl is None:
+                        text_lbl = UILabel(
+                            x=dx + 5,
+                            y=y_off + 5,
+                            text=str(cell),
+                            font_size=self.font_size,
+                            font_name=self.font_name
+                        )
+                        self._cell_labels[(ridx, cidx)] = text_lbl
+                    else:
+                        text_lbl.set_position(dx + 5, y_off + 5)
                     text_lbl.draw(surface)
 
                 dx += col_w
 
+    def mark_clean(self) -> None:
+        """Clear the dirty flags of the table and its cell widgets."""
+        super().mark_clean()
+        for row in self.rows:
+            for cell in row:
+                if isinstance(cell, UIElement):
+                    cell.mark_clean()
+
+    def iter_focusables(self) -> Iterator[UIElement]:
+        """Yield focusable cell widgets row by row."""
+        for row in self.rows:
+            for cell in row:
+                if isinstance(cell, UIElement):
+                    yield from cell.iter_focusables()
+
+    def element_at(self, pos: Tuple[int, int]) -> UIElement:
+        """
+        Return the widget in the cell at a point, or the table itself.
+
+        Args:
+            pos (Tuple[int, int]): Screen coordinates inside the table.
+
+        Returns:
+            UIElement: The cell widget, or this table.
+        """
+        cell = self.cell_at(pos)
+        return cell.element_at(pos) if isinstance(cell, UIElement) else self
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """
         Propagate events to any UIElement instances embedded in cells.
 
+        Pointer events go only to the widget in the cell under the pointer.
+
         Args:
             event (pygame.event.Event): The event to dispatch.
         """
+        pos = getattr(event, "pos", None)
+        if pos is not None:
+            cell = self.cell_at(pos)
+            if isinstance(cell, UIElement):
+                cell.handle_event(event)
+            return
         for row in self.rows:
             for cell in row:
                 if isinstance(cell, UIElement):
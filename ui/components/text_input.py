@@ -12,6 +12,7 @@ from typing import Callable, Optional, Tuple
 import setup.config as Config
 from themes.theme_manager import get_color
 from ui.components.base import UIElement
+from ui.font_cache import get_font
 
 logger = logging.getLogger(__name__)
 
@@ -66,14 +67,18 @@ class UITextInput(UIElement):
         self.focusable = True
         self.focused = False
 
-        # Cursor blink state
+        # Cursor blink state, advanced in update() every frame
+        self.animating = True
         self.cursor_visible = True
         self.cursor_timer = pygame.time.get_ticks()
         self.cursor_interval = 500  # ms
 
         # Text rendering font
         font_cfg = Config.fonts["default"]
-        self.font = pygame.font.SysFont(font_cfg["name"], font_cfg["size"])
+        self.font = get_font(font_cfg["name"], font_cfg["size"])
+        # Rendered content, reused until the text, placeholder state or colour changes
+        self._text_surf = None
+        self._text_key = None
 
         logger.debug(
             "UITextInput initialized at (%d,%d) size (%d,%d)",
@@ -112,7 +117,10 @@ class UITextInput(UIElement):
         # Determine content and color
         content = self.text if (self.text or self.focused) else self.placeholder
         color = text_color if (self.text or self.focused) else placeholder_color
-        text_surf = self.font.render(content, True, color)
+        if self._text_key != (content, color):
+            self._text_key = (content, color)
+            self._text_surf = self.font.render(content, True, color)
+        text_surf = self._text_surf
         text_pos = (
             self.x + 8,
             self.y + (self.height - text_surf.get_height()) // 2
@@ -132,6 +140,18 @@ class UITextInput(UIElement):
                 2
             )
 
+    def draw_bounds(self) -> pygame.Rect:
+        """
+        Return the painted area, including focus glow and text overflowing the field.
+
+        Returns:
+            pygame.Rect: Area to repaint when the input changes.
+        """
+        bounds = self.rect.inflate(8, 8)
+        text_w = self.font.size(self.text or self.placeholder)[0]
+        bounds.width = max(bounds.width, text_w + 20)
+        return bounds
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """
         Handle mouse and keyboard events for focus and text editing.
@@ -145,7 +165,7 @@ class UITextInput(UIElement):
         """
         # Mouse click sets focus
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            self.focused = self.rect.collidepoint(event.pos)
+            self.set_focus(self.rect.collidepoint(event.pos))
             # Reset cursor blinking
             self.cursor_visible = True
             self.cursor_timer = pygame.time.get_ticks()
@@ -155,10 +175,12 @@ class UITextInput(UIElement):
         if self.focused and event.type == pygame.KEYDOWN:
             if event.key == pygame.K_BACKSPACE:
                 self.text = self.text[:-1]
+                self.mark_dirty()
                 if self.on_change:
                     self._safe_call(self.on_change)
             elif event.key not in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_TAB):
                 self.text += event.unicode
+                self.mark_dirty()
                 if self.on_change:
                     self._safe_call(self.on_change)
 
@@ -173,6 +195,8 @@ class UITextInput(UIElement):
         if now - self.cursor_timer >= self.cursor_interval:
             self.cursor_visible = not self.cursor_visible
             self.cursor_timer = now
+            if self.focused:
+                self.mark_dirty()
 
     def activate(self) -> None:
         """
@@ -0,0 +1,181 @@
+"""
+Module ui/focus_ring.py
+
+Implements FocusRing, the keyboard focus order of a UIManager. Focusable
+elements are kept in a circular doubly linked list keyed by identity, so
+moving to the next or previous element, adding and removing are O(1) and
+never invalidated by other elements coming or going. Elements with a
+`focus_id` can also be looked up by it, which lets a rebuilt UI restore the
+focus of the one it replaces.
+
+Elements added with an order key are linked in key order, after the nearest
+element with a lower key, so the Tab order follows the UI tree no matter
+when elements join or rejoin the ring.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class FocusRing:
+    """
+    Ordered ring of focusable elements.
+
+    Elements added without a key are appended in the order they are added;
+    keyed elements are placed by key. The ring order is the Tab order.
+    """
+    def __init__(self) -> None:
+        """Create an empty ring."""
+        self._items: Dict[int, Any] = {}
+        self._next: Dict[int, Any] = {}
+        self._prev: Dict[int, Any] = {}
+        self._by_focus_id: Dict[str, Any] = {}
+        # Order keys of keyed elements, sorted, with the elements alongside
+        self._keys: List[Any] = []
+        self._keyed: List[Any] = []
+        self._key_of: Dict[int, Any] = {}
+        self.first: Optional[Any] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, element: Any) -> bool:
+        return id(element) in self._items
+
+    def __iter__(self) -> Iterator[Any]:
+        element = self.first
+        for _ in range(len(self._items)):
+            yield element
+            element = self._next[id(element)]
+
+    @property
+    def last(self) -> Optional[Any]:
+        """The element before the first one, i.e. the end of the Tab order."""
+        return self._prev[id(self.first)] if self.first is not None else None
+
+    def add(self, element: Any, key: Any = None) -> None:
+        """
+        Add an element to the ring; duplicates are ignored.
+
+        Args:
+            element (Any): A focusable element.
+            key (Any, optional): Order key, comparable with the other keys. The
+                element is linked after the keyed element preceding it; without
+                a key it is appended to the end.
+        """
+        if id(element) in self._items:
+            return
+        self._items[id(element)] = element
+        if self.first is None:
+            self.first = element
+            self._next[id(element)] = self._prev[id(element)] = element
+        elif key is None:
+            self._link_after(self.last, element)
+        else:
+            pos = bisect_left(self._keys, key)
+            if pos > 0:
+                self._link_after(self._keyed[pos - 1], element)
+            elif self._keyed:
+                # Lowest key: goes before the first keyed element
+                successor = self._keyed[0]
+                self._link_after(self._prev[id(successor)], element)
+                if successor is self.first:
+                    self.first = element
+            else:
+                self._link_after(self.last, element)
+        if key is not None:
+            pos = bisect_left(self._keys, key)
+            self._keys.insert(pos, key)
+            self._keyed.insert(pos, element)
+            self._key_of[id(element)] = key
+        focus_id = getattr(element, "focus_id", None)
+        if focus_id is not None:
+            self._by_focus_id[focus_id] = element
+
+    def _link_after(self, prev: Any, element: Any) -> None:
+        """Link a new element between `prev` and its successor."""
+        nxt = self._next[id(prev)]
+        self._next[id(prev)] = element
+        self._prev[id(element)] = prev
+        self._next[id(element)] = nxt
+        self._prev[id(nxt)] = element
+
+    def remove(self, element: Any) -> None:
+        """
+        Unlink an element; unknown elements are ignored.
+
+        Args:
+            element (Any): The element to remove.
+        """
+        if self._items.pop(id(element), None) is None:
+            return
+        nxt = self._next.pop(id(element))
+        prev = self._prev.pop(id(element))
+        if not self._items:
+            self.first = None
+        else:
+            self._next[id(prev)] = nxt
+            self._prev[id(nxt)] = prev
+            if self.first is element:
+                self.first = nxt
+        focus_id = getattr(element, "focus_id", None)
+        if focus_id is not None and self._by_focus_id.get(focus_id) is element:
+            del self._by_focus_id[focus_id]
+        key = self._key_of.pop(id(element), None)
+        if key is not None:
+            pos = bisect_left(self._keys, key)
+            while self._keyed[pos] is not element:
+                pos += 1
+            del self._keys[pos]
+            del self._keyed[pos]
+
+    def next_of(self, element: Optional[Any]) -> Optional[Any]:
+        """
+        Return the element after `element`, or the first one if it is not in the ring.
+
+        Args:
+            element (Any, optional): The currently focused element.
+
+        Returns:
+            Any: The next element, or None if the ring is empty.
+        """
+        if id(element) in self._items:
+            return self._next[id(element)]
+        return self.first
+
+    def prev_of(self, element: Optional[Any]) -> Optional[Any]:
+        """
+        Return the element before `element`, or the last one if it is not in the ring.
+
+        Args:
+            element (Any, optional): The currently focused element.
+
+        Returns:
+            Any: The previous element, or None if the ring is empty.
+        """
+        if id(element) in self._items:
+            return self._prev[id(element)]
+        return self.last
+
+    def find(self, focus_id: str) -> Optional[Any]:
+        """
+        Look up an element by its focus_id.
+
+        Args:
+            focus_id (str): Stable identifier assigned by the UI setup code.
+
+        Returns:
+            Any: The element, or None.
+        """
+        return self._by_focus_id.get(focus_id)
+
+    def clear(self) -> None:
+        """Remove all elements."""
+        self._items.clear()
+        self._next.clear()
+        self._prev.clear()
+        self._by_focus_id.clear()
+        self._keys.clear()
+        self._keyed.clear()
+        self._key_of.clear()
+        self.first = None
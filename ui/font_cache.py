@@ -0,0 +1,123 @@
+"""
+Module ui/font_cache.py
+
+Shares pygame Font objects between UI elements. pygame.font.SysFont scans
+the system font list on every call, so each label or button creating its
+own font makes scene construction slow. Fonts are created once per
+(name, size) and can be warmed up ahead of time, e.g. on a background
+thread while a scene is being prepared.
+
+Rendered text is cached as well (least recently used entries are dropped),
+so a scene's prepare step can render the static text of its UI off the
+main thread and the labels built afterwards only look it up.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+import setup.config as Config
+
+logger = logging.getLogger(__name__)
+
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+# Rendered text surfaces by (name, size, text, color), oldest first
+_texts: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+TEXT_CACHE_SIZE = 512
+# Font creation may happen on the main thread and a preparation thread
+_lock = threading.Lock()
+
+
+def get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    """
+    Return the shared system font for a name and size, creating it once.
+
+    Args:
+        name (str | None): Font family name; None for pygame's default font.
+        size (int): Font size in points.
+
+    Returns:
+        pygame.font.Font: The cached font.
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        with _lock:
+            font = _fonts.get(key)
+            if font is None:
+                font = pygame.font.SysFont(name, size)
+                _fonts[key] = font
+                logger.debug("Created font %s %dpt", name, size)
+    return font
+
+
+def is_cached(name: Optional[str], size: int) -> bool:
+    """Return True if the font has already been created."""
+    return (name, size) in _fonts
+
+
+def configured_fonts() -> List[Tuple[str, int]]:
+    """Return (name, size) of every font defined in the config `fonts` section."""
+    return [(cfg["name"], cfg["size"]) for cfg in Config.fonts.values()]
+
+
+def warm(specs: Iterable[Tuple[Optional[str], int]]) -> None:
+    """
+    Create the given fonts if they are not cached yet.
+
+    Args:
+        specs (Iterable[Tuple[str | None, int]]): (name, size) pairs.
+    """
+    for name, size in specs:
+        get_font(name, size)
+
+
+def render_text(name: Optional[str], size: int, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+    """
+    Return antialiased text rendered with a shared font, rendering it once.
+
+    The surface is shared; callers must only blit it.
+
+    Args:
+        name (str | None): Font family name.
+        size (int): Font size in points.
+        text (str): Text to render.
+        color (tuple): Text colour.
+
+    Returns:
+        pygame.Surface: The rendered text.
+    """
+    key = (name, size, text, tuple(color))
+    with _lock:
+        surf = _texts.get(key)
+        if surf is not None:
+            _texts.move_to_end(key)
+            return surf
+    surf = get_font(name, size).render(text, True, color)
+    with _lock:
+        _texts[key] = surf
+        if len(_texts) > TEXT_CACHE_SIZE:
+            _texts.popitem(last=False)
+    return surf
+
+
+def warm_texts(specs: Iterable[Tuple[Optional[str], int, str]], color: Tuple[int, ...]) -> None:
+    """
+    Render the given texts into the cache if they are not cached yet.
+
+    Args:
+        specs (Iterable[Tuple[str | None, int, str]]): (name, size, text) triples.
+        color (tuple): Text colour.
+    """
+    for name, size, text in specs:
+        render_text(name, size, text, color)
+
+
+def clear() -> None:
+    """Drop all cached fonts and text (e.g. after pygame.font.quit())."""
+    with _lock:
+        _fonts.clear()
+        _texts.clear()
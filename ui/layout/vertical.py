@@ -8,15 +8,15 @@ Supports nested layouts and event/update propagation to contained elements.
 
 import pygame
 import logging
-from typing import List, Any, Tuple
 
 import setup.config as Config
 from ui.components.base import UIElement
+from ui.components.container import UIContainer
 
 logger = logging.getLogger(__name__)
 
 
-class VerticalLayout:
+class VerticalLayout(UIContainer):
     """
     Layout manager that stacks UI elements vertically.
 
@@ -25,7 +25,7 @@ class VerticalLayout:
         y (int): Y-coordinate of layout origin.
         spacing (int): Vertical space in pixels between elements.
         align (str): Horizontal alignment for children: 'left', 'center', or 'right'.
-        elements (List[Any]): Child UI elements or nested layouts.
+        children (List[UIElement]): Child UI elements or nested layouts.
         rect (pygame.Rect): Bounding rectangle covering all children.
     """
     def __init__(
@@ -44,23 +44,24 @@ class VerticalLayout:
             spacing (int, optional): Vertical space between elements. Defaults to config spacing.
             align (str, optional): Horizontal alignment of children ('left', 'center', 'right').
         """
-        self.x = x
-        self.y = y
+        # Bounding rect starts with zero size and grows with the children
+        super().__init__(x, y, 0, 0)
         self.spacing = spacing
         self.align = align
-        self.elements: List[Any] = []
-        # Bounding rect initialized with zero size
-        self.rect = pygame.Rect(x, y, 0, 0)
         logger.debug("VerticalLayout initialized at (%d, %d) with spacing %d and align '%s'", x, y, spacing, align)
 
-    def add(self, element: Any) -> None:
+    def add(self, element: UIElement) -> None:
         """
         Add an element to the layout and update positions and bounding rect.
 
         Args:
-            element: UIElement or nested layout with rect attribute.
+            element: UIElement or nested layout.
         """
-        self.elements.append(element)
+        self.add_child(element)
+        self.recalculate_rect()
+
+    def _child_removed(self, index: int) -> None:
+        """Close the gap left by a removed child."""
         self.recalculate_rect()
 
     def _accumulated_height(self) -> int:
@@ -70,9 +71,9 @@ class VerticalLayout:
         Returns:
             int: Combined height in pixels.
         """
-        total = sum(el.rect.height for el in self.elements)
+        total = sum(el.rect.height for el in self.children)
         # Add spacing between elements (n-1 gaps)
-        total += self.spacing * (len(self.elements) - 1 if self.elements else 0)
+        total += self.spacing * (len(self.children) - 1 if self.children else 0)
         return total
 
     def recalculate_rect(self) -> None:
@@ -80,14 +81,14 @@ class VerticalLayout:
         Recompute layout bounds and reposition all child elements based on alignment and spacing.
         """
         # Determine maximum child width and total height
-        max_width = max((el.rect.width for el in self.elements), default=0)
+        max_width = max((el.rect.width for el in self.children), default=0)
         total_height = self._accumulated_height()
         # Update layout rect size
         self.rect.width = max_width
         self.rect.height = total_height
         # Position children vertically with alignment
         current_y = self.y
-        for el in self.elements:
+        for el in self.children:
             # Determine horizontal offset based on alignment
             if self.align == 'center':
                 x_offset = self.x + (self.rect.width - el.rect.width) // 2
@@ -117,46 +118,3 @@ class VerticalLayout:
         self.rect.topleft = (x, y)
         self.recalculate_rect()
         logger.debug("VerticalLayout moved to (%d, %d)", x, y)
-
-    def get_elements(self) -> List[Any]:
-        """
-        Retrieve a flat list of all contained UIElements, including nested layouts.
-
-        Returns:
-            List[Any]: Flattened list of child elements.
-        """
-        flat: List[Any] = []
-        for el in self.elements:
-            if hasattr(el, 'get_elements'):
-                flat.extend(el.get_elements())
-            else:
-                flat.append(el)
-        return flat
-
-    def handle_event(self, event: pygame.event.Event) -> None:
-        """
-        Propagate an event to all nested elements supporting handle_event.
-
-        Args:
-            event (pygame.event.Event): The event to dispatch.
-        """
-        for el in self.get_elements():
-            if hasattr(el, 'handle_event'):
-                try:
-                    el.handle_event(event)
-                except Exception:
-                    logger.exception("Error in handle_event of %s", el)
-
-    def update(self, mouse_pos: Tuple[int, int]) -> None:
-        """
-        Update all nested elements (e.g., for hover states).
-
-        Args:
-            mouse_pos (Tuple[int,int]): Current mouse coordinates.
-        """
-        for el in self.get_elements():
-            if hasattr(el, 'update'):
-                try:
-                    el.update(mouse_pos)
-                except Exception:
-                    logger.exception("Error in update of %s", el)
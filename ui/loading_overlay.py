@@ -0,0 +1,64 @@
+"""
+Module ui/loading_overlay.py
+
+Defines LoadingOverlay, a lightweight indicator drawn while a scene is
+being prepared in the background. It dims the screen and shows an animated
+"Loading" caption; all surfaces are cached, so drawing it costs two blits.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import pygame
+
+import setup.config as Config
+from themes.theme_manager import get_color
+from ui.font_cache import get_font
+
+# Milliseconds per animation step of the trailing dots
+DOT_INTERVAL = 300
+
+
+class LoadingOverlay:
+    """
+    Dimmed full-screen overlay with an animated caption.
+
+    Attributes:
+        text (str): Caption shown while loading.
+    """
+    def __init__(self, text: str = "Loading", alpha: int = 160) -> None:
+        """
+        Args:
+            text (str): Caption shown while loading.
+            alpha (int): Opacity of the dimming layer (0-255).
+        """
+        self.text = text
+        self.alpha = alpha
+        self._shade: Optional[pygame.Surface] = None
+        self._captions: Dict[int, pygame.Surface] = {}
+
+    def draw(self, surface: Any, ticks: Optional[int] = None) -> None:
+        """
+        Draw the overlay on top of the surface.
+
+        Args:
+            surface (pygame.Surface): Target surface, usually the screen.
+            ticks (int, optional): Time in ms for the animation; defaults to
+                pygame.time.get_ticks().
+        """
+        size: Tuple[int, int] = surface.get_size()
+        if self._shade is None or self._shade.get_size() != size:
+            self._shade = pygame.Surface(size, pygame.SRCALPHA)
+            self._shade.fill((0, 0, 0, self.alpha))
+        surface.blit(self._shade, (0, 0))
+
+        ticks = pygame.time.get_ticks() if ticks is None else ticks
+        dots = (ticks // DOT_INTERVAL) % 4
+        caption = self._captions.get(dots)
+        if caption is None:
+            font_cfg = Config.fonts["title"]
+            font = get_font(font_cfg["name"], font_cfg["size"])
+            # Pad with spaces so the caption does not shift as dots appear
+            label = self.text + "." * dots + " " * (3 - dots)
+            caption = font.render(label, True, get_color("foreground"))
+            self._captions[dots] = caption
+        surface.blit(caption, caption.get_rect(center=(size[0] // 2, size[1] // 2)))
@@ -0,0 +1,145 @@
+"""
+Module ui/spatial_index.py
+
+Implements SpatialIndex, a uniform grid over UI element rects used for hit
+testing. Each element is stored in every grid cell its rect overlaps, so a
+point query only looks at the few elements sharing the pointer's cell and
+its cost does not grow with the total number of elements.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import pygame
+
+# Edge length in pixels of one grid cell
+DEFAULT_CELL_SIZE = 64
+
+Cell = Tuple[int, int]
+
+
+class SpatialIndex:
+    """
+    Uniform grid mapping screen areas to the elements covering them.
+
+    Elements are ordered by a z key: by default the insertion order, or an
+    explicit key such as UIManager's tree keys, which follow the draw order.
+    Elements drawn later are on top and are returned first.
+
+    Attributes:
+        cell_size (int): Edge length of a grid cell in pixels.
+    """
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        """
+        Args:
+            cell_size (int): Edge length of a grid cell in pixels.
+        """
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, List[Any]] = {}
+        # Per element: its rect copy, the cells it occupies and its z order
+        self._entries: Dict[int, Tuple[pygame.Rect, List[Cell], Any]] = {}
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self._entries
+
+    def _cells_of(self, rect: pygame.Rect) -> List[Cell]:
+        """Grid cells overlapped by a rect (at least the cell of its corner)."""
+        size = self.cell_size
+        x0, y0 = rect.left // size, rect.top // size
+        x1 = max(rect.right - 1, rect.left) // size
+        y1 = max(rect.bottom - 1, rect.top) // size
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, item: Any, rect: pygame.Rect, order: Any = None) -> None:
+        """
+        Add an element, by default on top of all indexed elements.
+
+        Args:
+            item (Any): The element.
+            rect (pygame.Rect): Its screen rect.
+            order (Any, optional): Explicit z key, comparable with the keys
+                of the other elements; higher keys are on top.
+        """
+        if id(item) in self._entries:
+            self.remove(item)
+        if order is None:
+            self._counter += 1
+            order = self._counter
+        self._place(item, rect, order)
+
+    def _place(self, item: Any, rect: pygame.Rect, order: Any) -> None:
+        """Store an element in the cells of `rect` with the given z order."""
+        cells = self._cells_of(rect)
+        for cell in cells:
+            self._cells.setdefault(cell, []).append(item)
+        self._entries[id(item)] = (pygame.Rect(rect), cells, order)
+
+    def remove(self, item: Any) -> None:
+        """
+        Drop an element from the index; unknown elements are ignored.
+
+        Args:
+            item (Any): The element.
+        """
+        entry = self._entries.pop(id(item), None)
+        if entry is None:
+            return
+        for cell in entry[1]:
+            bucket = self._cells[cell]
+            bucket.remove(item)
+            if not bucket:
+                del self._cells[cell]
+
+    def update(self, item: Any, rect: pygame.Rect) -> None:
+        """
+        Re-index an element whose rect moved or resized, keeping its z order.
+
+        Args:
+            item (Any): The element.
+            rect (pygame.Rect): Its new screen rect.
+        """
+        entry = self._entries.get(id(item))
+        if entry is None or entry[0] == rect:
+            return
+        order = entry[2]
+        self.remove(item)
+        self._place(item, rect, order)
+
+    def clear(self) -> None:
+        """Remove all elements."""
+        self._cells.clear()
+        self._entries.clear()
+
+    def query_point(self, pos: Tuple[int, int]) -> List[Any]:
+        """
+        Return the elements whose rect contains a point, topmost first.
+
+        Args:
+            pos (Tuple[int, int]): Screen coordinates.
+
+        Returns:
+            List[Any]: Hit elements ordered from top to bottom.
+        """
+        bucket = self._cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if not bucket:
+            return []
+        entries = self._entries
+        hits = [item for item in bucket if entries[id(item)][0].collidepoint(pos)]
+        hits.sort(key=lambda item: entries[id(item)][2], reverse=True)
+        return hits
+
+    def topmost(self, pos: Tuple[int, int]) -> Any:
+        """
+        Return the topmost element containing a point.
+
+        Args:
+            pos (Tuple[int, int]): Screen coordinates.
+
+        Returns:
+            Any: The element, or None if nothing is hit.
+        """
+        hits = self.query_point(pos)
+        return hits[0] if hits else None
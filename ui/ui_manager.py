@@ -4,115 +4,310 @@ Module ui/ui_manager.py
 Implements UIManager for managing UI elements and focus navigation throughout the application.
 Handles adding, removing, event dispatching, updates, rendering of UIElement instances,
 and keyboard focus traversal among focusable elements.
+
+Pointer events are routed through a SpatialIndex to the topmost element under
+the pointer, and keyboard events only to the focused element, so routing cost
+does not grow with the number of elements. Hover state follows pointer motion:
+only the elements the pointer leaves and enters are notified. Per-frame
+update() reaches only elements flagged as animating.
+
+Managed elements are roots of UI trees (see UIContainer). Adding a root
+registers the leaves of its visible subtree for hit-testing, keyboard focus
+and updates; containers keep that registration in sync when children are
+added, removed, hidden or disabled, touching only the affected subtree.
+
+Given a background colour, draw() composites retained: the UI is kept in a
+back buffer and only areas invalidated by mark_dirty() are repainted; every
+other frame costs a single blit.
 """
 
 import logging
 import pygame
+from themes.theme_manager import get_theme_version
 from ui.components.base import UIElement
+from ui.components.container import UIContainer
+from ui.focus_ring import FocusRing
+from ui.spatial_index import SpatialIndex
 
 logger = logging.getLogger(__name__)
 
+# Events delivered only to the focused element
+KEYBOARD_EVENTS = frozenset((pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT))
+
 
 class UIManager:
     """
     Central manager for UIElement instances and keyboard focus.
 
     Responsibilities:
-    - Maintain a list of active UI elements
+    - Maintain the root elements of the UI trees
     - Dispatch input events (mouse, keyboard) to elements
     - Navigate focus among focusable elements via Tab, arrows, and activation keys
-    - Update element states each frame
-    - Draw elements onto the rendering surface
+    - Track the hovered element from pointer motion
+    - Update animating elements each frame
+    - Draw elements onto the rendering surface, repainting only dirty areas
     """
     def __init__(self, event_manager) -> None:
         """
         Initialize the UIManager with an empty element registry and no focus.
         """
         self.event_manager = event_manager
+        # Roots of the managed UI trees, in drawing order
         self.elements: list[UIElement] = []
-        # Index of currently focused element in focusable list, -1 if none
-        self.focus_index = -1
+        self._next_order = 0
+        # Tab order of focusable elements, including ones nested in containers
+        self.focus_ring = FocusRing()
+        # Element receiving keyboard events, whether focused by key or click
+        self.focused_element: UIElement | None = None
+        # Hit-test grid over leaf element rects; objects that are not
+        # UIElements cannot report moves and get every pointer event
+        self.spatial_index = SpatialIndex()
+        self._unindexed: list = []
+        # Innermost element under the pointer and the last pointer position
+        self.hovered_element: UIElement | None = None
+        self._pointer: tuple[int, int] | None = None
+        # Elements that need update() every frame, keyed by id
+        self._animating: dict[int, UIElement] = {}
+        # Retained compositing: back buffer, the state it was painted with,
+        # and the areas and elements invalidated since
+        self._buffer: pygame.Surface | None = None
+        self._buffer_state: tuple | None = None
+        self._dirty_rects: list[pygame.Rect] = []
+        self._dirty_elements: list[UIElement] = []
         logger.debug("UIManager initialized with no elements.")
 
     def add(self, element: UIElement) -> None:
         """
-        Register a UI element for management.
+        Register a UI element, or the root of a UI tree, for management.
 
         Args:
             element (UIElement): The UI component to add.
         """
-        if hasattr(element, "event_manager"):
-            element.event_manager = self.event_manager
         self.elements.append(element)
+        if isinstance(element, UIElement):
+            element.manager = self
+            element.tree_order = self._next_order
+            self._next_order += 1
+            self.attach_subtree(element)
+            element.mark_dirty()
+        else:
+            if hasattr(element, "event_manager"):
+                element.event_manager = self.event_manager
+            self._unindexed.append(element)
+            if getattr(element, "animating", False):
+                self._animating[id(element)] = element
         logger.debug("Added UI element: %s", element)
 
     def remove(self, element: UIElement) -> None:
         """
-        Unregister a UI element if present.
+        Unregister a UI element if present; elements nested in a container
+        are removed from it.
 
         Args:
             element (UIElement): The UI component to remove.
         """
-        try:
-            self.elements.remove(element)
-            logger.debug("Removed UI element: %s", element)
-        except ValueError:
-            logger.warning("Attempted to remove non-existent UI element: %s", element)
+        if element not in self.elements:
+            parent = getattr(element, "parent", None)
+            if isinstance(parent, UIContainer) and element.ui_manager is self:
+                parent.remove(element)
+                logger.debug("Removed nested UI element: %s", element)
+            else:
+                logger.warning("Attempted to remove non-existent UI element: %s", element)
+            return
+        self.elements.remove(element)
+        logger.debug("Removed UI element: %s", element)
+        if isinstance(element, UIElement):
+            self._dirty_rects.append(element.draw_bounds())
+            self.detach_subtree(element)
+            element.manager = None
+        else:
+            self._unindexed.remove(element)
+            self._animating.pop(id(element), None)
+
+    def attach_subtree(self, element: UIElement) -> None:
+        """
+        Register the elements of a subtree for hit-testing, focus and updates.
+
+        Called when a subtree joins a managed tree or is shown or enabled
+        again. Hidden parts are skipped; disabled parts are only updated.
+        Elements are keyed by their tree position, so hit-testing and Tab
+        order follow the draw order regardless of when they were attached.
+
+        Args:
+            element (UIElement): Root of the subtree.
+        """
+        interactive = True
+        ancestor = element.parent
+        while ancestor is not None:
+            if not ancestor.visible:
+                return
+            interactive = interactive and ancestor.enabled
+            ancestor = ancestor.parent
+        self._attach(element, interactive, element.tree_key())
+
+    def _attach(self, element: UIElement, interactive: bool, key: tuple) -> None:
+        """
+        Register a visible subtree; `interactive` is False below a disabled
+        element and `key` is the element's tree_key().
+        """
+        if not element.visible:
+            return
+        if hasattr(element, "event_manager"):
+            element.event_manager = self.event_manager
+        if element.animating:
+            self._animating[id(element)] = element
+        interactive = interactive and element.enabled
+        if not element.children:
+            # Leaves receive pointer input; containers route nothing themselves
+            if interactive:
+                element.spatial_index = self.spatial_index
+                self.spatial_index.insert(element, element.rect, key)
+                for i, focusable in enumerate(element.iter_focusables()):
+                    self.focus_ring.add(focusable, key + (i,))
+            return
+        for child in element.children:
+            self._attach(child, interactive, key + (child.tree_order,))
+
+    def detach_subtree(self, element: UIElement, keep_updates: bool = False) -> None:
+        """
+        Unregister the elements of a subtree, e.g. when it is removed or hidden.
+
+        Args:
+            element (UIElement): Root of the subtree.
+            keep_updates (bool, optional): Keep animating elements updated,
+                for subtrees that are only disabled. Defaults to False.
+        """
+        for node in element.walk():
+            if node.spatial_index is not None:
+                self.spatial_index.remove(node)
+                node.spatial_index = None
+            if not keep_updates:
+                self._animating.pop(id(node), None)
+            if not node.children:
+                for focusable in node.iter_focusables():
+                    self.focus_ring.remove(focusable)
+                    if focusable is self.focused_element:
+                        self.clear_focus()
+        if self.hovered_element is not None:
+            # Re-resolve hover; the pointer may have been over the subtree
+            self.pointer_moved(self._pointer)
 
     def clear(self) -> None:
         """
         Remove all UI elements from the manager and clear focus.
         """
-        self.elements.clear()
         self.clear_focus()
+        if self.hovered_element is not None:
+            self.hovered_element.set_hovered(False)
+            self.hovered_element = None
+        for element in self.elements:
+            if isinstance(element, UIElement):
+                element.manager = None
+                for node in element.walk():
+                    node.spatial_index = None
+        self.elements.clear()
+        self._buffer_state = None
+        self._dirty_rects.clear()
+        self._clean()
+        self.spatial_index.clear()
+        self._unindexed.clear()
+        self._animating.clear()
+        self.focus_ring.clear()
         logger.debug("Cleared all UI elements and focus.")
 
+    def set_animating(self, element: UIElement, animating: bool) -> None:
+        """
+        Start or stop per-frame updates of a managed element.
+
+        Args:
+            element (UIElement): The element.
+            animating (bool): True to call its update() every frame.
+        """
+        element.animating = animating
+        if animating:
+            self._animating[id(element)] = element
+        else:
+            self._animating.pop(id(element), None)
+
+    def pointer_moved(self, pos: tuple[int, int] | None) -> None:
+        """
+        Update hover state for a new pointer position.
+
+        Only the element the pointer left and the one it entered are
+        notified; nothing happens while it stays over the same element.
+
+        Args:
+            pos (tuple[int, int] | None): Pointer position, or None when the
+                pointer left the window.
+        """
+        self._pointer = pos
+        target = None
+        if pos is not None:
+            top = self.spatial_index.topmost(pos)
+            if top is not None:
+                target = top.element_at(pos)
+        if target is self.hovered_element:
+            return
+        if self.hovered_element is not None:
+            self.hovered_element.set_hovered(False)
+        if target is not None:
+            target.set_hovered(True)
+        self.hovered_element = target
+
+    def focus(self, element: UIElement | None) -> None:
+        """
+        Give keyboard focus to an element, removing it from the previous one.
+
+        Args:
+            element (UIElement | None): The element to focus, or None.
+        """
+        if element is self.focused_element:
+            return
+        if self.focused_element is not None:
+            self.focused_element.set_focus(False)
+        self.focused_element = element
+        if element is not None:
+            element.set_focus(True)
+
     def focus_next(self) -> None:
         """
         Move keyboard focus to the next focusable element.
         Cycles through elements with attribute `focusable = True`.
         """
-        focusables = [e for e in self.elements if getattr(e, "focusable", False)]
-        if not focusables:
-            return
-        # Unfocus current
-        if 0 <= self.focus_index < len(focusables):
-            focusables[self.focus_index].set_focus(False)
-        # Advance index cyclically
-        self.focus_index = (self.focus_index + 1) % len(focusables)
-        focusables[self.focus_index].set_focus(True)
+        if self.focus_ring:
+            self.focus(self.focus_ring.next_of(self.focused_element))
 
     def focus_prev(self) -> None:
         """
         Move keyboard focus to the previous focusable element.
         Cycles backwards through focusable elements.
         """
-        focusables = [e for e in self.elements if getattr(e, "focusable", False)]
-        if not focusables:
-            return
-        # Unfocus current
-        if 0 <= self.focus_index < len(focusables):
-            focusables[self.focus_index].set_focus(False)
-        # Decrement index cyclically
-        self.focus_index = (self.focus_index - 1) % len(focusables)
-        focusables[self.focus_index].set_focus(True)
+        if self.focus_ring:
+            self.focus(self.focus_ring.prev_of(self.focused_element))
 
     def activate_focused(self) -> None:
         """
         Activate the currently focused element (e.g., invoke button press).
         """
-        focusables = [e for e in self.elements if getattr(e, "focusable", False)]
-        if 0 <= self.focus_index < len(focusables):
-            focusables[self.focus_index].activate()
+        if self.focused_element is not None:
+            self.focused_element.activate()
 
     def clear_focus(self) -> None:
         """
-        Remove focus from any focused element and reset focus index.
+        Remove focus from the focused element, if any.
         """
-        focusables = [e for e in self.elements if getattr(e, "focusable", False)]
-        if 0 <= self.focus_index < len(focusables):
-            focusables[self.focus_index].set_focus(False)
-        self.focus_index = -1
+        self.focus(None)
+
+    def adopt_focus(self, previous: "UIManager") -> None:
+        """
+        Restore the focus of a UI this one replaces, matched by focus_id.
+
+        Args:
+            previous (UIManager): The UI that was shown before a rebuild.
+        """
+        focus_id = getattr(previous.focused_element, "focus_id", None)
+        if focus_id is not None:
+            self.focus(self.focus_ring.find(focus_id))
 
     def handle_event(self, event: object) -> None:
         """
@@ -121,6 +316,9 @@ class UIManager:
         - ESC clears focus
         - Tab/Shift+Tab and arrow keys navigate focus
         - Enter/Space activates focused element
+        - Mouse events go to the topmost element under the pointer; a click
+          elsewhere removes focus from the focused element
+        - Other keyboard events go to the focused element only
 
         Args:
             event: Event object (e.g., pygame.event.Event) to dispatch.
@@ -146,38 +344,157 @@ class UIManager:
                 self.activate_focused()
                 return
 
-        # Dispatch event to all elements
+        event_type = getattr(event, "type", None)
+        pos = getattr(event, "pos", None)
+        if event_type == pygame.WINDOWLEAVE:
+            self.pointer_moved(None)
+        if pos is not None:
+            if event_type == pygame.MOUSEMOTION:
+                self.pointer_moved(pos)
+            target = self.spatial_index.topmost(pos)
+            clicked = None
+            if event_type == pygame.MOUSEBUTTONDOWN:
+                clicked = target.element_at(pos) if target is not None else None
+                if clicked is not self.focused_element:
+                    self.clear_focus()
+            targets = list(self._unindexed)
+            if target is not None:
+                targets.append(target)
+            for element in targets:
+                self._dispatch(element, event)
+            # Track an element that focused itself on click (e.g. a text input)
+            if clicked is not None and clicked.focused:
+                self.focused_element = clicked
+            return
+        if event_type in KEYBOARD_EVENTS:
+            if self.focused_element is not None:
+                self._dispatch(self.focused_element, event)
+            return
+
+        # Dispatch other events to all elements
         for element in list(self.elements):
-            if hasattr(element, "handle_event"):
-                try:
-                    element.handle_event(event)
-                except Exception as e:
-                    logger.exception("Error in handle_event of %s: %s", element, e)
+            self._dispatch(element, event)
 
-    def update(self, mouse_pos: tuple[int, int]) -> None:
+    def _dispatch(self, element: object, event: object) -> None:
+        """Deliver an event to one element, logging its errors."""
+        if hasattr(element, "handle_event"):
+            try:
+                element.handle_event(event)
+            except Exception as e:
+                logger.exception("Error in handle_event of %s: %s", element, e)
+
+
+    def update(self, mouse_pos: tuple[int, int] | None = None) -> None:
         """
-        Update UI elements each frame, typically for hover and focus visuals.
+        Update animating UI elements each frame (e.g. a blinking cursor).
+
+        Hover is not refreshed here; it follows pointer motion events.
 
         Args:
-            mouse_pos (tuple[int, int]): Current mouse position coordinates.
+            mouse_pos (tuple[int, int], optional): Mouse position passed on to
+                the elements; defaults to the last pointer position seen.
         """
-        for element in list(self.elements):
+        if not self._animating:
+            return
+        if mouse_pos is None:
+            mouse_pos = self._pointer or (-1, -1)
+        for element in list(self._animating.values()):
             if hasattr(element, "update"):
                 try:
                     element.update(mouse_pos)
                 except Exception as e:
                     logger.exception("Error in update of %s: %s", element, e)
 
-    def draw(self, surface: object) -> None:
+    def invalidate(self, element: UIElement, previous: pygame.Rect | None) -> None:
+        """
+        Record the areas to repaint for a changed element (see mark_dirty()).
+
+        Args:
+            element (UIElement): The changed element, possibly nested.
+            previous (pygame.Rect | None): Area it painted before moving.
+        """
+        self._dirty_rects.append(element.draw_bounds())
+        if previous is not None:
+            self._dirty_rects.append(previous)
+        self._dirty_elements.append(element)
+
+    def draw(self, surface: object, background: tuple | None = None) -> None:
         """
         Draw all managed UI elements onto the specified surface.
 
+        Without a background the elements are drawn directly, e.g. over a
+        translucent overlay. With one, the UI is composited from the back
+        buffer: it is fully repainted only on the first frame, a resize or a
+        theme or background change, otherwise just in the dirty areas.
+
         Args:
             surface: Rendering target (e.g., pygame.Surface).
+            background (tuple, optional): Colour the UI is painted on.
         """
+        if background is None:
+            self._draw_elements(surface, None)
+            self._dirty_rects.clear()
+            self._clean()
+            return
+
+        size = surface.get_size()
+        state = (size, tuple(background), get_theme_version())
+        if self._buffer is None or self._buffer.get_size() != size:
+            self._buffer = pygame.Surface(size)
+        if state != self._buffer_state:
+            self._buffer_state = state
+            self._buffer.set_clip(None)
+            self._buffer.fill(background)
+            self._draw_elements(self._buffer, None)
+            for element in self.elements:
+                if isinstance(element, UIElement):
+                    element.mark_clean()
+        else:
+            # Objects that are not UIElements cannot report changes; repaint them each frame
+            for element in self._unindexed:
+                self._dirty_rects.append(element.rect.inflate(8, 8))
+            for region in self._merge(self._dirty_rects):
+                self._buffer.set_clip(region)
+                self._buffer.fill(background)
+                self._draw_elements(self._buffer, region)
+            self._buffer.set_clip(None)
+        self._dirty_rects.clear()
+        self._clean()
+        surface.blit(self._buffer, (0, 0))
+
+    def _draw_elements(self, surface: pygame.Surface, region: pygame.Rect | None) -> None:
+        """Draw the elements intersecting `region` (all if None) in order."""
         for element in list(self.elements):
-            if hasattr(element, "draw"):
-                try:
-                    element.draw(surface)
-                except Exception as e:
-                    logger.exception("Error in draw of %s: %s", element, e)
+            if not hasattr(element, "draw"):
+                continue
+            if isinstance(element, UIElement) and (not element.visible or (
+                    region is not None and not element.draw_bounds().colliderect(region))):
+                continue
+            try:
+                element.draw(surface)
+            except Exception as e:
+                logger.exception("Error in draw of %s: %s", element, e)
+
+    def _clean(self) -> None:
+        """Clear the dirty flags of drawn elements and their containers."""
+        for element in self._dirty_elements:
+            while element is not None and element.dirty:
+                element.dirty = False
+                element = element.parent
+        self._dirty_elements.clear()
+
+    @staticmethod
+    def _merge(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Union overlapping rects so no area is repainted twice."""
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            i = 0
+            while i < len(merged):
+                if merged[i].colliderect(rect):
+                    rect.union_ip(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+        return merged